@@ -0,0 +1,248 @@
+"""
+Benchmark harness that times callables against generated inputs.
+
+Most timing code in this repository builds strings for timeit.repeat(),
+which means every repetition re-imports modules and regenerates its input.
+This module times Python callables directly. Inputs are produced by a
+generator function that is invoked once for each distinct set of arguments
+and then cached, so repetitions (and competing algorithms within the same
+row of a table) all operate on identical data.
+
+    :Example:
+
+    >>> from algs.bench import bench
+    >>> from ch01.largest_two import largest_two
+    >>> def shuffled(n):
+    ...     import random
+    ...     random.seed(n)
+    ...     x = list(range(n))
+    ...     random.shuffle(x)
+    ...     return x
+    >>> t = bench(largest_two, shuffled, (1024,), repeat=5)
+    >>> t.min <= t.median
+    True
+
+When the callable modifies its input, pass prepare=list (or some other
+copying function) so each repetition starts from a fresh copy of the cached
+input; the cost of prepare() is not included in the timing.
+
+Use bench_table() to feed results for a sequence of problem sizes straight
+into a DataTable.
+
+Many structures trade memory for speed, so measure_memory() reports the peak
+and retained memory (in bytes, as traced by tracemalloc) of a single call,
+and bench_table(memory=True) adds these measurements after each timing column.
+Memory is measured in a separate, untimed, invocation since tracing
+allocations slows execution considerably.
+"""
+import gc
+import math
+import timeit
+import tracemalloc
+
+from algs.table import SKIP
+
+class InputCache:
+    """
+    Cache of inputs produced by generator functions, keyed by the
+    generator and the arguments passed to it.
+    """
+    def __init__(self):
+        self.inputs = {}
+
+    def get(self, generator, *args):
+        """Return generator(*args), computing it only on first request."""
+        key = (generator, args)
+        if not key in self.inputs:
+            self.inputs[key] = generator(*args)
+        return self.inputs[key]
+
+    def discard(self, generator, *args):
+        """Discard cached input for generator(*args), if present."""
+        self.inputs.pop((generator, args), None)
+
+    def clear(self):
+        """Discard all cached inputs."""
+        self.inputs.clear()
+
+    def __len__(self):
+        return len(self.inputs)
+
+# Shared cache used when no explicit cache is provided.
+input_cache = InputCache()
+
+class Timing:
+    """
+    Results of a benchmark: the time (in seconds) of each repetition,
+    already divided by the number of executions per repetition.
+    """
+    def __init__(self, times):
+        if not times:
+            raise ValueError('Timing requires at least one repetition')
+        self.times = sorted(times)
+
+    @property
+    def min(self):
+        """Smallest recorded time, the most reliable estimate of cost."""
+        return self.times[0]
+
+    @property
+    def median(self):
+        """Median recorded time."""
+        num = len(self.times)
+        mid = num // 2
+        if num % 2 == 1:
+            return self.times[mid]
+        return (self.times[mid-1] + self.times[mid]) / 2
+
+    @property
+    def stddev(self):
+        """Sample standard deviation of recorded times (0 for a single repetition)."""
+        num = len(self.times)
+        if num < 2:
+            return 0.0
+        mean = sum(self.times) / num
+        return math.sqrt(sum((t - mean) ** 2 for t in self.times) / (num - 1))
+
+    def stat(self, name):
+        """Return the named statistic, one of 'min', 'median' or 'stddev'."""
+        if name not in ('min', 'median', 'stddev'):
+            raise ValueError('unknown statistic:{}'.format(name))
+        return getattr(self, name)
+
+    def __str__(self):
+        return 'min={:.6f} median={:.6f} stddev={:.6f}'.format(self.min, self.median, self.stddev)
+
+def bench(func, generator=None, args=(), repeat=5, number=1, prepare=None, cache=None):
+    """
+    Time func(data) where data = generator(*args), returning a Timing.
+
+    The generator is invoked at most once per (generator, args) pair, since its
+    result is kept in cache (defaults to the shared input_cache). If generator
+    is None then func() is invoked with no arguments. If prepare is provided,
+    func(prepare(data)) is invoked instead, and prepare is called (untimed)
+    once before each repetition. Like timeit, garbage collection is disabled
+    while timing, and state is shared among the number executions within a
+    single repetition.
+    """
+    if cache is None:
+        cache = input_cache
+    data = None
+    if generator:
+        data = cache.get(generator, *args)
+
+    timer = timeit.default_timer
+    times = []
+    gc_enabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            arg = None
+            if generator:
+                arg = prepare(data) if prepare else data
+            gc.disable()
+            start = timer()
+            if generator:
+                for _ in range(number):
+                    func(arg)
+            else:
+                for _ in range(number):
+                    func()
+            times.append((timer() - start) / number)
+            if gc_enabled:
+                gc.enable()
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return Timing(times)
+
+class Memory:
+    """
+    Memory used by a single call: peak is the largest amount allocated while
+    it executed, and retained is the amount still allocated once it returned
+    (which includes its result). Both are in bytes.
+    """
+    def __init__(self, peak, retained):
+        self.peak = peak
+        self.retained = retained
+
+    def __str__(self):
+        return 'peak={:,} retained={:,}'.format(self.peak, self.retained)
+
+def measure_memory(func, generator=None, args=(), prepare=None, cache=None):
+    """
+    Return Memory used by func(data) where data = generator(*args), with
+    generator, prepare and cache used as in bench(). Allocations made by the
+    generator or prepare are excluded.
+    """
+    if cache is None:
+        cache = input_cache
+    arg = None
+    if generator:
+        data = cache.get(generator, *args)
+        arg = prepare(data) if prepare else data
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        if hasattr(tracemalloc, 'reset_peak'):      # Python 3.9 and higher
+            tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        result = func(arg) if generator else func()
+        (current, peak) = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return Memory(peak - base, current - base)
+
+def bench_table(tbl, sizes, funcs, generator, repeat=5, number=1, prepare=None,
+                stat='min', scale=1, cache=None, keep=False, memory=False, samples=None):
+    """
+    Add one row to DataTable tbl for each n in sizes, timing each func in
+    funcs on generator(n). Columns are filled in the order of funcs, which
+    should match tbl.labels[1:]. A func of None produces SKIP for that cell.
+
+    Each recorded value is Timing.stat(stat) multiplied by scale; scale can
+    also be a function of n to normalize timings, such as lambda n: 1000/n.
+    Once a row is complete its input is evicted from the cache, unless keep
+    is True, so large sweeps do not hold every input in memory.
+
+    When memory is True, each timing is followed by two additional columns
+    containing peak and retained memory (in KB), so tbl.labels must contain
+    three columns for each func; memory_labels() constructs these.
+
+    When samples is a dictionary, samples[(label, n)] is set to the (scaled)
+    times of every repetition, for use with algs.regression.record_run().
+    Returns tbl.
+    """
+    if cache is None:
+        cache = input_cache
+    for n in sizes:
+        factor = scale(n) if callable(scale) else scale
+        row = [n]
+        for func in funcs:
+            if func is None:
+                row.extend([SKIP] * (3 if memory else 1))
+                continue
+
+            timing = bench(func, generator, (n,), repeat=repeat, number=number,
+                           prepare=prepare, cache=cache)
+            if samples is not None:
+                samples[(tbl.labels[len(row)], n)] = [factor * t for t in timing.times]
+            row.append(factor * timing.stat(stat))
+            if memory:
+                used = measure_memory(func, generator, (n,), prepare=prepare, cache=cache)
+                row.extend([used.peak / 1024, used.retained / 1024])
+        tbl.row(row)
+        if not keep:
+            cache.discard(generator, n)
+    return tbl
+
+def memory_labels(names):
+    """Return labels for bench_table(memory=True): each name, then its peak and retained memory."""
+    labels = []
+    for name in names:
+        labels.extend([name, '{}Peak'.format(name), '{}Kept'.format(name)])
+    return labels
@@ -0,0 +1,93 @@
+"""
+Persistent on-disk cache of DataTable rows, so re-running a table only
+computes those rows whose results are not already known.
+
+Caching is disabled unless the ALGS_TABLE_CACHE environment variable names
+the directory in which cached rows are stored:
+
+    ALGS_TABLE_CACHE=.table_cache python3 book.py
+
+Cached rows are keyed by the source code of the functions (or modules) being
+measured, any additional parameters of the trial, and the Python version.
+Change any of these and the cached rows are ignored, and recomputed.
+
+    :Example:
+
+    >>> cache = row_cache('ch05.timing_nlogn_sorting', [ch05.merge], (10,))
+    >>> tbl = DataTable([8, 8], ['N', 'MergeSort'], cache=cache)
+    >>> for n in [256, 512, 1024]:
+    ...     row = tbl.cached_row(n)
+    ...     if row is None:
+    ...         row = [n, time_merge_sort(n)]
+    ...     tbl.row(row)
+
+When caching is disabled, row_cache() returns None and cached_row() always
+returns None, so the same code computes every row.
+"""
+import hashlib
+import inspect
+import json
+import os
+import sys
+
+CACHE_ENV = 'ALGS_TABLE_CACHE'
+
+def source_hash(sources, params=()):
+    """
+    Return hex digest of the source code for each object in sources (functions,
+    classes or modules) together with params and the Python version.
+    """
+    digest = hashlib.sha256()
+    for src in sources:
+        try:
+            text = inspect.getsource(src)
+        except (OSError, TypeError):
+            text = repr(src)        # built-in objects have no source
+        digest.update(text.encode('utf-8'))
+    digest.update(repr(tuple(params)).encode('utf-8'))
+    digest.update(sys.version.encode('utf-8'))
+    return digest.hexdigest()
+
+class RowCache:
+    """
+    Rows of a table stored in a JSON file, keyed by the row label (the value
+    in its first column). Every stored row is written to disk immediately.
+    """
+    def __init__(self, name, sources, params=(), directory='.table_cache'):
+        self.file = os.path.join(directory, '{}-{}.json'.format(name, source_hash(sources, params)[:16]))
+        self.rows = {}
+        if os.path.exists(self.file):
+            with open(self.file, 'r') as file:
+                self.rows = json.load(file)
+
+    def lookup(self, label):
+        """Return cached row whose first column is label, or None if not cached."""
+        return self.rows.get(json.dumps(label))
+
+    def store(self, row):
+        """Store row, keyed by its first column, and persist to disk."""
+        key = json.dumps(row[0])
+        if self.rows.get(key) == list(row):
+            return
+        self.rows[key] = list(row)
+
+        directory = os.path.dirname(self.file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = self.file + '.tmp'
+        with open(tmp, 'w') as file:
+            json.dump(self.rows, file)
+        os.replace(tmp, self.file)
+
+    def __len__(self):
+        return len(self.rows)
+
+def row_cache(name, sources, params=()):
+    """
+    Return RowCache for table name if caching has been enabled via the
+    ALGS_TABLE_CACHE environment variable; otherwise return None.
+    """
+    directory = os.environ.get(CACHE_ENV)
+    if not directory:
+        return None
+    return RowCache(name, sources, params, directory)
@@ -11,17 +11,21 @@ be detected by the code that imports this file as follows:
         here is code that needs numpy or scipy
 
 """
+import importlib.util
 import math
 
+# Determine whether numpy and scipy are available without importing them, since
+# importing them takes far longer than anything else in this package. They are
+# only imported (within functions) the first time they are actually needed.
 numpy_error = []
-try:
-    import numpy as np
-    from scipy.optimize import curve_fit
-    from scipy.stats.stats import pearsonr
-    from scipy.special import factorial
+if importlib.util.find_spec('numpy') is None or importlib.util.find_spec('scipy') is None:
+    print('trying to continue without numpy or scipy')
+    numpy_error.append(1)
 
+if not numpy_error:
     def log_model(n, a):
         """Formula for A*Log_2(N) with single coefficient."""
+        import numpy as np
         return a*np.log2(n)
 
     def linear_model(n, a, b):
@@ -30,10 +34,12 @@ try:
 
     def n_log_n_model(n, a):
         """Formula for A*N*Log_2(N) with single coefficient."""
+        import numpy as np
         return a*n*np.log2(n)
 
     def log_linear_model(n, a, b):
         """Formula for A*N*Log_2(N) + B*N with two coefficients."""
+        import numpy as np
         return a*n*np.log2(n) + b*n
 
     def quadratic_model(n, a, b):
@@ -42,13 +48,10 @@ try:
 
     def factorial_model(n, a):
         """Models N! or N factorial."""
+        from scipy.special import factorial
         return a * factorial(n)
 
-except ImportError:
-    if numpy_error == []:
-        print('trying to continue without numpy or scipy')
-    numpy_error.append(1)
-
+else:
     def log_model(n, a):
         """Formula for A*Log_2(N) with single coefficient."""
         return a*math.log2(n)
@@ -89,6 +92,17 @@ class Model:
             return ['ERROR', 'LOG', 'LINEAR', 'N LOG N', 'LOG LINEAR', 'QUADRATIC'][tpe]
         raise ValueError('unknown Model type:{}'.format(tpe))
 
+# Basis functions for the models, since each model is linear in its coefficients.
+# For each model, the columns of the design matrix whose coefficients it fits.
+BASIS_LOG, BASIS_N, BASIS_ONE, BASIS_N_LOG_N, BASIS_N_SQUARED = range(5)
+MODEL_BASIS = [
+    (Model.LOG,        [BASIS_LOG]),
+    (Model.LINEAR,     [BASIS_N, BASIS_ONE]),
+    (Model.N_LOG_N,    [BASIS_N_LOG_N]),
+    (Model.LOG_LINEAR, [BASIS_N_LOG_N, BASIS_N]),
+    (Model.QUADRATIC,  [BASIS_N_SQUARED, BASIS_N]),
+]
+
 def best_models(nval, yval, preselected = None):
     """
     Given two 1-dimensional arrays, returns list of computed models, in
@@ -107,92 +121,68 @@ def best_models(nval, yval, preselected = None):
     if numpy_error:
         return [[(Model.ERROR,0,0,0,0)]]
 
-    npx = np.array(nval)
-    npy = np.array(yval)
+    return best_models_batch(nval, [yval], preselected)[0]
 
-    if preselected is Model.LOG or preselected is None:
-        [log_coeffs, _]        = curve_fit(log_model, npx, npy)
-    else:
-        log_coeffs = [-1]
+def best_models_batch(nval, yvals, preselected = None):
+    """
+    Given a 1-dimensional array of N values and a list of 1-dimensional
+    arrays of y values (one for each column of a table), return a list
+    containing, for each y array, the models computed by best_models().
+
+    Every model is linear in its coefficients, so the coefficients are
+    computed by a closed-form least-squares solution: one design matrix is
+    constructed for nval, and each model is solved for all y arrays at once.
+    The y arrays may be shorter than nval (towards the end of some tables, it
+    is too computationally expensive to reproduce), in which case all are
+    curtailed to the length of the shortest one.
+    """
+    if numpy_error:
+        return [[[(Model.ERROR,0,0,0,0)]] for _ in yvals]
 
-    if preselected is Model.LINEAR or preselected is None:
-        [linear_coeffs, _]     = curve_fit(linear_model, npx, npy)
-    else:
-        linear_coeffs = [-1]
+    import numpy as np
 
-    if preselected is Model.N_LOG_N or preselected is None:
-        [n_log_n_coeffs, _]    = curve_fit(n_log_n_model, npx, npy)
-    else:
-        n_log_n_coeffs = [-1]
+    num = min([len(nval)] + [len(y) for y in yvals])
+    npx = np.array(nval[:num], dtype=float)
+    npy = np.array([y[:num] for y in yvals], dtype=float).T     # one column per y array
 
-    if preselected is Model.LOG_LINEAR or preselected is None:
-        [log_linear_coeffs, _] = curve_fit(log_linear_model, npx, npy)
-    else:
-        log_linear_coeffs = [-1]
+    log_n = np.log2(npx)
+    design = np.column_stack([log_n, npx, np.ones(num), npx*log_n, npx*npx])
+    y_centered = npy - npy.mean(axis=0)
+    y_norm = np.sqrt(np.sum(y_centered*y_centered, axis=0))
 
-    if preselected is Model.QUADRATIC or preselected is None:
-        [quadratic_coeffs, _]  = curve_fit(quadratic_model, npx, npy)
-    else:
-        quadratic_coeffs = [-1]
-
-    m_log = []
-    m_linear = []
-    m_n_log_n = []
-    m_log_linear = []
-    m_quadratic = []
-
-    # Models have all their values, but y values must be curtailed because towards
-    # the end of some tables, it is too computationally expensive to reproduce.
-    num = min(len(yval), len(nval))
-    for i in range(num):
-        n = nval[i]
-        if log_coeffs[0] > 0:
-            m_log.append(log_model(n, log_coeffs[0]))
-        if linear_coeffs[0] > 0:
-            m_linear.append(linear_model(n, linear_coeffs[0], linear_coeffs[1]))
-        if n_log_n_coeffs[0] > 0:
-            m_n_log_n.append(n_log_n_model(n, n_log_n_coeffs[0]))
-        if log_linear_coeffs[0] > 0:
-            m_log_linear.append(log_linear_model(n, log_linear_coeffs[0], log_linear_coeffs[1]))
-        if quadratic_coeffs[0] > 0:
-            m_quadratic.append(quadratic_model(n, quadratic_coeffs[0], quadratic_coeffs[1]))
-
-    # If the lead coefficient is NEGATIVE then the model can be discounted
-
-    # compute square Root Mean Square error for all models.
-    # RMS error is the square Root of the Mean of the Sum
-    models = []
-    if m_log:
-        rms_log = np.sqrt(np.sum((pow((np.array(m_log)-npy),2)))/num)
-        models.append((Model.LOG,
-                       pearsonr(yval, m_log)[0], rms_log,
-                       log_coeffs[0]))
-    if m_linear:
-        rms_linear = np.sqrt(np.sum((pow((np.array(m_linear)-npy),2)))/num)
-        models.append((Model.LINEAR,
-                       pearsonr(yval, m_linear)[0], rms_linear,
-                       linear_coeffs[0], linear_coeffs[1]))
-    if m_n_log_n:
-        rms_n_log_n = np.sqrt(np.sum((pow((np.array(m_n_log_n)-npy),2)))/num)
-        models.append((Model.N_LOG_N,
-                       pearsonr(yval, m_n_log_n)[0], rms_n_log_n, n_log_n_coeffs[0]))
-    if m_log_linear:
-        rms_log_linear = np.sqrt(np.sum((pow((np.array(m_log_linear)-npy),2)))/num)
-        models.append((Model.LOG_LINEAR,
-                       pearsonr(yval, m_log_linear)[0], rms_log_linear,
-                       log_linear_coeffs[0], log_linear_coeffs[1]))
-    if m_quadratic:
-        rms_quadratic = np.sqrt(np.sum((pow((np.array(m_quadratic)-npy),2)))/num)
-        models.append((Model.QUADRATIC,
-                       pearsonr(yval, m_quadratic)[0], rms_quadratic,
-                       quadratic_coeffs[0], quadratic_coeffs[1]))
+    results = [[] for _ in yvals]
+    for tpe, basis in MODEL_BASIS:
+        if not (preselected is tpe or preselected is None):
+            continue
+
+        matrix = design[:, basis]
+        coeffs = np.linalg.lstsq(matrix, npy, rcond=None)[0]        # one column per y array
+        fitted = matrix @ coeffs
+
+        # compute square Root Mean Square error for all models.
+        # RMS error is the square Root of the Mean of the Sum
+        rms = np.sqrt(np.sum((fitted - npy)**2, axis=0)/num)
+
+        # Pearson correlation between actual and fitted values
+        f_centered = fitted - fitted.mean(axis=0)
+        f_norm = np.sqrt(np.sum(f_centered*f_centered, axis=0))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pearson = np.sum(y_centered*f_centered, axis=0) / (y_norm*f_norm)
+
+        # If the lead coefficient is NEGATIVE then the model can be discounted
+        for col, models in enumerate(results):
+            if coeffs[0, col] > 0:
+                models.append((tpe, float(pearson[col]), float(rms[col])) +
+                              tuple(float(c) for c in coeffs[:, col]))
 
     # sort in reverse order by Pearson, but receiving end should also check RMS
-    models.sort(key=lambda x:x[1], reverse=True)
-    return models
+    for models in results:
+        models.sort(key=lambda x:x[1], reverse=True)
+    return results
 
 def pearson_correlation(y_act, y_fit):
     """Return pearson correlation, if numpy is available, otherwise just 0.0."""
     if numpy_error:
         return 0.0
+    from scipy.stats import pearsonr
     return pearsonr(y_act, y_fit)
@@ -0,0 +1,215 @@
+"""
+Detect statistically significant slowdowns between runs of a timing table.
+
+Every run of a table can be stored in a history directory, one JSON file per
+run. The latest run is then compared against all earlier runs, cell by cell,
+for every (column, N). For each cell, a bootstrap confidence interval is
+computed for the ratio of the current mean to the baseline mean; when the
+entire interval lies above 1 + threshold, the cell is flagged as a slowdown.
+
+Runs are recorded only when the ALGS_HISTORY environment variable names the
+history directory:
+
+    ALGS_HISTORY=history python3 ch04/timing.py
+
+and then checked, for a given table, with
+
+    python3 algs/regression.py history ch04.dynamic_comparison
+
+which prints all slowdowns and exits with status 1 if there are any, so it
+can gate an upgrade of Python or of the modules being timed.
+
+A table only holds one value per cell (typically the smallest time), which
+says nothing about how much the times vary, so pass the times of every
+repetition (i.e., Timing.times from algs.bench) as the samples of each
+cell when recording a run; bench_table() collects these when given a
+samples dictionary. A cell is only compared when its samples come from at
+least MIN_BASELINE_RUNS earlier runs and the latest run has at least
+MIN_CURRENT_SAMPLES samples; otherwise it is reported as having
+insufficient data, since a confidence interval computed from a single
+sample on each side has zero width and would flag noise as a slowdown.
+"""
+import json
+import os
+import random
+import sys
+from datetime import datetime
+
+HISTORY_ENV = 'ALGS_HISTORY'
+MIN_BASELINE_RUNS = 3
+MIN_CURRENT_SAMPLES = 2
+
+class Regression:
+    """Slowdown detected for a (table, column, N) cell."""
+    def __init__(self, table, column, n, baseline, current, low, high):
+        self.table = table
+        self.column = column
+        self.n = n
+        self.baseline = baseline
+        self.current = current
+        self.low = low
+        self.high = high
+
+    @property
+    def ratio(self):
+        """Ratio of current mean to baseline mean."""
+        return self.current / self.baseline
+
+    def __str__(self):
+        return '{} {} N={}: {:.3f}x slower (95% CI {:.3f}-{:.3f})'.format(
+            self.table, self.column, self.n, self.ratio, self.low, self.high)
+
+def save_run(directory, name, tbl, samples=None):
+    """
+    Store labels and rows of DataTable tbl as a new run of table name in
+    directory. When samples maps (label, N) to the list of times of every
+    repetition, that list is stored for the cell instead of its value.
+    """
+    folder = os.path.join(directory, name)
+    os.makedirs(folder, exist_ok=True)
+    if samples is None:
+        samples = {}
+    rows = [[n] + [samples.get((label, n), tbl.entry(n, label)) for label in tbl.labels[1:]]
+            for n in tbl.column(tbl.labels[0])]
+    record = {
+        'table'     : name,
+        'timestamp' : datetime.now().isoformat(),
+        'python'    : sys.version,
+        'labels'    : tbl.labels,
+        'rows'      : rows,
+    }
+    path = os.path.join(folder, '{}.json'.format(datetime.now().strftime('%Y%m%d-%H%M%S-%f')))
+    with open(path, 'w') as file:
+        json.dump(record, file)
+    return path
+
+def record_run(name, tbl, samples=None):
+    """Store tbl (and samples) as a run of table name, if ALGS_HISTORY names a history directory."""
+    directory = os.environ.get(HISTORY_ENV)
+    if directory:
+        return save_run(directory, name, tbl, samples)
+    return None
+
+def load_runs(directory, name):
+    """Return all runs of table name stored in directory, from oldest to newest."""
+    folder = os.path.join(directory, name)
+    if not os.path.isdir(folder):
+        return []
+    runs = []
+    for file_name in sorted(os.listdir(folder)):
+        if file_name.endswith('.json'):
+            with open(os.path.join(folder, file_name)) as file:
+                runs.append(json.load(file))
+    return runs
+
+def samples(runs):
+    """
+    Return dictionary mapping (column, N) to list of numeric samples from runs.
+    Non-numeric values (such as SKIP) are ignored.
+    """
+    result = {}
+    for run in runs:
+        labels = run['labels']
+        for row in run['rows']:
+            for label, val in zip(labels[1:], row[1:]):
+                vals = val if isinstance(val, list) else [val]
+                for v in vals:
+                    if isinstance(v, (int, float)) and not isinstance(v, bool):
+                        result.setdefault((label, row[0]), []).append(v)
+    return result
+
+def run_counts(runs):
+    """Return dictionary mapping (column, N) to the number of runs with samples for it."""
+    counts = {}
+    for run in runs:
+        for key in samples([run]):
+            counts[key] = counts.get(key, 0) + 1
+    return counts
+
+def bootstrap_ratio(baseline, current, resamples=2000, confidence=0.95, rng=None):
+    """
+    Return (low, high) bootstrap confidence interval for the ratio of the mean
+    of current to the mean of baseline, resampling each with replacement.
+    Returns None when current has fewer than MIN_CURRENT_SAMPLES samples or
+    baseline has fewer than MIN_BASELINE_RUNS samples, since the interval
+    would be meaningless.
+    """
+    if len(current) < MIN_CURRENT_SAMPLES or len(baseline) < MIN_BASELINE_RUNS:
+        return None
+    if rng is None:
+        rng = random.Random(0)
+    ratios = []
+    for _ in range(resamples):
+        base = sum(rng.choice(baseline) for _ in baseline) / len(baseline)
+        curr = sum(rng.choice(current) for _ in current) / len(current)
+        if base > 0:
+            ratios.append(curr / base)
+    if not ratios:
+        return (float('nan'), float('nan'))
+    ratios.sort()
+    tail = (1 - confidence) / 2
+    low = ratios[int(tail * (len(ratios) - 1))]
+    high = ratios[int((1 - tail) * (len(ratios) - 1))]
+    return (low, high)
+
+def find_regressions(name, baseline_runs, current_runs, threshold=0.05,
+                     resamples=2000, confidence=0.95, seed=0, insufficient=None):
+    """
+    Compare current_runs of table name against baseline_runs and return list of
+    Regression for every (column, N) whose ratio of means has a bootstrap
+    confidence interval entirely above 1 + threshold. Cells whose baseline
+    comes from fewer than MIN_BASELINE_RUNS runs, or whose current samples
+    number fewer than MIN_CURRENT_SAMPLES, are not compared; their (column, N)
+    are appended to insufficient when it is a list.
+    """
+    rng = random.Random(seed)
+    base = samples(baseline_runs)
+    curr = samples(current_runs)
+    counts = run_counts(baseline_runs)
+
+    regressions = []
+    for key in curr:
+        interval = None
+        if counts.get(key, 0) >= MIN_BASELINE_RUNS:
+            interval = bootstrap_ratio(base[key], curr[key], resamples, confidence, rng)
+        if interval is None:
+            if insufficient is not None:
+                insufficient.append(key)
+            continue
+        (low, high) = interval
+        if low > 1 + threshold:
+            mean_base = sum(base[key]) / len(base[key])
+            mean_curr = sum(curr[key]) / len(curr[key])
+            regressions.append(Regression(name, key[0], key[1], mean_base, mean_curr, low, high))
+    return regressions
+
+def check_latest(directory, name, threshold=0.05, insufficient=None):
+    """
+    Compare the latest run of table name in directory against all earlier runs.
+    The (column, N) of cells without enough data to compare are appended to
+    insufficient when it is a list.
+    """
+    runs = load_runs(directory, name)
+    if not runs:
+        return []
+    return find_regressions(name, runs[:-1], runs[-1:], threshold, insufficient=insufficient)
+
+#######################################################################
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Flag slowdowns in latest run of a table.')
+    parser.add_argument('history', help='directory containing history of runs')
+    parser.add_argument('table', help='name of table, i.e., ch04.dynamic_comparison')
+    parser.add_argument('--threshold', type=float, default=0.05,
+                        help='smallest relative slowdown to report (default 0.05)')
+    args = parser.parse_args()
+
+    skipped = []
+    found = check_latest(args.history, args.table, args.threshold, skipped)
+    for regression in found:
+        print(regression)
+    for (column, n) in skipped:
+        print('{} {} N={}: insufficient data'.format(args.table, column, n))
+    if not found:
+        print('No significant slowdowns in', args.table)
+    sys.exit(1 if found else 0)
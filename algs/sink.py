@@ -0,0 +1,161 @@
+"""
+Sinks that stream the rows of a DataTable to a file as each row is produced.
+
+Each row is flushed as soon as it is written, so a lengthy run can be
+monitored while it executes, and a run that is interrupted still leaves
+behind every row completed so far.
+
+    :Example:
+
+    >>> from algs.table import DataTable
+    >>> from algs.sink import CSVSink
+    >>> tbl = DataTable([8, 8], ['N', 'SquareRoot'], sinks=[CSVSink('sqrt.csv')])
+    >>> for n in range(2,10):
+    ...    tbl.row([n, n ** 0.5])
+    >>> tbl.close()
+
+Three formats are supported:
+
+  * CSVSink - comma-separated values, with labels in the first line
+  * JSONLSink - one JSON list per line, with labels in the first line
+  * BinarySink - compact binary records, which read_binary() decodes
+
+Use open_sink(path) to select a sink from the file extension.
+"""
+import csv
+import json
+import struct
+
+# Binary format: MAGIC, then number of labels and each label as a string.
+# Every record is the number of cells followed by each cell as a one-byte
+# tag and its payload. Integers outside 64-bit range are stored as strings.
+MAGIC = b'DTBL\x01'
+TAG_INT = b'i'
+TAG_FLOAT = b'f'
+TAG_STR = b's'
+
+class Sink:
+    """
+    Base class for sinks that write rows to an open file. Each sink offers
+    header(labels) to write the labels for the columns, and write(row) to
+    write a single row and flush it.
+    """
+    def __init__(self, path, mode='w', newline=None):
+        self.path = path
+        self.file = open(path, mode, newline=newline)
+
+    def close(self):
+        """Close the underlying file."""
+        if not self.file.closed:
+            self.file.close()
+
+class CSVSink(Sink):
+    """Stream rows as comma-separated values."""
+    def __init__(self, path):
+        super().__init__(path, 'w', newline='')     # csv.writer ends each line itself
+        self.writer = csv.writer(self.file)
+
+    def header(self, labels):
+        self.writer.writerow(labels)
+        self.file.flush()
+
+    def write(self, row):
+        self.writer.writerow(row)
+        self.file.flush()
+
+class JSONLSink(Sink):
+    """Stream rows as JSON Lines, each row a JSON list."""
+    def header(self, labels):
+        self.write(labels)
+
+    def write(self, row):
+        self.file.write(json.dumps(list(row)))
+        self.file.write('\n')
+        self.file.flush()
+
+class BinarySink(Sink):
+    """Stream rows as compact binary records; decode with read_binary()."""
+    def __init__(self, path):
+        super().__init__(path, 'wb')
+        self.file.write(MAGIC)
+
+    def header(self, labels):
+        self.file.write(struct.pack('<H', len(labels)))
+        for label in labels:
+            _write_str(self.file, str(label))
+        self.file.flush()
+
+    def write(self, row):
+        self.file.write(struct.pack('<H', len(row)))
+        for val in row:
+            if isinstance(val, int) and -2**63 <= val < 2**63:
+                self.file.write(TAG_INT + struct.pack('<q', val))
+            elif isinstance(val, float):
+                self.file.write(TAG_FLOAT + struct.pack('<d', val))
+            else:
+                self.file.write(TAG_STR)
+                _write_str(self.file, str(val))
+        self.file.flush()
+
+def _write_str(file, s):
+    """Write string s as its length followed by its UTF-8 bytes."""
+    data = s.encode('utf-8')
+    file.write(struct.pack('<I', len(data)))
+    file.write(data)
+
+def _read_exactly(file, num):
+    """Read num bytes from file, raising EOFError if fewer remain."""
+    data = file.read(num)
+    if len(data) < num:
+        raise EOFError('truncated record')
+    return data
+
+def _read_str(file):
+    """Read string written by _write_str()."""
+    (num,) = struct.unpack('<I', _read_exactly(file, 4))
+    return _read_exactly(file, num).decode('utf-8')
+
+def read_binary(path):
+    """
+    Return (labels, rows) from file written by BinarySink. A final record
+    that was only partially written (because the run was interrupted) is
+    ignored. Integers that were too large for 64 bits are returned as strings.
+    """
+    rows = []
+    with open(path, 'rb') as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError('{} is not a binary DataTable file'.format(path))
+        (num,) = struct.unpack('<H', _read_exactly(file, 2))
+        labels = [_read_str(file) for _ in range(num)]
+
+        while True:
+            prefix = file.read(2)
+            if len(prefix) < 2:
+                break
+            (num,) = struct.unpack('<H', prefix)
+            row = []
+            try:
+                for _ in range(num):
+                    tag = _read_exactly(file, 1)
+                    if tag == TAG_INT:
+                        row.append(struct.unpack('<q', _read_exactly(file, 8))[0])
+                    elif tag == TAG_FLOAT:
+                        row.append(struct.unpack('<d', _read_exactly(file, 8))[0])
+                    elif tag == TAG_STR:
+                        row.append(_read_str(file))
+                    else:
+                        raise ValueError('unknown tag:{}'.format(tag))
+            except EOFError:
+                break
+            rows.append(row)
+    return (labels, rows)
+
+def open_sink(path):
+    """Return sink appropriate for path based on its extension (.csv, .jsonl or .bin)."""
+    if path.endswith('.csv'):
+        return CSVSink(path)
+    if path.endswith('.jsonl'):
+        return JSONLSink(path)
+    if path.endswith('.bin'):
+        return BinarySink(path)
+    raise ValueError('unknown sink type for {}'.format(path))
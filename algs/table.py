@@ -18,11 +18,17 @@ canceling the N*Log N term.
 from contextlib import contextmanager
 
 from algs.output import visualize
-from algs.modeling import best_models, pearson_correlation
+from algs.modeling import best_models, best_models_batch, pearson_correlation
 
 # When a table wants to skip a value, select this one.
 SKIP = '*'
 
+# Models whose Pearson correlation reaches this threshold are all considered.
+THRESHOLD = 0.99
+
+# Placeholder for a cell in a column that has not (yet) been assigned a value.
+_MISSING = object()
+
 class DataTable:
     """
     A class used to represent a table with columns.
@@ -48,15 +54,26 @@ class DataTable:
                8      2.8284
                9      3.0000
 
+    Values are stored by column: each label maps to a list holding one cell
+    per row, so extracting a column (for plotting or model fitting) is a
+    slice of that list rather than a walk over every row.
+
+    If a RowCache (see algs.cache) is provided, every row is also persisted
+    to disk, and cached_row() retrieves rows computed by an earlier run.
+    Sinks (see algs.sink) stream each row to a CSV, JSON Lines or binary file
+    as soon as it is produced.
     """
-    def __init__(self, widths, labels, output=True, decimals=3):
+    def __init__(self, widths, labels, output=True, decimals=3, cache=None, sinks=()):
         assert len(widths) == len(labels)
         self.output = output
+        self.cache = cache
+        self.sinks = []
         self.labels = labels
         self.widths = widths
         self.fmt = ''
         self.entry_fmt = ''
-        self.values = {}
+        self.columns = {label:[] for label in labels}
+        self.missing = {label:0 for label in labels}
         self.num_rows = 0
         self.row_index = {}
         symbol = ',d'
@@ -66,6 +83,18 @@ class DataTable:
             symbol = '.{}f'.format(decimals)
         if output:
             print(self.fmt.format(labels))
+        for sink in sinks:
+            self.add_sink(sink)
+
+    def add_sink(self, sink):
+        """Stream the labels, and every row from now on, to sink (see algs.sink)."""
+        sink.header(self.labels)
+        self.sinks.append(sink)
+
+    def close(self):
+        """Close all sinks."""
+        for sink in self.sinks:
+            sink.close()
 
     def set_output(self, status):
         """Turn on/off output status for row() method calls."""
@@ -111,14 +140,35 @@ class DataTable:
                 # assume partial rows are left-justified... WILL BE REPLACED WITH SKIP...
                 print('\t'.join(formats[:len(row)]).format(row))
 
-        if not row[0] in self.values:
-            self.values[row[0]] = {}
-            self.row_index[self.num_rows] = row[0]
+        if not row[0] in self.row_index:
+            self.row_index[row[0]] = self.num_rows
             self.num_rows += 1
+            self.columns[self.labels[0]].append(row[0])
+            for label in self.labels[1:]:
+                self.columns[label].append(_MISSING)
+                self.missing[label] += 1
 
         # replace all values
+        pos = self.row_index[row[0]]
         for idx in range(1,len(row)):
-            self.values[row[0]][self.labels[idx]] = row[idx]
+            col = self.columns[self.labels[idx]]
+            if col[pos] is _MISSING:
+                self.missing[self.labels[idx]] -= 1
+            col[pos] = row[idx]
+
+        if self.cache is not None:
+            self.cache.store(row)
+        for sink in self.sinks:
+            sink.write(row)
+
+    def cached_row(self, label):
+        """
+        Return row with given label persisted by an earlier run, or None if
+        there is no cache or it does not contain this row.
+        """
+        if self.cache is None:
+            return None
+        return self.cache.lookup(label)
 
     def header(self, column):
         """Return the header for the row."""
@@ -126,30 +176,25 @@ class DataTable:
 
     def entry(self, row, column):
         """If row and column belongs to value, return entry."""
-        if row in self.values:
-            vals = self.values[row]
-            if column in vals:
-                return vals[column]
+        if row in self.row_index and column in self.labels[1:]:
+            val = self.columns[column][self.row_index[row]]
+            if val is not _MISSING:
+                return val
         return None
 
     def column(self, column):
         """Return array of values in given column. Eliminate 'SKIP' and remaining."""
-        cols = []
-        for row in range(self.num_rows):
-            label = self.row_index[row]
-            vals = self.values[label]
+        if not column in self.columns:
+            return []
 
-            if column in vals:
-                cols.append(vals[column])
-            elif column == self.labels[0]:   # might be row label
-                cols.append(label)
+        cols = self.columns[column]
+        if self.missing[column]:
+            cols = [val for val in cols if val is not _MISSING]
 
         # SKIP ALL remaining values...
         if SKIP in cols:
-            idx = cols.index(SKIP)
-            cols = cols[:idx]
-
-        return cols
+            return cols[:cols.index(SKIP)]
+        return list(cols)
 
     def best_model(self, column, preselected = None):
         """
@@ -158,43 +203,66 @@ class DataTable:
 
         Checks models known to this package.
 
-        If more than one model have pearsonR >= threshold, they are all returned
+        If more than one model have pearsonR >= THRESHOLD, they are all returned
         in reverse sorted order. If the best model is below this threshold, then
         just it is returned.
         """
-        threshold = 0.99
-        nvals = []
-        yvals = []
-        for row in range(self.num_rows):
-            n = self.row_index[row]
-            vals = self.values[n]
-            if column in vals:
-                nvals.append(n)
-                yvals.append(vals[column])
+        nvals = self.columns[self.labels[0]]
+        yvals = self.columns[column]
+        if self.missing[column]:
+            pairs = [(n,y) for n,y in zip(nvals, yvals) if y is not _MISSING]
+            nvals = [n for n,_ in pairs]
+            yvals = [y for _,y in pairs]
 
         # Find all models, sorted in order of likelihood
-        models = best_models(nvals, yvals, preselected)
+        return select_models(best_models(nvals, yvals, preselected))
 
-        # If first one is smaller than threshold, just return it, otherwise
-        # return all that exceed threshold.
-        result = models[0]
-        if len(result) <= 1:
-            return result
-        if result[1] < threshold:
-            return result
-        return list(filter(lambda x: x[1] >= threshold, models))
+    def best_models(self, columns=None, preselected = None):
+        """
+        Return dictionary mapping each column (defaults to all but the first)
+        to its best_model(). Columns with a value in every row are fit together
+        in a single batch; any others are fit one at a time, curtailing those
+        that contain SKIP.
+        """
+        if columns is None:
+            columns = self.labels[1:]
+        full = [col for col in columns if not self.missing[col] and not SKIP in self.columns[col]]
+
+        result = {}
+        if full:
+            batch = best_models_batch(self.columns[self.labels[0]],
+                                      [self.columns[col] for col in full], preselected)
+            for col, models in zip(full, batch):
+                result[col] = select_models(models)
+        for col in columns:
+            if col in result:
+                continue
+            if self.missing[col]:
+                result[col] = self.best_model(col, preselected)
+            else:
+                result[col] = select_models(best_models(self.columns[self.labels[0]],
+                                                        self.column(col), preselected))
+        return result
 
     def pearsonr(self, actual, model):
         """Return Pearson correlation coefficient between Actual and Model."""
-        y_act = []
-        y_fit = []
-        for row in range(self.num_rows):
-            row_label = self.row_index[row]
-            vals = self.values[row_label]
-            y_act.append(vals[actual])
-            y_fit.append(vals[model])
-
-        return pearson_correlation(y_act, y_fit)
+        if self.missing[actual] or self.missing[model]:
+            raise ValueError('{} and {} must have values in every row'.format(actual, model))
+        return pearson_correlation(self.columns[actual], self.columns[model])
+
+def select_models(models, threshold=THRESHOLD):
+    """
+    Given models in decreasing order of likelihood, return all of those whose
+    pearsonR >= threshold. If the best model is below threshold, return it alone.
+    """
+    # If first one is smaller than threshold, just return it, otherwise
+    # return all that exceed threshold.
+    result = models[0]
+    if len(result) <= 1:
+        return result
+    if result[1] < threshold:
+        return result
+    return list(filter(lambda x: x[1] >= threshold, models))
 
 def process(table, chapter, number, description, create_image=True, xaxis='Problem instance size',
             yaxis='Time (in seconds)'):
@@ -1,9 +1,10 @@
 """Test cases for book package."""
+import os
 import unittest
 
 from algs.counting import RecordedItem
 from algs.node import Node
-from algs.table import DataTable
+from algs.table import DataTable, SKIP
 from algs.modeling import Model, numpy_error
 
 class TestAlgs(unittest.TestCase):
@@ -79,6 +80,276 @@ class TestAlgs(unittest.TestCase):
             self.assertEqual(model[0], Model.LINEAR)
             self.assertAlmostEqual(model[3], 1.0000, places=5)
 
+    def test_best_models_batch(self):
+        from algs.modeling import best_models, best_models_batch
+
+        nvals = [2 ** k for k in range(4, 12)]
+        linear = [3*n + 7 for n in nvals]
+        quadratic = [n*n + 2*n for n in nvals]
+        batch = best_models_batch(nvals, [linear, quadratic])
+        self.assertEqual(2, len(batch))
+        if numpy_error:
+            return
+
+        single = best_models(nvals, linear)
+        self.assertEqual([m[0] for m in single], [m[0] for m in batch[0]])
+        self.assertAlmostEqual(single[0][1], batch[0][0][1], places=9)
+        self.assertEqual(Model.LINEAR, batch[0][0][0])
+        self.assertAlmostEqual(3, batch[0][0][3], places=5)
+        self.assertAlmostEqual(7, batch[0][0][4], places=3)
+        self.assertEqual(Model.QUADRATIC, batch[1][0][0])
+        self.assertAlmostEqual(1, batch[1][0][3], places=5)
+
+        only = best_models(nvals, quadratic, Model.QUADRATIC)
+        self.assertEqual([Model.QUADRATIC], [m[0] for m in only])
+
+        tbl = DataTable([8, 8, 8, 8], ['N', 'Linear', 'Quadratic', 'Partial'], output=False)
+        for n, lin, quad in zip(nvals, linear, quadratic):
+            tbl.row([n, lin, quad, SKIP if n > 512 else 5*n])
+        models = tbl.best_models()
+        self.assertEqual(tbl.best_model('Linear')[0][0], models['Linear'][0][0])
+        self.assertEqual(tbl.best_model('Quadratic')[0][0], models['Quadratic'][0][0])
+        self.assertEqual(Model.LINEAR, models['Partial'][0][0])
+
+    def test_table_partial_rows(self):
+        tbl = DataTable([8, 8, 8], ['N', 'Full', 'Partial'], output=False)
+        tbl.row([1, 10, 100])
+        tbl.row([2, 20])
+        tbl.row([3, 30, SKIP])
+        tbl.row([4, 40, 400])
+        self.assertEqual([1, 2, 3, 4], tbl.column('N'))
+        self.assertEqual([10, 20, 30, 40], tbl.column('Full'))
+        self.assertEqual([100], tbl.column('Partial'))
+        self.assertIsNone(tbl.entry(2, 'Partial'))
+        self.assertEqual(400, tbl.entry(4, 'Partial'))
+        self.assertIsNone(tbl.entry(5, 'Full'))
+
+        # replacing a row keeps its position
+        tbl.row([2, 21, 201])
+        self.assertEqual([10, 21, 30, 40], tbl.column('Full'))
+        self.assertEqual([100, 201], tbl.column('Partial'))
+
+    def test_sinks(self):
+        import tempfile
+        import json
+        from algs.sink import open_sink, read_binary
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [os.path.join(tmpdir, 'table.{}'.format(ext)) for ext in ['csv', 'jsonl', 'bin']]
+            tbl = DataTable([8, 8, 8], ['N', 'Value', 'Other'], output=False,
+                            sinks=[open_sink(p) for p in paths])
+            tbl.row([1, 0.5, 'one'])
+            tbl.row([2, 1.25, SKIP])
+            tbl.row([2 ** 70, -3])
+
+            # rows are flushed even before table is closed
+            with open(paths[0]) as file:
+                self.assertEqual(['N,Value,Other', '1,0.5,one', '2,1.25,*'],
+                                 file.read().splitlines()[:3])
+            tbl.close()
+
+            # CSV lines end with exactly one '\r\n', regardless of platform
+            with open(paths[0], 'rb') as file:
+                data = file.read()
+            self.assertTrue(data.endswith(b'-3\r\n'))
+            self.assertFalse(b'\r\r' in data)
+
+            with open(paths[1]) as file:
+                lines = [json.loads(line) for line in file]
+            self.assertEqual(['N', 'Value', 'Other'], lines[0])
+            self.assertEqual([2 ** 70, -3], lines[3])
+
+            (labels, rows) = read_binary(paths[2])
+            self.assertEqual(['N', 'Value', 'Other'], labels)
+            self.assertEqual([[1, 0.5, 'one'], [2, 1.25, SKIP], [str(2 ** 70), -3]], rows)
+
+            # partially written final record is ignored
+            with open(paths[2], 'ab') as file:
+                file.write(b'\x02\x00i\x01')
+            self.assertEqual(3, len(read_binary(paths[2])[1]))
+
+            with self.assertRaises(ValueError):
+                open_sink(os.path.join(tmpdir, 'table.txt'))
+
+    def test_bench(self):
+        from algs.bench import bench, bench_table, InputCache, Timing
+
+        calls = []
+        def generate(n):
+            calls.append(n)
+            return list(range(n))
+
+        cache = InputCache()
+        timing = bench(sum, generate, (100,), repeat=4, cache=cache)
+        bench(max, generate, (100,), repeat=4, cache=cache)
+        self.assertEqual([100], calls)          # generated once, then cached
+        self.assertEqual(4, len(timing.times))
+        self.assertTrue(timing.min <= timing.median)
+
+        tbl = DataTable([8, 8, 8], ['N', 'Sum', 'Max'], output=False)
+        bench_table(tbl, [16, 32], [sum, None], generate, repeat=2, cache=cache)
+        self.assertEqual([16, 32], tbl.column('N'))
+        self.assertEqual(2, len(tbl.column('Sum')))
+        self.assertEqual([], tbl.column('Max'))
+        self.assertEqual(1, len(cache))         # rows evicted once complete
+
+        timing = Timing([3, 1, 2, 4])
+        self.assertEqual(1, timing.min)
+        self.assertEqual(2.5, timing.median)
+        self.assertAlmostEqual(1.290994, timing.stddev, places=5)
+        with self.assertRaises(ValueError):
+            timing.stat('max')
+
+    def test_row_cache(self):
+        import tempfile
+        from algs.cache import RowCache, row_cache, CACHE_ENV
+        from algs.sorting import is_sorted
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = RowCache('sample', [is_sorted], (1,), directory=tmpdir)
+            tbl = DataTable([8, 8], ['N', 'Value'], output=False, cache=cache)
+            self.assertIsNone(tbl.cached_row(2))
+            tbl.row([2, 0.5])
+            tbl.row(['Fixed', 3])
+
+            # Persisted rows are visible to a new cache with same key
+            tbl = DataTable([8, 8], ['N', 'Value'], output=False,
+                            cache=RowCache('sample', [is_sorted], (1,), directory=tmpdir))
+            self.assertEqual([2, 0.5], tbl.cached_row(2))
+            self.assertEqual(['Fixed', 3], tbl.cached_row('Fixed'))
+
+            # but not when parameters change
+            other = RowCache('sample', [is_sorted], (2,), directory=tmpdir)
+            self.assertIsNone(other.lookup(2))
+
+        if not os.environ.get(CACHE_ENV):
+            self.assertIsNone(row_cache('sample', [is_sorted]))
+            self.assertIsNone(DataTable([8], ['N'], output=False).cached_row(2))
+
+    def test_thread_local_counters(self):
+        import threading
+        from algs.counting import increment, counters, clear_counters, instrument
+
+        class Sample:
+            def less(self, a, b):
+                return a < b
+
+        CountingSample = instrument(Sample, less='compare')
+        self.assertEqual('CountingSample', CountingSample.__name__)
+
+        clear_counters()
+        self.assertTrue(CountingSample().less(1, 2))
+        Sample().less(1, 2)          # original class is not instrumented
+        self.assertEqual({'compare': 1}, counters())
+
+        other = []
+        def work():
+            increment('probe', 5)
+            other.append(counters())
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+        self.assertEqual([{'probe': 5}], other)
+        self.assertEqual({'compare': 1}, counters())
+
+    def test_measure_memory(self):
+        from algs.bench import measure_memory, bench_table, memory_labels, InputCache
+
+        used = measure_memory(lambda: [0] * 100000)
+        self.assertTrue(used.peak >= 800000)
+        self.assertTrue(used.retained <= used.peak)
+
+        cache = InputCache()
+        tbl = DataTable([8] * 4, ['N'] + memory_labels(['List']), output=False)
+        bench_table(tbl, [1000], [list], range, repeat=1, cache=cache, memory=True)
+        self.assertEqual(['N', 'List', 'ListPeak', 'ListKept'], tbl.labels)
+        self.assertTrue(tbl.entry(1000, 'ListKept') > 0)
+
+    def test_regression(self):
+        import tempfile
+        from algs.regression import save_run, load_runs, check_latest, bootstrap_ratio
+
+        def run(directory, factor, noise):
+            tbl = DataTable([8, 8, 8], ['N', 'Steady', 'Slower'], output=False)
+            samples = {}
+            for n in [64, 128]:
+                steady = [n * (1 + noise + d) for d in [0, 0.01, -0.01]]
+                slower = [v * factor for v in steady]
+                samples[('Steady', n)] = steady
+                samples[('Slower', n)] = slower
+                tbl.row([n, min(steady), min(slower)])
+            save_run(directory, 'sample', tbl, samples)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.assertEqual([], check_latest(tmpdir, 'sample'))
+            for noise in [0.01, -0.01, 0.02, -0.02, 0.0]:
+                run(tmpdir, 1, noise)
+            self.assertEqual([], check_latest(tmpdir, 'sample'))
+
+            run(tmpdir, 2, 0.01)
+            self.assertEqual(6, len(load_runs(tmpdir, 'sample')))
+            skipped = []
+            found = check_latest(tmpdir, 'sample', insufficient=skipped)
+            self.assertEqual([('Slower', 64), ('Slower', 128)], [(r.column, r.n) for r in found])
+            self.assertAlmostEqual(2.0, found[0].ratio, places=1)
+            self.assertEqual([], skipped)
+
+        # Two runs of single values 6% apart are not enough to report anything
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for val in [1.0, 1.06]:
+                tbl = DataTable([8, 8], ['N', 'Time'], output=False)
+                tbl.row([64, val])
+                save_run(tmpdir, 'sample', tbl)
+            skipped = []
+            self.assertEqual([], check_latest(tmpdir, 'sample', insufficient=skipped))
+            self.assertEqual([('Time', 64)], skipped)
+
+        (low, high) = bootstrap_ratio([1, 1, 1], [2, 2])
+        self.assertEqual((2.0, 2.0), (low, high))
+        self.assertIsNone(bootstrap_ratio([1], [1.06]))
+        self.assertIsNone(bootstrap_ratio([1, 1, 1], [1.06]))
+
+        from algs.bench import bench_table
+        samples = {}
+        tbl = DataTable([8, 8], ['N', 'List'], output=False)
+        bench_table(tbl, [100], [list], range, repeat=3, samples=samples)
+        self.assertEqual(3, len(samples[('List', 100)]))
+        self.assertEqual(min(samples[('List', 100)]), tbl.entry(100, 'List'))
+
+    def test_book_tasks(self):
+        import book
+
+        for chapter in book.CHAPTERS:
+            elements = book.chapter_elements(chapter)
+            tasks = book.chapter_tasks(chapter)
+            self.assertEqual([(chapter, idx) for idx in range(len(elements))], tasks)
+            self.assertTrue(len(tasks) > 10)
+
+        # Figure 2-8 is only a caption
+        text = book.generate_element('ch02', len(book.chapter_elements('ch02')) - 1)
+        self.assertTrue(text.startswith('Figure 2-8'))
+
+    def test_import_time(self):
+        import subprocess
+        import sys
+
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        # Importing DataTable must not import numpy, scipy or matplotlib
+        code = "import sys, algs.table; print(sorted(m for m in ('numpy', 'scipy', 'matplotlib') if m in sys.modules))"
+        result = subprocess.run([sys.executable, '-c', code],
+                                capture_output=True, text=True, check=True, cwd=root)
+        self.assertEqual('[]', result.stdout.splitlines()[-1])
+
+        # and should take well under the budget (in microseconds)
+        budget = 250000
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import algs.table'],
+                                capture_output=True, text=True, check=True, cwd=root)
+        for line in result.stderr.splitlines():
+            fields = [f.strip() for f in line.split('|')]
+            if fields[-1] == 'algs.table':
+                self.assertTrue(int(fields[1]) < budget)
+
 #######################################################################
 if __name__ == '__main__':
     unittest.main()
@@ -7,9 +7,30 @@
 Import all external modules that are ever used in the book, so you can 
 see now whether there are any surprises, and not later!
 
+Chapters are generated in sequence by default, which takes hours. On a
+multi-core machine, generate the individual tables and figures in parallel with
+
+    python3 book.py --jobs 4 --quiet ch03,ch05
+
+where each of the four worker processes is pinned to its own CPU (jobs is
+reduced to the number of available CPUs) and the chapters listed after
+--quiet are generated one at a time once the parallel ones have completed,
+for measurements sensitive to contention. The output of the parallel
+chapters appears in book order, followed by the output of the quiet ones.
+
+Each chapter's book.py lists its tables and figures, in book order, in
+ELEMENTS; generate_chXX() calls them in sequence, while each worker process
+calls one of them at a time.
 """
+import argparse
+import contextlib
+import importlib
+import io
+import os
 import timeit
 import itertools
+from datetime import datetime
+from multiprocessing import Pool, Queue
 
 try:
     import numpy as np
@@ -38,20 +59,97 @@ from ch06.book import generate_ch06
 from ch07.book import generate_ch07
 
 #######################################################################
-from datetime import datetime
+CHAPTERS = {
+    'ch01' : generate_ch01,
+    'ch02' : generate_ch02,
+    'ch03' : generate_ch03,
+    'ch04' : generate_ch04,
+    'ch05' : generate_ch05,
+    'ch06' : generate_ch06,
+    'ch07' : generate_ch07,
+}
+
+def generate(chapter):
+    """Generate all Tables/Figures for chapter (i.e., 'ch03'), with timestamp."""
+    print('{}:'.format(chapter), datetime.now())
+    CHAPTERS[chapter]()
+
+def chapter_elements(chapter):
+    """Return ELEMENTS, the list of table and figure functions, of chapter."""
+    return importlib.import_module(CHAPTERS[chapter].__module__).ELEMENTS
+
+def chapter_tasks(chapter):
+    """Return list of (chapter, idx) tasks, one for each of its ELEMENTS."""
+    return [(chapter, idx) for idx in range(len(chapter_elements(chapter)))]
+
+def generate_element(chapter, idx):
+    """Generate ELEMENTS[idx] of chapter in a worker process, returning what it prints."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        chapter_elements(chapter)[idx]()
+    return output.getvalue()
+
+def _generate_task(task):
+    """Pool entry point for generate_element()."""
+    return generate_element(*task)
+
+def pin_worker(cpus):
+    """
+    Pool initializer that pins each worker to its own CPU (where supported)
+    so timing measurements are not disturbed by workers migrating between cores.
+    """
+    cpu = cpus.get()
+    if hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, {cpu})
+
+def generate_book(jobs=1, quiet=()):
+    """
+    Generate chapters of the book. When jobs is 1 every chapter is generated
+    in sequence. Otherwise the tables and figures of each chapter are
+    generated by a pool of jobs processes (at most one per available CPU),
+    each pinned to its own CPU, and their output is printed in book order.
+    Chapters named in quiet are sensitive to contention: they are generated
+    one at a time, after the pool has finished, so nothing else is running.
+    """
+    if jobs <= 1:
+        for chapter in CHAPTERS:
+            generate(chapter)
+        return
+
+    parallel = [ch for ch in CHAPTERS if ch not in quiet]
+    if parallel:
+        cpus = Queue()
+        available = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else []
+        if available:
+            jobs = min(jobs, len(available))
+        for idx in range(jobs):
+            cpus.put(available[idx] if available else idx)
+
+        tasks = [task for chapter in parallel for task in chapter_tasks(chapter)]
+        with Pool(processes=jobs, initializer=pin_worker, initargs=(cpus,)) as pool:
+            current = None
+            for (task, text) in zip(tasks, pool.imap(_generate_task, tasks)):
+                if task[0] != current:
+                    current = task[0]
+                    print('{}:'.format(current), datetime.now())
+                print(text, end='')
+
+    for chapter in CHAPTERS:
+        if chapter in quiet:
+            generate(chapter)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate all Tables/Figures for book.')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='number of tables/figures to generate in parallel (default 1)')
+    parser.add_argument('--quiet', default='',
+                        help='comma-separated chapters (i.e., ch03,ch05) to generate '
+                             'serially after parallel ones complete')
+    args = parser.parse_args()
+
+    quiet = [ch for ch in args.quiet.split(',') if ch]
+    for ch in quiet:
+        if ch not in CHAPTERS:
+            parser.error('{} is not a valid chapter'.format(ch))
 
-# Generate all chapters, with timestamps
-print("ch01:", datetime.now())
-generate_ch01()
-print("ch02:", datetime.now())
-generate_ch02()
-print("ch03:", datetime.now())
-generate_ch03()
-print("ch04:", datetime.now())
-generate_ch04()
-print("ch05:", datetime.now())
-generate_ch05()
-print("ch06:", datetime.now())
-generate_ch06()
-print("ch07:", datetime.now())
-generate_ch07()
+    generate_book(args.jobs, quiet)
@@ -162,8 +162,9 @@ x=list(range({}))'''.format(n), number=num)
 
     if output:
         print()
+        models = tbl.best_models()
         for header in tbl.labels[1:]:
-            print(header, tbl.best_model(header))
+            print(header, models[header])
     return tbl
 
 def run_largest_two_trials(mode, max_k=22, output=True, decimals=2):
@@ -227,6 +228,48 @@ x=list(range({}))
 
     return tbl
 
+def run_largest_two_parallel_trials(workers=4, max_k=22, output=True, decimals=3):
+    """
+    Compare largest_two() and tournament_two() against largest_two_parallel()
+    with the given number of workers, on shuffled lists of 2**k values up to
+    (but not including) max_k. Times are in milliseconds, and Speedup is the
+    ratio of sequential to parallel time for largest_two(), which can only
+    exceed 1 on a machine with multiple CPUs. The final columns count the
+    comparisons made by largest_two() and by the parallel version.
+    """
+    from multiprocessing import Pool
+    from algs.bench import bench, input_cache
+    from ch01.largest_two import largest_two, tournament_two
+    from ch01.parallel import largest_two_parallel, count_comparisons
+    from ch01.timing import shuffled
+
+    tbl = DataTable([10,10,10,10,10,8,12,12],
+        ['N','largest_two','tournament_two','parallel','parallel_tt','Speedup','Compares','Par. Compares'],
+        output=output, decimals=decimals)
+    tbl.format('Compares', ',d')
+    tbl.format('Par. Compares', ',d')
+
+    with Pool(processes=workers) as pool:
+        def parallel(A):
+            return largest_two_parallel(A, workers, pool=pool)
+        def parallel_tt(A):
+            return largest_two_parallel(A, workers, algorithm=tournament_two, pool=pool)
+
+        for n in [2**k for k in range(10, max_k)]:
+            t_lt = bench(largest_two, shuffled, (n,), repeat=3).min
+            t_tt = bench(tournament_two, shuffled, (n,), repeat=3).min
+            t_par = bench(parallel, shuffled, (n,), repeat=3).min
+            t_par_tt = bench(parallel_tt, shuffled, (n,), repeat=3).min
+
+            A = shuffled(n)
+            (_, compares) = count_comparisons(largest_two, A)
+            (_, par_compares) = largest_two_parallel(A, workers, pool=pool, count=True)
+            input_cache.discard(shuffled, n)
+
+            tbl.row([n, 1000*t_lt, 1000*t_tt, 1000*t_par, 1000*t_par_tt, t_lt / t_par,
+                     compares, par_compares])
+    return tbl
+
 def run_best_worst(max_n=525288, output=True, decimals=2):
     """Perform best and worst case analysis for largest."""
     n = 4096
@@ -395,10 +438,10 @@ def visualize_tournament_two(A):
 
     return (largest, second)
 
-def generate_ch01():
-    """Generate Tables and Figures for chapter 01."""
-    chapter = 1
+CHAPTER = 1
 
+def figure_1():
+    """Generate Figure 1-1."""
     with FigureNum(1) as figure_number:
         pi1 = [13, 2, 18, 7, 50]
         pi2 = [-19, -236, -17, -204, -97, -20, -928, -454, -92, -19]
@@ -406,86 +449,126 @@ def generate_ch01():
         print(pi1, '->', max(pi1))
         print(pi2, '->', max(pi2))
         print(pi3[:5]+['...'] + pi3[-3:], '->', max(pi3))
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
               'Three different problem instances processed by an algorithm')
         print()
 
+def table_1():
+    """Generate Table 1-1."""
     with TableNum(1) as table_number:
         process(run_init_trial(),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Executing max() on two kinds of problem instances of size N (time in ms)',
                 yaxis = 'Time (in ms)')
 
+def figure_2():
+    """Generate Figure 1-2."""
     with FigureNum(2) as figure_number:
         visualize_flawed([1, 5, 2, 9, 3, 4])
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
               'Visualizing the execution of flawed()')
 
+def figure_3():
+    """Generate Figure 1-3."""
     with FigureNum(3) as figure_number:
         visualize_alternate([1, 5, 2, 9, 3, 4])
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
               'Visualizing the execution of alternate()')
 
+def figure_4():
+    """Generate Figure 1-4."""
     with FigureNum(4) as figure_number:
         visualize_alternate([9, 5, 2, 1, 3, 4])
         visualize_alternate([1, 2, 3, 4, 5, 9])
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
               'Visualizing the execution of alternate() on best and worst cases')
 
+def table_2():
+    """Generate Table 1-2."""
     # TODO: Option for secondary axis specification
     with TableNum(2) as table_number:
         process(run_largest_alternate(),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Comparing largest() with alternate() on worst case problem instances')
 
+def figure_5():
+    """Generate Figure 1-5."""
     # Take results and plot #LessA on left-axis as line, and TimesA on right axis as column
     with FigureNum(5) as figure_number:
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
               'Relationship between #Less-Than and runtime performance')
 
+def table_3():
+    """Generate Table 1-3."""
     with TableNum(3) as table_number:
         process(run_best_worst(),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Performance of largest() and max() on best and worst cases')
 
+def table_4():
+    """Generate Table 1-4."""
     with TableNum(4) as table_number:
         process(performance_different_approaches(),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Performance of different approached on 524,288 values in different orders',
                 create_image = False)
 
+def figure_6():
+    """Generate Figure 1-6."""
     with FigureNum(6) as figure_number:
         print('by hand')
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
               'A tournament with eight initial values')
 
+def figure_7():
+    """Generate Figure 1-7."""
     with FigureNum(7) as figure_number:
         print('by hand')
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
               'A tournament with 32 values')
 
+def figure_8():
+    """Generate Figure 1-8."""
     with FigureNum(8) as figure_number:
         visualize_tournament_two([3,1,4,1,5,9,2,6])
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
               'Step-by-step execution of tournament algorithm')
 
+def table_5():
+    """Generate Table 1-5."""
     with TableNum(5) as table_number:
         process(run_largest_two_trials(Order.SHUFFLED),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Comparing runtime performance (in ms) of all four algorithms',
                 yaxis = 'Time (in ms)')
 
+def figure_9():
+    """Generate Figure 1-9."""
     # Taken from table
     with FigureNum(9) as figure_number:
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
               'Runtime performance comparison')
 
+def table_6():
+    """Generate Table 1-6."""
     with TableNum(6) as table_number:
         process(count_operations(),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Counting operations in four different functions',
                 yaxis = 'Number of times ct is incremented')
 
+# Tables and Figures in book order. Each is generated independently, so
+# book.py can generate them in parallel.
+ELEMENTS = [
+    figure_1, table_1, figure_2, figure_3, figure_4, table_2, figure_5, table_3,
+    table_4, figure_6, figure_7, figure_8, table_5, figure_9, table_6,
+]
+
+def generate_ch01():
+    """Generate Tables and Figures for chapter 01."""
+    for element in ELEMENTS:
+        element()
+
 #######################################################################
 if __name__ == '__main__':
     generate_ch01()
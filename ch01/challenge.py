@@ -2,10 +2,12 @@
 Challenge Exercises for Chapter 1.
 """
 
+import math
 import random
 import timeit
 
-from algs.table import DataTable, ExerciseNum, caption
+from algs.bench import bench, input_cache
+from algs.table import DataTable, ExerciseNum, caption, SKIP
 from algs.counting import RecordedItem
 
 def partition(A, lo, hi, idx):
@@ -62,6 +64,132 @@ def linear_median(A):
             hi = j-1
     return A[lo]
 
+def partition3(A, lo, hi, idx):
+    """
+    Three-way partition of A[lo..hi] (INCLUSIVE) around pivot A[idx], using
+    only less-than. Returns (lt, gt) such that A[lo..lt-1] < pivot, A[lt..gt]
+    are equal to pivot, and A[gt+1..hi] > pivot. Unlike partition(), many
+    duplicate values do not lead to unbalanced partitions.
+    """
+    pivot = A[idx]
+    lt = lo
+    i = lo
+    gt = hi
+    while i <= gt:
+        if A[i] < pivot:
+            A[lt],A[i] = A[i],A[lt]
+            lt += 1
+            i += 1
+        elif pivot < A[i]:
+            A[i],A[gt] = A[gt],A[i]
+            gt -= 1
+        else:
+            i += 1
+    return (lt, gt)
+
+def _insertion_sort(A, lo, hi):
+    """Sort A[lo..hi] (INCLUSIVE) in place."""
+    for i in range(lo+1, hi+1):
+        j = i
+        while j > lo and A[j] < A[j-1]:
+            A[j],A[j-1] = A[j-1],A[j]
+            j -= 1
+
+def median_of_medians(A, lo, hi):
+    """
+    Return index of a pivot in A[lo..hi] (INCLUSIVE) that is guaranteed to
+    be larger than (and smaller than) at least 3/10 of the values. Each group
+    of five values is sorted and its median moved to the front of the range;
+    the median of these medians is then selected recursively.
+    """
+    if hi - lo < 5:
+        _insertion_sort(A, lo, hi)
+        return (lo + hi) // 2
+
+    dest = lo
+    for start in range(lo, hi+1, 5):
+        end = min(start + 4, hi)
+        _insertion_sort(A, start, end)
+        mid = (start + end) // 2
+        A[dest],A[mid] = A[mid],A[dest]
+        dest += 1
+
+    mid = (lo + dest - 1) // 2
+    select_kth(A, mid, lo, dest - 1)
+    return mid
+
+def select_kth(A, k, lo=0, hi=None):
+    """
+    Return the value that would be at index k were A[lo..hi] (INCLUSIVE)
+    sorted, rearranging A so it is at index k, with smaller values to its
+    left and larger values to its right.
+
+    Introselect: uses random pivots with partition(), which is fast on
+    average, as long as every four partitions at least halve the size of the
+    range. Once they do not, it switches to median_of_medians() pivots with
+    partition3(), which guarantee O(N) worst case even when A contains many
+    duplicate values.
+    """
+    if hi is None:
+        hi = len(A) - 1
+    if not lo <= k <= hi:
+        raise IndexError('k={} not in range [{}, {}]'.format(k, lo, hi))
+
+    guaranteed = False
+    check_size = hi - lo + 1
+    steps = 0
+    while lo < hi:
+        if guaranteed:
+            (lt, gt) = partition3(A, lo, hi, median_of_medians(A, lo, hi))
+        else:
+            lt = gt = partition(A, lo, hi, random.randint(lo, hi))
+
+        if lt <= k <= gt:
+            return A[k]
+        if k < lt:
+            hi = lt - 1
+        else:
+            lo = gt + 1
+
+        steps += 1
+        if not guaranteed and steps % 4 == 0:
+            size = hi - lo + 1
+            if size > check_size // 2:
+                guaranteed = True
+            check_size = size
+    return A[k]
+
+def quantile_rank(q, N):
+    """Return index of the q-quantile (0 <= q <= 1) among N sorted values, using nearest rank."""
+    if not 0 <= q <= 1:
+        raise ValueError('quantile must be between 0 and 1: {}'.format(q))
+    return min(N - 1, max(0, math.ceil(q * N) - 1))
+
+def select_quantiles(A, quantiles):
+    """
+    Return list of values at each of the quantiles in A (such as [0.5, 0.9,
+    0.99] for p50, p90 and p99), rearranging A. Each selection only
+    processes the range of A between the ranks already selected, so
+    later selections are much faster than if each were done separately.
+    """
+    if not A:
+        raise ValueError('Must have at least one value')
+    ranks = sorted(set(quantile_rank(q, len(A)) for q in quantiles))
+
+    # Process (lo, hi, first, last) ranges, each containing ranks[first..last]
+    ranges = [(0, len(A) - 1, 0, len(ranks) - 1)]
+    while ranges:
+        (lo, hi, first, last) = ranges.pop()
+        if first > last:
+            continue
+        mid = (first + last) // 2
+        k = ranks[mid]
+        select_kth(A, k, lo, hi)
+        ranges.append((lo, k - 1, first, mid - 1))
+        ranges.append((k + 1, hi, mid + 1, last))
+
+    return [A[quantile_rank(q, len(A))] for q in quantiles]
+
 def counting_sort(A, M):
     """
     Update A in place to be sorted in ascending order if all elements
@@ -96,34 +224,42 @@ def counting_sort_improved(A,M):
             pos += counts[val]
         val += 1
 
-def run_counting_sort_trials(max_k=15, output=True):
-    """Generate table for counting sort up to (but not including) max_k=15."""
-    tbl = DataTable([8,15,15],
-                    ['N', 'counting_sort', 'counting_sort_improved'], output=output)
+def shuffled_values(M, n):
+    """Return list containing n copies of each value from 0 to M-1, shuffled."""
+    a = list(range(M)) * n
+    random.shuffle(a)
+    return a
+
+def run_counting_sort_trials(max_k=15, repeat=10, output=True):
+    """
+    Generate table for counting sort up to (but not including) max_k=15. Also
+    compares radix_sort() and, when numpy is available, radix_sort_np() on
+    the same values. Every column reports the best of repeat runs, each on a
+    fresh copy of the same shuffled values.
+    """
+    from algs.modeling import numpy_error
+    from ch01.radix import radix_sort, radix_sort_np
+    tbl = DataTable([8,15,15,15,15],
+                    ['N', 'counting_sort', 'counting_sort_improved', 'radix_sort', 'radix_sort_np'],
+                    output=output)
 
     M = 20 # arbitrary value, and results are dependent on this value.
     trials = [2**k for k in range(8, max_k)]
     for n in trials:
-        t_cs = min(timeit.repeat(stmt='counting_sort(a,{})\nis_sorted(a)'.format(M),
-                                 setup='''
-import random
-from ch01.challenge import counting_sort
-from algs.sorting import is_sorted
-w = [{0}-1] * {1}
-b = [0] * {1} 
-a = list(range({0})) * {1}
-random.shuffle(a)'''.format(M,n), repeat=100, number=1))
-        t_csi = min(timeit.repeat(stmt='counting_sort_improved(a,{})\nis_sorted(a)'.format(M),
-                                  setup='''
-import random
-from ch01.challenge import counting_sort_improved
-from algs.sorting import is_sorted
-w = [{0}-1] * {1}
-b = [0] * {1} 
-a = list(range({0})) * {1}
-random.shuffle(a)'''.format(M,n), repeat=100, number=1))
-
-        tbl.row([n, t_cs, t_csi])
+        args = (M, n)
+        t_cs = bench(lambda a: counting_sort(a, M), shuffled_values, args,
+                     repeat=repeat, prepare=list).min
+        t_csi = bench(lambda a: counting_sort_improved(a, M), shuffled_values, args,
+                      repeat=repeat, prepare=list).min
+        t_rs = bench(radix_sort, shuffled_values, args, repeat=repeat, prepare=list).min
+
+        t_rsn = SKIP
+        if not numpy_error:
+            import numpy as np
+            t_rsn = bench(radix_sort_np, shuffled_values, args, repeat=repeat, prepare=np.array).min
+
+        input_cache.discard(shuffled_values, M, n)
+        tbl.row([n, t_cs, t_csi, t_rs, t_rsn])
     return tbl
 
 def run_median_trial():
@@ -178,6 +314,46 @@ def run_median_less_than_trial(max_k=20, output=True):
 
     return tbl
 
+def run_selection_trial(max_k=20, output=True, decimals=3):
+    """
+    Compare linear_median(), select_kth() and sorted() for computing the median
+    of shuffled lists of 2**k+1 values up to (but not including) max_k, as well
+    as computing p50, p90 and p99 with one call to select_quantiles(). The
+    final two columns compare linear_median() and select_kth() on lists where
+    every value is the same, for which linear_median() is O(N^2) (and so is
+    skipped for large N). Times are in milliseconds.
+    """
+    from algs.bench import bench, input_cache
+    from ch01.timing import shuffled
+
+    def all_equal(n):
+        return [1] * n
+
+    def median_kth(A):
+        return select_kth(A, len(A) // 2)
+
+    def percentiles(A):
+        return select_quantiles(A, [0.5, 0.9, 0.99])
+
+    def sorted_median(A):
+        return sorted(A)[len(A) // 2]
+
+    tbl = DataTable([10,10,10,10,10,10,10], ['N', 'linear_median', 'select_kth', 'quantiles',
+                    'sorted', 'equal_linear', 'equal_select'], output=output, decimals=decimals)
+    for n in [2**k+1 for k in range(8, max_k)]:
+        row = [n]
+        for func in [linear_median, median_kth, percentiles, sorted_median]:
+            row.append(1000 * bench(func, shuffled, (n,), repeat=5, prepare=list).min)
+        if n > 2**13:
+            row.append(SKIP)
+        else:
+            row.append(1000 * bench(linear_median, all_equal, (n,), repeat=1, prepare=list).min)
+        row.append(1000 * bench(median_kth, all_equal, (n,), repeat=5, prepare=list).min)
+        input_cache.discard(shuffled, n)
+        input_cache.discard(all_equal, n)
+        tbl.row(row)
+    return tbl
+
 def is_palindrome1(w):
     """Create slice with negative step and confirm equality with w."""
     return w[::-1] == w
@@ -1,6 +1,7 @@
 """
 Algorithms to locate top two values in an arbitrary list.
 """
+from itertools import islice
 
 def largest_two(A):
     """
@@ -267,3 +268,93 @@ def tournament_two(A):
         m = prior[m]
 
     return (largest, second)
+
+def _play(block, a, b):
+    """
+    Return index of winner (a or b) in match between block[a] and block[b],
+    where None represents an entrant that is absent (or already removed).
+    """
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if block[a] < block[b]:
+        return b
+    return a
+
+def tournament_top_k_block(block, k):
+    """
+    Return list of k largest values in block (largest first), or all of its
+    values when there are fewer than k. Works for any length of block.
+
+    The tournament is stored in an array, tree, where tree[1] is the index of
+    the winner, and the children of tree[i] are tree[2i] and tree[2i+1]. Once
+    the winner is removed, only the log N matches along its path are replayed
+    to find the next winner, so k values require N-1 + (k-1)*log N matches.
+    """
+    N = len(block)
+    size = 1
+    while size < N:
+        size *= 2
+    tree = [None] * (2*size)
+    for i in range(N):
+        tree[size + i] = i
+    for i in range(size-1, 0, -1):
+        tree[i] = _play(block, tree[2*i], tree[2*i+1])
+
+    result = []
+    while tree[1] is not None:
+        idx = tree[1]
+        result.append(block[idx])
+        if len(result) == k:
+            break
+        pos = size + idx
+        tree[pos] = None
+        pos //= 2
+        while pos >= 1:
+            tree[pos] = _play(block, tree[2*pos], tree[2*pos+1])
+            pos //= 2
+    return result
+
+def _merge_top(one, two, k):
+    """Return k largest values (largest first) from lists one and two, each largest first."""
+    merged = []
+    i = j = 0
+    while len(merged) < k and (i < len(one) or j < len(two)):
+        if j == len(two) or (i < len(one) and not one[i] < two[j]):
+            merged.append(one[i])
+            i += 1
+        else:
+            merged.append(two[j])
+            j += 1
+    return merged
+
+def running_top_k(iterable, k, block_size=1024):
+    """
+    Consume iterable (which can be unbounded) block_size values at a time,
+    and after each block yield list of k largest values seen so far, largest
+    first (fewer than k until k values have been seen). Only the current
+    block and the k largest values are stored.
+    """
+    if k < 1:
+        raise ValueError('k must be at least 1')
+    it = iter(iterable)
+    best = []
+    while True:
+        block = list(islice(it, block_size))
+        if not block:
+            return
+        best = _merge_top(best, tournament_top_k_block(block, k), k)
+        yield best
+
+def tournament_top_k(iterable, k=2, block_size=1024):
+    """
+    Return list of k largest values (largest first) from iterable of any
+    length, odd or even. Requires at least k values.
+    """
+    best = []
+    for best in running_top_k(iterable, k, block_size):
+        pass
+    if len(best) < k:
+        raise ValueError('Must have at least {} values'.format(k))
+    return best
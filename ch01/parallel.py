@@ -0,0 +1,166 @@
+"""
+Find the two largest values in an array using a pool of worker processes.
+
+The array is copied once into shared memory, and then each worker process
+locates the two largest values within its own shard of the array, accessing
+the shared memory directly rather than receiving a pickled copy of its shard.
+The two largest values overall must be among the 2*workers values returned
+by the workers, which are merged with one final call to largest_two().
+
+Shared memory is only available in Python 3.8 and higher. Since values are
+stored in shared memory as an array.array, they must be numbers that fit its
+typecode ('q' for integers and 'd' for floats unless A is itself an array).
+
+tournament_two() and its variants only work on lists whose length is a power
+of two, so when one of them is the algorithm, A is split into shards whose
+lengths are all powers of two (there may be more shards than workers).
+"""
+from array import array
+from multiprocessing import Pool
+
+from algs.counting import RecordedItem
+from ch01.largest_two import (largest_two, tournament_two, tournament_two_object,
+                               tournament_two_losers)
+
+# These algorithms require the length of their input to be a power of two.
+POWER_OF_TWO_ALGORITHMS = (tournament_two, tournament_two_object, tournament_two_losers)
+
+def shards(N, workers):
+    """Return list of (lo, hi) index ranges that split N values into workers shards."""
+    bounds = [N * i // workers for i in range(workers + 1)]
+    return [(bounds[i], bounds[i+1]) for i in range(workers) if bounds[i] < bounds[i+1]]
+
+def power_of_two_shards(N, workers):
+    """
+    Return list of (lo, hi) index ranges that split N values into shards whose
+    lengths are powers of two: as many shards as fit of the largest power of
+    two no greater than N/workers, followed by the binary decomposition of
+    whatever remains.
+    """
+    size = 1 << max(0, (N // workers).bit_length() - 1)
+    ranges = []
+    lo = 0
+    while N - lo >= size:
+        ranges.append((lo, lo + size))
+        lo += size
+    while size > 1:
+        size //= 2
+        if N - lo >= size:
+            ranges.append((lo, lo + size))
+            lo += size
+    return ranges
+
+def count_comparisons(func, values):
+    """Return (result of func on values, number of comparisons it made)."""
+    items = [RecordedItem(v) for v in values]
+    RecordedItem.clear()
+    (first, second) = func(items)
+    (num_eq, num_lt, num_gt) = RecordedItem.report()
+    return ((first.val, second.val), num_eq + num_lt + num_gt)
+
+def attach_shared(name):
+    """
+    Attach to existing shared memory called name without registering it
+    with the resource tracker, since only its creator should unlink it.
+    Python 3.13 added track=False; earlier versions always register, so
+    registration is briefly disabled instead.
+    """
+    from multiprocessing import shared_memory, resource_tracker
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+def _shard_two(name, typecode, lo, hi, func, count):
+    """
+    Worker: return ((largest, second), comparisons) for shard [lo, hi) of the
+    array in shared memory called name; a shard of one value has no second.
+    Comparisons are counted only when count is True, and are otherwise 0.
+    """
+    shm = attach_shared(name)
+    try:
+        view = shm.buf.cast('B').cast(typecode)
+        values = view[lo:hi]
+        try:
+            if len(values) == 1:
+                return ((values[0], None), 0)
+            if count:
+                return count_comparisons(func, values)
+            return (tuple(func(values)), 0)
+        finally:
+            values.release()
+            view.release()
+    finally:
+        shm.close()
+
+def largest_two_parallel(A, workers=4, algorithm=largest_two, pool=None,
+                         typecode=None, count=False):
+    """
+    Return two largest values in A, computed by splitting A into (at most)
+    workers shards, each processed by algorithm (such as largest_two or
+    tournament_two) in its own process. When algorithm is one of
+    POWER_OF_TWO_ALGORITHMS, the shards come from power_of_two_shards().
+    When pool is None, a new Pool is created (and closed) for just this
+    call; pass an existing pool to avoid paying that cost on every call.
+
+    Integers are stored with typecode 'q', or 'Q' when they are too large
+    for it; integers that do not fit in 64 bits are stored (and compared)
+    as floats, and so may lose precision.
+
+    When count is True, return ((largest, second), comparisons) where
+    comparisons is the total number of comparisons made by all workers plus
+    those needed to merge their results.
+    """
+    from multiprocessing import shared_memory
+    if len(A) < 2:
+        raise ValueError('Must have at least two values')
+    if isinstance(A, array) and typecode in (None, A.typecode):
+        values = A
+    elif typecode is None:
+        try:
+            values = array('q', A)
+        except TypeError:                   # not all integers
+            values = array('d', A)
+        except OverflowError:               # integers beyond 'q'
+            try:
+                values = array('Q', A)
+            except (TypeError, OverflowError):
+                values = array('d', A)
+    else:
+        values = array(typecode, A)
+    typecode = values.typecode
+
+    split = power_of_two_shards if algorithm in POWER_OF_TWO_ALGORITHMS else shards
+    data = memoryview(values).cast('B')
+    shm = shared_memory.SharedMemory(create=True, size=len(data))
+    try:
+        shm.buf[:len(data)] = data
+        tasks = [(shm.name, typecode, lo, hi, algorithm, count)
+                 for (lo, hi) in split(len(values), workers)]
+        if pool is None:
+            with Pool(processes=min(workers, len(tasks))) as own_pool:
+                results = own_pool.starmap(_shard_two, tasks)
+        else:
+            results = pool.starmap(_shard_two, tasks)
+    finally:
+        data.release()
+        shm.close()
+        shm.unlink()
+
+    candidates = []
+    comparisons = 0
+    for ((first, second), num) in results:
+        candidates.append(first)
+        if second is not None:
+            candidates.append(second)
+        comparisons += num
+
+    if count:
+        (best, num) = count_comparisons(largest_two, candidates)
+        return (best, comparisons + num)
+    return largest_two(candidates)
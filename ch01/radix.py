@@ -0,0 +1,160 @@
+"""
+LSD (least significant digit) radix sort, built from repeated counting sorts.
+
+counting_sort() in ch01.challenge needs the values to be in a small range, 0
+to M-1, and it only sorts the values themselves. Radix sort removes both
+limits: it sorts non-negative integer keys of any size by performing one
+stable counting sort for each digit of bits bits, starting with the least
+significant digit. Since each pass is stable, records can be sorted using a
+key function, just like sorted().
+
+Every pass needs the histogram of its digit. digit_histograms() computes the
+histograms for all passes with a single scan of the keys, and this scan can
+be split across a process pool with parallel_histograms(), which shares the
+keys with each worker through shared memory.
+
+When numpy is available, radix_argsort_np() and radix_sort_np() operate on
+arrays, each pass using a stable sort of one byte (or two) of the keys,
+which numpy itself implements as a counting sort.
+"""
+from array import array
+from multiprocessing import Pool
+
+from ch01.parallel import attach_shared, shards
+
+def digit_histograms(keys, bits, passes):
+    """
+    Return list of passes histograms, where histograms[p][d] counts the keys
+    whose p-th digit (of bits bits, from least significant) is d.
+    """
+    mask = (1 << bits) - 1
+    histograms = [[0] * (1 << bits) for _ in range(passes)]
+    shifts = [(p * bits, histograms[p]) for p in range(passes)]
+    for k in keys:
+        for (shift, counts) in shifts:
+            counts[(k >> shift) & mask] += 1
+    return histograms
+
+def _shard_histograms(name, lo, hi, bits, passes):
+    """Worker: return digit_histograms() for keys[lo:hi] in shared memory called name."""
+    shm = attach_shared(name)
+    try:
+        view = shm.buf.cast('B').cast('Q')
+        keys = view[lo:hi]
+        try:
+            return digit_histograms(keys, bits, passes)
+        finally:
+            keys.release()
+            view.release()
+    finally:
+        shm.close()
+
+def parallel_histograms(keys, bits, passes, workers=4, pool=None):
+    """
+    Return digit_histograms(keys, bits, passes), with the scan of keys split
+    among workers processes that share keys (which must fit in 64 bits).
+    """
+    from multiprocessing import shared_memory
+    values = keys if isinstance(keys, array) and keys.typecode == 'Q' else array('Q', keys)
+    data = memoryview(values).cast('B')
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(data)))
+    try:
+        shm.buf[:len(data)] = data
+        tasks = [(shm.name, lo, hi, bits, passes) for (lo, hi) in shards(len(values), workers)]
+        if pool is None:
+            with Pool(processes=max(1, len(tasks))) as own_pool:
+                results = own_pool.starmap(_shard_histograms, tasks)
+        else:
+            results = pool.starmap(_shard_histograms, tasks)
+    finally:
+        data.release()
+        shm.close()
+        shm.unlink()
+
+    histograms = [[0] * (1 << bits) for _ in range(passes)]
+    for result in results:
+        for (total, counts) in zip(histograms, result):
+            for d, num in enumerate(counts):
+                total[d] += num
+    return histograms
+
+def counting_pass(A, keys, counts, shift, mask):
+    """
+    Stable counting sort of A (with matching keys) by digit (key >> shift) & mask,
+    given the counts of each digit. Returns (sorted A, sorted keys) as new lists.
+    """
+    pos = [0] * len(counts)
+    total = 0
+    for d, num in enumerate(counts):
+        pos[d] = total
+        total += num
+
+    sorted_a = [None] * len(A)
+    sorted_keys = [0] * len(A)
+    for v, k in zip(A, keys):
+        d = (k >> shift) & mask
+        idx = pos[d]
+        sorted_a[idx] = v
+        sorted_keys[idx] = k
+        pos[d] = idx + 1
+    return (sorted_a, sorted_keys)
+
+def radix_sort(A, key=None, bits=8, workers=1, pool=None):
+    """
+    Update A in place to be sorted in ascending order of key(v) (or v when key
+    is None), which must be a non-negative integer. Performs one stable
+    counting sort for every digit of bits bits in the largest key. When
+    workers > 1 the histograms are computed by parallel_histograms().
+    """
+    if len(A) < 2:
+        return
+    keys = list(A) if key is None else [key(v) for v in A]
+    if min(keys) < 0:
+        raise ValueError('radix_sort() requires non-negative integer keys')
+
+    passes = max(1, -(-max(keys).bit_length() // bits))
+    if workers > 1:
+        histograms = parallel_histograms(keys, bits, passes, workers, pool)
+    else:
+        histograms = digit_histograms(keys, bits, passes)
+
+    mask = (1 << bits) - 1
+    values = list(A)
+    for p in range(passes):
+        if max(histograms[p]) == len(A):
+            continue                    # every key has the same digit
+        (values, keys) = counting_pass(values, keys, histograms[p], p * bits, mask)
+    A[:] = values
+
+def radix_argsort_np(keys, bits=8):
+    """
+    Return NumPy array of indices that would (stably) sort NumPy array of
+    non-negative integer keys, using one pass for each digit of bits bits
+    (at most 16).
+    """
+    import numpy as np
+    if bits > 16:
+        raise ValueError('bits must be no more than 16')
+    keys = np.asarray(keys)
+    order = np.arange(len(keys))
+    if len(keys) < 2:
+        return order
+    if keys.min() < 0:
+        raise ValueError('radix_argsort_np() requires non-negative integer keys')
+
+    digit_type = np.uint8 if bits <= 8 else np.uint16
+    mask = (1 << bits) - 1
+    passes = max(1, -(-int(keys.max()).bit_length() // bits))
+    current = keys
+    for p in range(passes):
+        digits = ((current >> (p * bits)) & mask).astype(digit_type)
+        step = np.argsort(digits, kind='stable')
+        order = order[step]
+        current = current[step]
+    return order
+
+def radix_sort_np(A, bits=8):
+    """Return NumPy array with non-negative integers of A in ascending order."""
+    import numpy as np
+    keys = np.asarray(A)
+    return keys[radix_argsort_np(keys, bits)]
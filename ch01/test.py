@@ -201,6 +201,92 @@ class TestChapter1(unittest.TestCase):
         with self.assertRaises(IndexError):
             linear_median([])
 
+    def test_radix_sort(self):
+        from multiprocessing import Pool
+        from algs.modeling import numpy_error
+        from ch01.radix import radix_sort, digit_histograms, parallel_histograms
+
+        A = [random.randrange(2**40) for _ in range(1000)] + [0, 0, 2**40 - 1]
+        B = list(A)
+        radix_sort(B)
+        self.assertEqual(sorted(A), B)
+        B = list(A)
+        radix_sort(B, bits=11)
+        self.assertEqual(sorted(A), B)
+
+        # stable when sorting records by key
+        records = [(random.randrange(10), i) for i in range(500)]
+        radix_sort(records, key=lambda r: r[0])
+        self.assertEqual(sorted(records, key=lambda r: r[0]), records)
+
+        self.assertEqual([[1, 1, 1, 0], [2, 1, 0, 0]], digit_histograms([0, 1, 6], 2, 2))
+        with Pool(processes=2) as pool:
+            self.assertEqual(digit_histograms(A, 8, 5), parallel_histograms(A, 8, 5, 3, pool=pool))
+            B = list(A)
+            radix_sort(B, workers=2, pool=pool)
+            self.assertEqual(sorted(A), B)
+
+        B = []
+        radix_sort(B)
+        self.assertEqual([], B)
+        with self.assertRaises(ValueError):
+            radix_sort([3, -1])
+
+        if not numpy_error:
+            import numpy as np
+            from ch01.radix import radix_sort_np, radix_argsort_np
+            a = np.array([random.randrange(2**32) for _ in range(1000)], dtype=np.uint32)
+            self.assertTrue((np.sort(a) == radix_sort_np(a)).all())
+            self.assertTrue((np.sort(a) == radix_sort_np(a, bits=16)).all())
+            keys = np.array([3, 1, 3, 1, 2])
+            self.assertEqual([1, 3, 4, 0, 2], list(radix_argsort_np(keys)))
+
+    def test_select_kth(self):
+        from ch01.challenge import select_kth, select_quantiles, quantile_rank, partition3
+        from ch01.challenge import median_of_medians
+
+        for n in [1, 2, 5, 6, 101, 1000]:
+            A = list(range(n))
+            random.shuffle(A)
+            for k in [0, n // 2, n - 1]:
+                B = list(A)
+                self.assertEqual(k, select_kth(B, k))
+                self.assertTrue(all(v < k for v in B[:k]))
+                self.assertTrue(all(v > k for v in B[k+1:]))
+
+        # adversarial: duplicates and sorted data
+        self.assertEqual(7, select_kth([7] * 5000, 2500))
+        A = [i % 3 for i in range(3001)]
+        self.assertEqual(1, select_kth(A, 1500))
+        self.assertEqual(2500, select_kth(list(range(5001)), 2500))
+
+        A = list(range(100))
+        random.shuffle(A)
+        idx = median_of_medians(A, 0, 99)
+        self.assertTrue(30 <= A[idx] <= 69)
+
+        A = [3, 1, 3, 2, 3, 0]
+        (lt, gt) = partition3(A, 0, 5, 0)
+        self.assertEqual((3, 5), (lt, gt))
+
+        self.assertEqual(499, quantile_rank(0.5, 1000))
+        self.assertEqual(0, quantile_rank(0, 1000))
+        self.assertEqual(999, quantile_rank(1, 1000))
+        A = list(range(1000))
+        random.shuffle(A)
+        self.assertEqual([499, 899, 989], select_quantiles(A, [0.5, 0.9, 0.99]))
+        self.assertEqual([989, 499], select_quantiles(A, [0.99, 0.5]))
+
+        with self.assertRaises(IndexError):
+            select_kth([1, 2], 2)
+        with self.assertRaises(ValueError):
+            select_quantiles([1, 2], [1.5])
+
+    def test_run_selection_trial(self):
+        from ch01.challenge import run_selection_trial
+        tbl = run_selection_trial(max_k=11, output=False)
+        self.assertTrue(tbl.entry(1025, 'equal_select') < tbl.entry(1025, 'equal_linear'))
+
     def test_tournament_allows_odd(self):
         from ch01.challenge import tournament_allows_odd
         A = [3, 87 , 2]
@@ -256,6 +342,117 @@ class TestChapter1(unittest.TestCase):
             self.assertEqual(base2, tl_2)
             self.assertEqual(base2, to_2)
 
+    def test_tournament_top_k(self):
+        from ch01.largest_two import tournament_top_k, running_top_k, tournament_top_k_block
+        from algs.counting import RecordedItem
+
+        for n in [1, 2, 3, 11, 100, 1025]:
+            A = list(range(n))
+            random.shuffle(A)
+            k = min(n, 5)
+            self.assertEqual(sorted(A, reverse=True)[:k], tournament_top_k(A, k, block_size=16))
+            self.assertEqual(sorted(A, reverse=True)[:k], tournament_top_k(iter(A), k, block_size=7))
+        self.assertEqual([87, 3], tournament_top_k([3, 87, 2]))
+        self.assertEqual([9, 9, 9], tournament_top_k([9, 1, 9, 9, 2], k=3, block_size=2))
+
+        # top-k over a stream: state available after every block
+        stream = (i % 50 for i in range(200))
+        states = list(running_top_k(stream, 2, block_size=10))
+        self.assertEqual([[9, 8], [19, 18], [29, 28], [39, 38], [49, 48], [49, 48]], states[:6])
+        self.assertEqual([49, 49], states[9])
+
+        # N-1 + (k-1)*log N comparisons within a block
+        RecordedItem.clear()
+        A = RecordedItem.range(1024)
+        random.shuffle(A)
+        self.assertEqual(1023, tournament_top_k_block(A, 3)[0].val)
+        self.assertTrue(RecordedItem.report()[1] <= 1023 + 2*10)
+
+        with self.assertRaises(ValueError):
+            tournament_top_k([2], k=2)
+        with self.assertRaises(ValueError):
+            tournament_top_k([2], k=0)
+
+    def test_largest_two_parallel(self):
+        from array import array
+        from multiprocessing import Pool
+        from ch01.parallel import largest_two_parallel, shards, power_of_two_shards
+
+        self.assertEqual([(0, 2), (2, 5), (5, 7), (7, 10)], shards(10, 4))
+        self.assertEqual([(0, 1), (1, 2)], shards(2, 4))
+        self.assertEqual([(0, 4), (4, 8), (8, 10), (10, 11)], power_of_two_shards(11, 2))
+        for (N, workers) in [(1024, 3), (1000, 4), (7, 8), (1, 1)]:
+            ranges = power_of_two_shards(N, workers)
+            self.assertEqual(N, sum(hi - lo for (lo, hi) in ranges))
+            for (lo, hi) in ranges:
+                self.assertEqual(0, (hi - lo) & (hi - lo - 1))
+
+        A = list(range(1000))
+        random.shuffle(A)
+        with Pool(processes=2) as pool:
+            self.assertEqual((999, 998), largest_two_parallel(A, 4, pool=pool))
+            self.assertEqual((999, 998), largest_two_parallel(A[:1024], 4, pool=pool,
+                                                              algorithm=tournament_two))
+            self.assertEqual((2.5, 2), largest_two_parallel([1, 2.5, 2], 3, pool=pool))
+            self.assertEqual((1023, 1022), largest_two_parallel(list(range(1024)), 3, pool=pool,
+                                                                algorithm=tournament_two))
+            self.assertEqual((999, 998), largest_two_parallel(A, 3, pool=pool,
+                                                              algorithm=tournament_two))
+            self.assertEqual((2**64 - 1, 2**63), largest_two_parallel([1, 2**63, 2**64 - 1], 2,
+                                                                      pool=pool))
+            self.assertEqual((2.0**70, 5.0), largest_two_parallel([2**70, 5, -1], 2, pool=pool))
+            self.assertEqual((9.0, 8.0), largest_two_parallel(array('d', range(10)), 8, pool=pool))
+
+            ((first, second), compares) = largest_two_parallel(A, 4, pool=pool, count=True)
+            self.assertEqual((999, 998), (first, second))
+            self.assertTrue(compares <= 2*len(A) - 3)
+
+        with self.assertRaises(ValueError):
+            largest_two_parallel([1])
+
+        from ch01.book import run_largest_two_parallel_trials
+        tbl = run_largest_two_parallel_trials(workers=2, max_k=12, output=False)
+        self.assertTrue(tbl.entry(2048, 'Par. Compares') <= 2*2048 - 3)
+
+    def test_vectorized(self):
+        from algs.modeling import numpy_error
+        if numpy_error:
+            return
+        from array import array
+        from algs.counting import counters, clear_counters
+        from ch01.vectorized import largest_np, largest_two_np, tournament_two_np
+        from ch01.vectorized import largest_chunked, largest_two_chunked
+
+        for n in [2, 3, 7, 64, 1000]:
+            A = [random.random() for _ in range(n)]
+            buffer = array('d', A)
+            self.assertEqual(largest(A), largest_np(buffer))
+            self.assertEqual(largest_two(A), largest_two_np(buffer))
+            self.assertEqual(largest_two(A), tournament_two_np(buffer))
+            self.assertEqual(largest_two(A), largest_two_chunked(iter(A), chunk_size=5))
+            self.assertEqual(largest(A), largest_chunked(iter(A), chunk_size=5))
+
+            clear_counters()
+            tournament_two_np(buffer, count=True)
+            self.assertTrue(counters()['compare'] <= n - 1 + (n-1).bit_length())
+
+        self.assertEqual((5, 5), largest_two_np([5, 1, 5]))
+        self.assertEqual((5, 5), tournament_two_np([5, 1, 5]))
+
+        clear_counters()
+        largest_np([3, 1, 4, 1, 5], count=True)
+        largest_two_np([3, 1, 4, 1, 5], count=True)
+        self.assertEqual({'compare' : 4 + 7}, counters())
+
+        with self.assertRaises(ValueError):
+            largest_two_np([1])
+        with self.assertRaises(ValueError):
+            largest_two_chunked(iter([1]))
+
+        from ch01.timing import vectorized_trial
+        tbl = vectorized_trial(max_k=12, output=False)
+        self.assertTrue(tbl.entry(2048, 'largest_two_np') < tbl.entry(2048, 'largest_two'))
+
 #######################################################################
 if __name__ == '__main__':
     unittest.main()
@@ -9,8 +9,22 @@ operation.
 
 """
 
-import timeit
+import random
+
+from algs.bench import bench, input_cache
+from algs.modeling import numpy_error
 from algs.table import DataTable, SKIP
+from ch01.largest import largest
+from ch01.largest_two import largest_two
+from ch01.largest_two import sorting_two, tournament_two, tournament_two_object
+from ch01.largest_two import tournament_two_losers, tournament_two_linked
+
+def shuffled(n):
+    """Return list of integers from 0 to n-1 shuffled, using n as the random seed."""
+    random.seed(n)
+    x = list(range(n))
+    random.shuffle(x)
+    return x
 
 def timing_trial(output=True, decimals=3):
     """
@@ -21,49 +35,55 @@ def timing_trial(output=True, decimals=3):
     tbl = DataTable([8,8,8,8,8,8], ['N', 'Sorting', 'Tournament', 'Tourn. Object', 'Tourn. Linked', 'Tourn. Losers'], output=output, decimals=decimals)
 
     for n in [2 ** k for k in range(10, 24)]:
-        st_time = timeit.timeit(stmt='sorting_two(x)', setup='''
-import random
-from ch01.largest_two import sorting_two
-random.seed({0})
-x=list(range({0}))
-random.shuffle(x)'''.format(n), number=1)
-
-        tt_time = timeit.timeit(stmt='tournament_two(x)', setup='''
-import random
-from ch01.largest_two import tournament_two
-random.seed({0})
-x=list(range({0}))
-random.shuffle(x)'''.format(n), number=1)
+        st_time = bench(sorting_two, shuffled, (n,), repeat=1).min
+        tt_time = bench(tournament_two, shuffled, (n,), repeat=1).min
 
         if n > 1048576:
             tto_time = SKIP
         else:
-            tto_time = timeit.timeit(stmt='tournament_two_object(x)', setup='''
-import random
-from ch01.largest_two import tournament_two_object
-random.seed({0})
-x=list(range({0}))
-random.shuffle(x)'''.format(n), number=1)
+            tto_time = bench(tournament_two_object, shuffled, (n,), repeat=1).min
 
-        ttl_time = timeit.timeit(stmt='tournament_two_losers(x)', setup='''
-import random
-from ch01.largest_two import tournament_two_losers
-random.seed({0})
-x=list(range({0}))
-random.shuffle(x)'''.format(n), number=1)
-
-        ttll_time = timeit.timeit(stmt='tournament_two_linked(x)', setup='''
-import random
-from ch01.largest_two import tournament_two_linked
-random.seed({0})
-x=list(range({0}))
-random.shuffle(x)'''.format(n), number=1)
+        ttl_time = bench(tournament_two_losers, shuffled, (n,), repeat=1).min
+        ttll_time = bench(tournament_two_linked, shuffled, (n,), repeat=1).min
 
+        input_cache.discard(shuffled, n)
         tbl.row([n, st_time, tt_time, tto_time, ttll_time, ttl_time])
     return tbl
 
+def shuffled_floats(n):
+    """Return NumPy array containing shuffled(n) as float values."""
+    import numpy as np
+    return np.array(shuffled(n), dtype=float)
+
+def vectorized_trial(max_k=22, output=True, decimals=3):
+    """
+    Compare Python largest(), largest_two() and tournament_two() against their
+    NumPy-backed counterparts. Python versions are given lists, while NumPy
+    versions are given arrays with the same values. Times are in milliseconds.
+    """
+    if numpy_error:
+        return None
+    from ch01.vectorized import largest_np, largest_two_np, tournament_two_np
+
+    tbl = DataTable([8,8,8,8,8,8,8], ['N', 'largest', 'largest_np', 'largest_two', 'largest_two_np',
+                                      'tournament_two', 'tourn_two_np'], output=output, decimals=decimals)
+    for n in [2 ** k for k in range(10, max_k)]:
+        row = [n]
+        for func, funcnp in [(largest, largest_np), (largest_two, largest_two_np),
+                             (tournament_two, tournament_two_np)]:
+            row.append(1000 * bench(func, shuffled, (n,), repeat=3).min)
+            row.append(1000 * bench(funcnp, shuffled_floats, (n,), repeat=3).min)
+        input_cache.discard(shuffled, n)
+        input_cache.discard(shuffled_floats, n)
+        tbl.row(row)
+    return tbl
+
 #######################################################################
 if __name__ == '__main__':
+    print('Python versus NumPy-backed largest and largest_two.')
+    vectorized_trial()
+    print()
+
 
     print('Does tournament_two() beat sorting_two().')
     timing_trial()
@@ -0,0 +1,140 @@
+"""
+NumPy-backed versions of largest(), largest_two() and tournament_two().
+
+Each function operates on a contiguous buffer (a NumPy array, array.array,
+or anything else accepted by numpy.asarray()) so the comparisons are made
+by compiled loops rather than by the Python interpreter. When the values
+arrive from an iterator instead, largest_chunked() and largest_two_chunked()
+consume it in fixed-size chunks, so memory is bounded by the chunk size.
+
+The vectorized kernels make the same number of comparisons as the Python
+versions they replace. Pass count=True to add that number to the 'compare'
+counter of algs.counting:
+
+  * largest_np() - N-1 comparisons
+  * largest_two_np() - 2N-3 comparisons, the worst case of largest_two()
+  * tournament_two_np() - N-1 comparisons to find the winner, then one fewer
+    than the number of values that lost to the winner (at most ceil(log N))
+
+Unlike tournament_two(), tournament_two_np() works for any N >= 2; when a
+round has an odd number of values, the last one advances without a match.
+
+Requires numpy; check algs.modeling.numpy_error before use.
+"""
+from itertools import islice
+
+from algs.counting import increment
+
+CHUNK_SIZE = 65536
+
+def largest_np(A, count=False):
+    """Return largest value in A, which must not be empty."""
+    import numpy as np
+    values = np.asarray(A)
+    if len(values) == 0:
+        raise ValueError('Must have at least one value')
+    if count:
+        increment('compare', len(values) - 1)
+    return values.max().item()
+
+def largest_two_np(A, count=False):
+    """
+    Return two largest values in A. Locates the largest with one pass and then
+    the largest of the values on either side of it, without copying A.
+    """
+    import numpy as np
+    values = np.asarray(A)
+    N = len(values)
+    if N < 2:
+        raise ValueError('Must have at least two values')
+
+    idx = int(values.argmax())
+    my_max = values[idx]
+    if idx == 0:
+        second = values[1:].max()
+    elif idx == N-1:
+        second = values[:-1].max()
+    else:
+        second = max(values[:idx].max(), values[idx+1:].max())
+    if count:
+        increment('compare', 2*N - 3)
+    return (my_max.item(), second.item())
+
+def tournament_two_np(A, count=False):
+    """
+    Return two largest values in A using a tournament where each round is
+    computed with a single vectorized comparison. The second largest is the
+    largest of the values that lost directly to the winner.
+    """
+    import numpy as np
+    values = np.asarray(A)
+    N = len(values)
+    if N < 2:
+        raise ValueError('Must have at least two values')
+
+    # Each round records its (left, right) pairs; winners advance.
+    rounds = []
+    current = values
+    while len(current) > 1:
+        paired = len(current) - len(current) % 2
+        left = current[0:paired:2]
+        right = current[1:paired:2]
+        winners = np.maximum(left, right)
+        if paired < len(current):
+            winners = np.concatenate((winners, current[paired:]))
+        rounds.append((left, right))
+        current = winners
+
+    # Retrace path of winner, collecting everyone it beat.
+    losers = []
+    pos = 0
+    for (left, right) in reversed(rounds):
+        if pos == len(left):            # advanced without a match
+            pos = 2 * len(left)
+        elif left[pos] < right[pos]:
+            losers.append(left[pos])
+            pos = 2*pos + 1
+        else:
+            losers.append(right[pos])
+            pos = 2*pos
+
+    if count:
+        increment('compare', (N - 1) + (len(losers) - 1))
+    return (current[0].item(), max(losers).item())
+
+def chunks(iterable, chunk_size=CHUNK_SIZE, dtype=float):
+    """Generate NumPy arrays of (at most) chunk_size values from iterable."""
+    import numpy as np
+    it = iter(iterable)
+    while True:
+        chunk = np.fromiter(islice(it, chunk_size), dtype=dtype)
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+def largest_chunked(iterable, chunk_size=CHUNK_SIZE, dtype=float):
+    """Return largest value from iterable, processed chunk_size values at a time."""
+    my_max = None
+    for chunk in chunks(iterable, chunk_size, dtype):
+        val = largest_np(chunk)
+        if my_max is None or my_max < val:
+            my_max = val
+    if my_max is None:
+        raise ValueError('Must have at least one value')
+    return my_max
+
+def largest_two_chunked(iterable, chunk_size=CHUNK_SIZE, dtype=float):
+    """
+    Return two largest values from iterable, processed chunk_size values at a
+    time. The two largest of each chunk are merged with those found so far.
+    """
+    best = []
+    for chunk in chunks(iterable, chunk_size, dtype):
+        if len(chunk) == 1:
+            best.append(chunk[0].item())
+        else:
+            best.extend(largest_two_np(chunk))
+        best = sorted(best, reverse=True)[:2]
+    if len(best) < 2:
+        raise ValueError('Must have at least two values')
+    return tuple(best)
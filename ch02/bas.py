@@ -1,4 +1,5 @@
 """Binary Array Search implementation"""
+from bisect import bisect_left
 
 def binary_array_search(A, target):
     """
@@ -21,3 +22,48 @@ def binary_array_search(A, target):
             return mid
 
     return -(lo+1)
+
+def binary_array_search_batch(A, targets):
+    """
+    Return list containing binary_array_search(A, t) for each t in targets,
+    with the same contract: the location of t in ordered list A, or -x-1
+    when t would need to be inserted at location x. When t appears multiple
+    times in A, the location of its first occurrence is returned.
+
+    If A is a NumPy array, binary_array_search_np() is used instead. Each
+    search is performed by bisect_left(). When targets are in ascending
+    order (i.e., a sweep), each search begins where the previous one ended,
+    so only the remainder of A is searched.
+    """
+    if hasattr(A, 'searchsorted'):
+        return binary_array_search_np(A, targets)
+
+    N = len(A)
+    results = []
+    lo = 0
+    last = None
+    for t in targets:
+        if last is not None and t < last:
+            lo = 0                          # not in ascending order
+        idx = bisect_left(A, t, lo)
+        if idx < N and A[idx] == t:
+            results.append(idx)
+        else:
+            results.append(-(idx+1))
+        lo = idx
+        last = t
+    return results
+
+def binary_array_search_np(A, targets):
+    """
+    Return NumPy array containing binary_array_search(A, t) for each t in
+    targets, where A is an ordered NumPy array, using numpy.searchsorted().
+    """
+    import numpy as np
+    A = np.asarray(A)
+    targets = np.asarray(targets)
+    idx = np.searchsorted(A, targets, side='left')
+    if len(A) == 0:
+        return -(idx + 1)
+    found = (idx < len(A)) & (A[np.minimum(idx, len(A) - 1)] == targets)
+    return np.where(found, idx, -(idx + 1))
@@ -221,69 +221,103 @@ def growth_table(output=True):
         tbl.row([n, int(math.log(n)/math.log(2)), n, int(n*math.log(n)/math.log(2)), n*n, cubic_value, exp_value, fact_value])
     return tbl
 
-def generate_ch02():
-    """Generate tables/figures for chapter 02."""
-    chapter = 2
+CHAPTER = 2
 
+def table_1():
+    """Generate Table 2-1."""
     with TableNum(1) as table_number:
         process(actual_table(),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Prototype runtime performance')
 
+def table_2():
+    """Generate Table 2-2."""
     with TableNum(2) as table_number:
         process(prototype_table(),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Comparing different mathematical models against actual performance')
 
+def table_3():
+    """Generate Table 2-3."""
     with TableNum(3) as table_number:
         process(large_multiplication(),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Multiplying two n-digit integers')
 
+def figure_1():
+    """Generate Figure 2-1."""
     with FigureNum(1) as figure_number:
         print('Excel plot')
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
                'Compare models against performance')
 
+def figure_2():
+    """Generate Figure 2-2."""
     with FigureNum(2) as figure_number:
         algorithms_x_y()
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
                'Performance of algorithms X and Y on different computers')
 
+def figure_3():
+    """Generate Figure 2-3."""
     with FigureNum(3) as figure_number:
         print('Excel plots')
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
                'Visualizing the numbers from Figure 2-2')
 
+def table_4():
+    """Generate Table 2-4."""
     with TableNum(4) as table_number:
         process(growth_table(),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Growth of different computations')
 
+def figure_4():
+    """Generate Figure 2-4."""
     with FigureNum(4) as figure_number:
         print('by hand')
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
                'Doors of destiny!')
 
+def figure_5():
+    """Generate Figure 2-5."""
     with FigureNum(5) as figure_number:
         print('by hand')
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
                'Searching for 53 in a sorted array that contains the value.')
 
+def figure_6():
+    """Generate Figure 2-6."""
     with FigureNum(6) as figure_number:
         print('by hand')
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
                'Searching for 17 in a sorted array that does not contain the value.')
 
+def figure_7():
+    """Generate Figure 2-7."""
     with FigureNum(7) as figure_number:
         print('by hand')
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
                'All complexity classes are arranged in dominance hierarchy')
 
+def figure_8():
+    """Generate Figure 2-8."""
     with FigureNum(8) as figure_number:
-        print(caption(chapter, figure_number),
+        print(caption(CHAPTER, figure_number),
                'Runtime performance plotted against problem instance size for complexity classes')
 
+# Tables and Figures in book order. Each is generated independently, so
+# book.py can generate them in parallel.
+ELEMENTS = [
+    table_1, table_2, table_3, figure_1, figure_2, figure_3, table_4, figure_4,
+    figure_5, figure_6, figure_7, figure_8,
+]
+
+def generate_ch02():
+    """Generate tables/figures for chapter 02."""
+    for element in ELEMENTS:
+        element()
+
 #######################################################################
 if __name__ == '__main__':
     generate_ch02()
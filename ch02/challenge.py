@@ -4,8 +4,10 @@ Challenge Exercises for Chapter 2.
 
 import timeit
 import math
+import random
 
-from algs.table import DataTable, ExerciseNum, caption
+from algs.bench import bench, input_cache
+from algs.table import DataTable, ExerciseNum, caption, SKIP
 from algs.modeling import quadratic_model, log_model, numpy_error
 
 def fragment_1(N):
@@ -183,11 +185,22 @@ x=list(range({},0,-1))'''.format(n), number=10)
 
     return tbl
 
+def search_input(n, num):
+    """Return (x, targets): n sorted values from range(4n) and num random targets from 0 to 2n."""
+    x = sorted(random.sample(range(n*4), n))
+    return (x, [random.randint(0, n*2) for _ in range(num)])
+
 def performance_bas(max_k=22, output=True, decimals=3):
     """
     Generate performance tables for binary array search up to (but not including)
-    2**max_k.
+    2**max_k. T(N) is the time for 50,000 separate searches; the final columns
+    show the time for the same number of searches with a single call to
+    binary_array_search_batch() (for random and then ascending targets) and
+    binary_array_search_np(), all searching for the same targets in the same
+    values for a given N.
     """
+    from ch02.bas import binary_array_search_batch, binary_array_search_np
+
     # Train on five values...
     trials = [2**k for k in range(5,12)]
     xvals = []
@@ -211,7 +224,8 @@ x=sorted(random.sample(range({0}*4), {0}))'''.format(n), number=num)
         if output:
             print('Log N   = {:.12f}*log2(N)'.format(log_coeff[0]))
 
-    tbl = DataTable([15, 10, 10], ['N', 'T(N)', 'Model'], output=output, decimals=decimals)
+    tbl = DataTable([15, 10, 10, 10, 10, 10], ['N', 'T(N)', 'Model', 'Batch', 'Sweep', 'NumPy'],
+                    output=output, decimals=decimals)
     trials = [2**k for k in range(5,max_k)]
     for n in trials:
         search_time = timeit.timeit(stmt='binary_array_search(x, random.randint(0,{}*2))'.format(n),
@@ -220,7 +234,22 @@ import random
 from ch02.bas import binary_array_search        
 x=sorted(random.sample(range({0}*4), {0}))'''.format(n), number=num)
 
-        tbl.row([n, search_time, log_model(n, log_coeff[0])])
+        # the same number of searches, performed in a single batch, all on the same data
+        args = (n, num)
+        batch_time = bench(lambda data: binary_array_search_batch(*data),
+                           search_input, args, repeat=3).min
+        sweep_time = bench(lambda data: binary_array_search_batch(*data),
+                           search_input, args, repeat=3,
+                           prepare=lambda data: (data[0], sorted(data[1]))).min
+
+        numpy_time = SKIP
+        if not numpy_error:
+            numpy_time = bench(lambda data: binary_array_search_np(*data),
+                               search_input, args, repeat=3,
+                               prepare=lambda data: (np.array(data[0]), np.array(data[1]))).min
+        input_cache.discard(search_input, n, num)
+
+        tbl.row([n, search_time, log_model(n, log_coeff[0]), batch_time, sweep_time, numpy_time])
 
     return tbl
 
@@ -0,0 +1,216 @@
+"""
+Multiply large numbers stored as arrays of digits.
+
+ch02.mult relies on Python's built-in multiplication. This module stores each
+number as a list of its digits in base BASE, least significant digit first,
+so 1234 is [4, 3, 2, 1], and multiplies them with three strategies:
+
+  * schoolbook() - every digit of x times every digit of y, O(N^2)
+  * karatsuba() - three half-size products instead of four, O(N^1.585)
+  * toom3() - five third-size products instead of nine, O(N^1.465)
+
+Each strategy treats the digits as the coefficients of a polynomial and
+computes the coefficients of the product polynomial, which are only carried
+into digits once, at the end, by multiply(). Since the recursive strategies
+have more overhead than schoolbook() on small inputs, multiply() chooses the
+strategy for every (sub)product by comparing the number of digits against
+the crossover thresholds in THRESHOLDS. The defaults are only starting
+points; multiplication_crossovers(apply=True) in ch02.timing measures the
+crossovers on the current machine and stores them in THRESHOLDS.
+
+For very large operands, multiply_parallel() splits the longer one into shards
+that are multiplied by the other in separate worker processes.
+"""
+from multiprocessing import Pool
+
+BASE = 10
+
+# Smallest number of digits for which each strategy is used by multiply();
+# ch02.timing.multiplication_crossovers(apply=True) replaces these values.
+THRESHOLDS = {'karatsuba' : 48, 'toom3' : 96}
+
+# multiply_parallel() is no faster than multiply() on fewer digits than this.
+PARALLEL_THRESHOLD = 4096
+
+def to_digits(n, base=BASE):
+    """Return list of digits of non-negative integer n, least significant first."""
+    if n < 0:
+        raise ValueError('n must be non-negative')
+    if n == 0:
+        return [0]
+    digits = []
+    while n:
+        (n, d) = divmod(n, base)
+        digits.append(d)
+    return digits
+
+def from_digits(digits, base=BASE):
+    """Return integer whose digits (least significant first) are given."""
+    n = 0
+    for d in reversed(digits):
+        n = base*n + d
+    return n
+
+def carry(coeffs, base=BASE):
+    """
+    Return digits of the number whose (non-negative) coefficients are coeffs,
+    propagating the carry from each position to the next.
+    """
+    digits = []
+    c = 0
+    for v in coeffs:
+        (c, d) = divmod(v + c, base)
+        digits.append(d)
+    while c:
+        (c, d) = divmod(c, base)
+        digits.append(d)
+    while len(digits) > 1 and digits[-1] == 0:
+        digits.pop()
+    return digits if digits else [0]
+
+def _add(a, b):
+    """Return coefficients of a + b."""
+    if len(a) < len(b):
+        (a, b) = (b, a)
+    result = list(a)
+    for i, v in enumerate(b):
+        result[i] += v
+    return result
+
+def _sub(a, b):
+    """Return coefficients of a - b."""
+    result = list(a) + [0] * (len(b) - len(a))
+    for i, v in enumerate(b):
+        result[i] -= v
+    return result
+
+def _scale(a, k):
+    """Return coefficients of k*a."""
+    return [k*v for v in a]
+
+def _accumulate(result, a, shift):
+    """Add coefficients a to result, starting at location shift."""
+    for i, v in enumerate(a):
+        result[shift + i] += v
+
+def schoolbook(x, y):
+    """Return coefficients of product of x and y, multiplying every pair of digits."""
+    if not x or not y:
+        return []
+    result = [0] * (len(x) + len(y) - 1)
+    for i, xi in enumerate(x):
+        if xi:
+            for j, yj in enumerate(y):
+                result[i+j] += xi * yj
+    return result
+
+def karatsuba(x, y, thresholds=None):
+    """
+    Return coefficients of product of x and y. Split each into low and high
+    halves, x = x0 + x1*B^m, and compute x0*y0, x1*y1 and (x0+x1)*(y0+y1),
+    from which x0*y1 + x1*y0 is recovered by subtraction.
+    """
+    if not x or not y:
+        return []
+    m = max(len(x), len(y)) // 2
+    (x0, x1) = (x[:m], x[m:])
+    (y0, y1) = (y[:m], y[m:])
+
+    z0 = _multiply(x0, y0, thresholds)
+    z2 = _multiply(x1, y1, thresholds)
+    z1 = _sub(_sub(_multiply(_add(x0, x1), _add(y0, y1), thresholds), z0), z2)
+
+    result = [0] * (len(x) + len(y) - 1)
+    _accumulate(result, z0, 0)
+    _accumulate(result, z1[:len(result) - m], m)
+    _accumulate(result, z2, 2*m)
+    return result
+
+def toom3(x, y, thresholds=None):
+    """
+    Return coefficients of product of x and y. Split each into three parts,
+    x = x0 + x1*B^m + x2*B^2m, evaluate both at the points 0, 1, -1, 2 and
+    infinity, multiply the five pairs of values, and interpolate the five
+    parts of the product from these (divisions by 2 and 3 are exact).
+    """
+    if not x or not y:
+        return []
+    m = -(-max(len(x), len(y)) // 3)
+    (x0, x1, x2) = (x[:m], x[m:2*m], x[2*m:])
+    (y0, y1, y2) = (y[:m], y[m:2*m], y[2*m:])
+
+    def evaluate(p0, p1, p2):
+        """Return values of p0 + p1*t + p2*t^2 at t = 0, 1, -1, 2 and infinity."""
+        p02 = _add(p0, p2)
+        return (p0, _add(p02, p1), _sub(p02, p1),
+                _add(_add(p0, _scale(p1, 2)), _scale(p2, 4)), p2)
+
+    products = [_multiply(a, b, thresholds)
+                for (a, b) in zip(evaluate(x0, x1, x2), evaluate(y0, y1, y2))]
+    (v0, v1, vm1, v2, vinf) = products
+
+    # product is r0 + r1*t + r2*t^2 + r3*t^3 + r4*t^4 where r0 = v0 and r4 = vinf
+    r13 = [v // 2 for v in _sub(v1, vm1)]                           # r1 + r3
+    r2 = _sub([v // 2 for v in _add(v1, vm1)], _add(v0, vinf))
+    r14 = [v // 2 for v in _sub(_sub(v2, _add(v0, _scale(vinf, 16))),
+                                _scale(r2, 4))]                     # r1 + 4*r3
+    r3 = [v // 3 for v in _sub(r14, r13)]
+    r1 = _sub(r13, r3)
+
+    result = [0] * (len(x) + len(y) - 1)
+    for (k, r) in enumerate((v0, r1, r2, r3, vinf)):
+        _accumulate(result, r[:max(0, len(result) - k*m)], k*m)
+    return result
+
+def _multiply(x, y, thresholds=None):
+    """Return coefficients of product of x and y, choosing the strategy by size."""
+    if thresholds is None:
+        thresholds = THRESHOLDS
+    n = min(len(x), len(y))
+    if n >= thresholds['toom3']:
+        return toom3(x, y, thresholds)
+    if n >= thresholds['karatsuba']:
+        return karatsuba(x, y, thresholds)
+    return schoolbook(x, y)
+
+def multiply(x, y, thresholds=None, base=BASE):
+    """
+    Return digits of the product of the numbers whose digits are x and y.
+    When given, thresholds replaces THRESHOLDS; for example, use
+    {'karatsuba' : 2, 'toom3' : float('inf')} to use only karatsuba().
+    """
+    return carry(_multiply(x, y, thresholds), base)
+
+def _multiply_shard(shard, y, thresholds):
+    """Worker: return coefficients of the product of shard and y."""
+    return _multiply(shard, y, thresholds)
+
+def multiply_parallel(x, y, workers=4, pool=None, thresholds=None, base=BASE):
+    """
+    Return multiply(x, y), computed by splitting the longer of x and y into
+    (at most) workers shards whose products with the other are computed in
+    separate processes, then added together at their offsets. When pool is
+    None, a new Pool is created (and closed) for just this call.
+    """
+    if len(x) < len(y):
+        (x, y) = (y, x)
+    if workers < 2 or len(x) < PARALLEL_THRESHOLD:
+        return multiply(x, y, thresholds, base)
+
+    size = -(-len(x) // workers)
+    offsets = range(0, len(x), size)
+    tasks = [(x[lo:lo+size], y, thresholds) for lo in offsets]
+    if pool is None:
+        with Pool(processes=len(tasks)) as own_pool:
+            results = own_pool.starmap(_multiply_shard, tasks)
+    else:
+        results = pool.starmap(_multiply_shard, tasks)
+
+    total = [0] * (len(x) + len(y) - 1)
+    for (lo, coeffs) in zip(offsets, results):
+        _accumulate(total, coeffs, lo)
+    return carry(total, base)
+
+def mult_pair_digits(pair, thresholds=None):
+    """Return the product of two non-negative integers, computed by multiply()."""
+    return from_digits(multiply(to_digits(pair[0]), to_digits(pair[1]), thresholds))
@@ -0,0 +1,177 @@
+"""
+Static search indexes built once from a sorted list, which store its values
+in a layout that is friendlier to the cache than the sorted list itself.
+
+Binary Array Search on a large sorted list probes locations far apart from
+each other, each one likely a cache miss. These layouts place the values
+that are probed together next to each other:
+
+  * EytzingerIndex stores the values in breadth-first order of the implicit
+    binary search tree (as in a heap): the root is at location 1 and the
+    children of location k are at 2k and 2k+1.
+  * BTreeIndex stores the values in nodes of B values each (a B-tree stored
+    in an array); node i is followed by its B+1 children starting at node
+    i*(B+1)+1. Each node is searched with bisect, and only log_{B+1} N
+    nodes are visited instead of log_2 N locations.
+
+Values are stored in an array.array (typecode 'q' for integers and 'd' for
+floats), or in a list for other comparable values, including integers too
+large for 'q'. Both indexes offer the same operations:
+
+  * search(target) - same result as ch02.bas.binary_array_search()
+  * range(target) - same result as ch02.challenge.best_range()
+  * lower_bound(target) - location of first value >= target in sorted list
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+
+def _storage(values):
+    """
+    Return values stored in array.array when possible, otherwise in a list.
+    Typecode 'd' is only used when every value is a float, since integers
+    that do not fit in 'q' would lose precision.
+    """
+    try:
+        return array('q', values)
+    except (TypeError, OverflowError):
+        pass
+    if all(isinstance(v, float) for v in values):
+        return array('d', values)
+    return list(values)
+
+class _StaticIndex:
+    """
+    Operations shared by the static search indexes. Each subclass provides
+    _bound(target, strict), which returns (idx, value) where idx is the
+    location in the sorted list of the first value >= target (or > target
+    when strict is True), or N if there is none, in which case value is None.
+    """
+    def __init__(self, A):
+        self.N = len(A)
+
+    def lower_bound(self, target):
+        """Return location in sorted list of first value >= target (N if none)."""
+        return self._bound(target, False)[0]
+
+    def upper_bound(self, target):
+        """Return location in sorted list of first value > target (N if none)."""
+        return self._bound(target, True)[0]
+
+    def search(self, target):
+        """
+        Return location of target in the sorted list, or -x-1 when target would
+        need to be inserted at location x. For a target that appears multiple
+        times, returns the location of its first occurrence.
+        """
+        (idx, value) = self._bound(target, False)
+        if idx < self.N and value == target:
+            return idx
+        return -(idx+1)
+
+    def range(self, target):
+        """Return (lo, hi) such that all values A[lo:hi+1] equal target, or None."""
+        (lo, value) = self._bound(target, False)
+        if lo == self.N or value != target:
+            return None
+        return (lo, self.upper_bound(target) - 1)
+
+    def __len__(self):
+        return self.N
+
+    def __contains__(self, target):
+        return self.search(target) >= 0
+
+class EytzingerIndex(_StaticIndex):
+    """Static search index storing sorted list A in Eytzinger (breadth-first) order."""
+    def __init__(self, A):
+        _StaticIndex.__init__(self, A)
+        order = [0] * (self.N + 1)          # order[k] is location in A of tree[k]
+
+        # in-order traversal of implicit tree assigns A's values in sorted order
+        idx = 0
+        k = 1
+        path = []
+        while path or k <= self.N:
+            if k <= self.N:
+                path.append(k)
+                k = 2*k
+            else:
+                k = path.pop()
+                order[k] = idx
+                idx += 1
+                k = 2*k + 1
+
+        values = [A[order[k]] for k in range(1, self.N + 1)]
+        self.tree = _storage(values[:1] + values)   # location 0 is unused
+        self.order = array('q', order)
+
+    def _bound(self, target, strict):
+        # The path through the tree is recorded in the bits of k: 0 for each
+        # left turn and 1 for each right turn. The answer is where the path
+        # last went left, so remove the trailing right turns and that left turn.
+        tree = self.tree
+        N = self.N
+        k = 1
+        if strict:
+            while k <= N:
+                k = 2*k + (not target < tree[k])
+        else:
+            while k <= N:
+                k = 2*k + (tree[k] < target)
+
+        k >>= (~k & (k+1)).bit_length()
+        if k == 0:
+            return (N, None)
+        return (self.order[k], tree[k])
+
+class BTreeIndex(_StaticIndex):
+    """Static search index storing sorted list A in a B-tree laid out in an array."""
+    def __init__(self, A, B=16):
+        _StaticIndex.__init__(self, A)
+        if B < 2:
+            raise ValueError('B must be at least 2')
+        self.B = B
+        self.num_nodes = -(-self.N // B)
+
+        # Slots in sorted order; the unused slots of the final nodes come last
+        # and repeat the largest value, with location N.
+        slots = []
+        self._in_order(0, slots)
+        order = [self.N] * (self.num_nodes * B)    # order[s] is location in A of keys[s]
+        for idx, slot in enumerate(slots[:self.N]):
+            order[slot] = idx
+        pad = A[-1] if self.N else 0
+        self.keys = _storage([A[i] if i < self.N else pad for i in order])
+        self.order = array('q', order)
+
+    def _in_order(self, node, slots):
+        """Append slots of subtree rooted at node to slots, in sorted order."""
+        if node >= self.num_nodes:
+            return
+        B = self.B
+        for j in range(B):
+            self._in_order(node*(B+1) + j + 1, slots)
+            slots.append(node*B + j)
+        self._in_order(node*(B+1) + B + 1, slots)
+
+    def _bound(self, target, strict):
+        # In each node, the first key >= target (or > target) is a candidate,
+        # and the search continues in the child just before it.
+        search = bisect_right if strict else bisect_left
+        B = self.B
+        keys = self.keys
+        order = self.order
+        found = self.N
+        slot = -1
+        node = 0
+        while node < self.num_nodes:
+            base = node * B
+            j = search(keys, target, base, base + B) - base
+            if j < B and order[base + j] < found:
+                found = order[base + j]
+                slot = base + j
+            node = node*(B+1) + j + 1
+
+        if found == self.N:
+            return (self.N, None)
+        return (found, keys[slot])
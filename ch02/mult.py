@@ -5,33 +5,51 @@ Multiply two n-digit numbers (where n is quite large) of the following form
 """
 import random
 
+# Strings with no more digits than this are converted directly by int().
+DIRECT_DIGITS = 1000
+
+_powers = {}
+
+def _power_of_ten(k):
+    """Return 10**k, remembering results since the same powers recur."""
+    if not k in _powers:
+        _powers[k] = 10 ** k
+    return _powers[k]
+
+def digits_to_int(s):
+    """
+    Return integer for string of decimal digits s. Long strings are split in
+    half and combined as high * 10**len(low) + low, which (unlike int() on
+    the whole string) is subquadratic and not limited to 4300 digits.
+    """
+    if len(s) <= DIRECT_DIGITS:
+        return int(s)
+    half = len(s) // 2
+    low = len(s) - half
+    return digits_to_int(s[:half]) * _power_of_ten(low) + digits_to_int(s[half:])
+
+def repeat_block(block, n):
+    """
+    Return n-digit integer formed by repeating the digits of string block,
+    truncated to n digits. The k full repetitions are block * (10**(k*b) - 1)
+    // (10**b - 1), for blocks of b digits, so no digit is added one by one.
+    """
+    b = len(block)
+    (k, r) = divmod(n, b)
+    full = int(block) * ((_power_of_ten(k*b) - 1) // (_power_of_ten(b) - 1))
+    if r == 0:
+        return full
+    return full * _power_of_ten(r) + int(block[:r])
+
 def create_pair(n):
     """Create a pair of n-digit integers, from 1-up and from 9-down."""
-    one = 0
-    two = 0
-    up = 1
-    down = 9
-    num_digits = 0
-    while num_digits < n:
-        one = 10*one + up
-        two = 10*two + down
-        up += 1
-        if up == 10: up = 1
-        down -= 1
-        if down == 0: down = 9
-        num_digits += 1
-
-    return [one, two]
+    return [repeat_block('123456789', n), repeat_block('987654321', n)]
 
 def create_random_pair(n):
     """Create a pair of n-digit integers, containing digits from 1-9 only."""
-    one = 0
-    two = 0
-    for _ in range(n):
-        one = 10*one + random.randint(1,9)
-        two = 10*two + random.randint(1,9)
-
-    return [one, two]
+    one = ''.join(random.choices('123456789', k=n))
+    two = ''.join(random.choices('123456789', k=n))
+    return [digits_to_int(one or '0'), digits_to_int(two or '0')]
 
 def mult_pair(pair):
     """Return the product of two, potentially large, numbers."""
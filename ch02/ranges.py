@@ -0,0 +1,172 @@
+"""
+Range queries over sorted lists.
+
+worst_range() and best_range() in ch02.challenge locate the range of one
+target value. RangeQuery generalizes this to all values v with lo <= v <= hi
+(both inclusive), and answers many such queries at once:
+
+  * count(lo, hi) - number of values in [lo, hi]
+  * iterate(lo, hi) - lazily generate the values in [lo, hi]
+  * count_many(queries) - counts for a list of (lo, hi) queries
+
+count_many() sorts the endpoints of all queries and locates them with one
+shared descent: once the middle endpoint is located, the endpoints below it
+are only searched for to its left, and those above it only to its right.
+
+When the same (lo, hi) queries are asked of several sorted lists, use
+CascadeQuery, which applies fractional cascading: a single binary search in
+the first list locates the endpoints in every other list with only a few
+additional comparisons each.
+"""
+from bisect import bisect_left, bisect_right
+
+def bisect_many(A, keys, strict=False):
+    """
+    Return list containing bisect_left(A, k) (or bisect_right(A, k) when strict
+    is True) for each k in keys, computed with a single shared descent of the
+    sorted keys. If A is a NumPy array, numpy.searchsorted() is used instead.
+    """
+    if hasattr(A, 'searchsorted'):
+        return list(A.searchsorted(keys, side='right' if strict else 'left'))
+
+    bisect = bisect_right if strict else bisect_left
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    results = [0] * len(keys)
+
+    # keys[order[klo:khi]] are all located within A[lo:hi]
+    pending = [(0, len(order), 0, len(A))]
+    while pending:
+        (klo, khi, lo, hi) = pending.pop()
+        if klo >= khi:
+            continue
+        mid = (klo + khi) // 2
+        pos = bisect(A, keys[order[mid]], lo, hi)
+        results[order[mid]] = pos
+        pending.append((klo, mid, lo, pos))
+        pending.append((mid+1, khi, pos, hi))
+    return results
+
+def _values(A, start, end):
+    """Generate A[start:end] without copying it."""
+    for i in range(start, end):
+        yield A[i]
+
+class RangeQuery:
+    """Answer range queries over sorted list A, which must not be modified."""
+    def __init__(self, A):
+        self.A = A
+
+    def span(self, lo, hi):
+        """Return (start, end) such that A[start:end] contains all values in [lo, hi]."""
+        start = bisect_left(self.A, lo)
+        return (start, max(start, bisect_right(self.A, hi, start)))
+
+    def count(self, lo, hi):
+        """Return number of values in [lo, hi]."""
+        (start, end) = self.span(lo, hi)
+        return end - start
+
+    def iterate(self, lo, hi):
+        """Generate the values in [lo, hi], in ascending order."""
+        (start, end) = self.span(lo, hi)
+        return _values(self.A, start, end)
+
+    def range(self, target):
+        """Return same result as best_range(A, target): (lo, hi) or None."""
+        (start, end) = self.span(target, target)
+        if start == end:
+            return None
+        return (start, end-1)
+
+    def spans(self, queries):
+        """Return list of span(lo, hi) for each (lo, hi) in queries."""
+        starts = bisect_many(self.A, [q[0] for q in queries])
+        ends = bisect_many(self.A, [q[1] for q in queries], strict=True)
+        return [(s, max(s, e)) for (s, e) in zip(starts, ends)]
+
+    def count_many(self, queries):
+        """Return list of count(lo, hi) for each (lo, hi) in queries."""
+        return [end - start for (start, end) in self.spans(queries)]
+
+    def iterate_many(self, queries):
+        """Return list of generators, one for the values of each (lo, hi) in queries."""
+        return [_values(self.A, start, end) for (start, end) in self.spans(queries)]
+
+class CascadeQuery:
+    """
+    Answer range queries over several sorted lists using fractional cascading.
+
+    Level i stores M[i], which merges lists[i] with every second value of
+    M[i+1]. For each location p in M[i], own[i][p] counts the values in
+    M[i][:p] that came from lists[i], and down[i][p] is the location in
+    M[i+1] of the first value >= M[i][p]. Once a target is located in M[i],
+    down[i] leads to within one location of where it belongs in M[i+1].
+    """
+    def __init__(self, lists):
+        if len(lists) == 0:
+            raise ValueError('Must have at least one list')
+        self.lists = lists
+        k = len(lists)
+        self.merged = [None] * k
+        self.own = [None] * k
+        self.down = [None] * k
+
+        below = []
+        for i in range(k-1, -1, -1):
+            (merged, own) = self._merge(lists[i], below[1::2])
+            self.merged[i] = merged
+            self.own[i] = own
+            self.down[i] = [bisect_left(below, v) for v in merged] + [len(below)]
+            below = merged
+
+    @staticmethod
+    def _merge(A, sampled):
+        """Return (merged values of A and sampled, prefix counts of values from A)."""
+        merged = []
+        own = [0]
+        i = j = 0
+        while i < len(A) or j < len(sampled):
+            if j == len(sampled) or (i < len(A) and A[i] <= sampled[j]):
+                merged.append(A[i])
+                i += 1
+            else:
+                merged.append(sampled[j])
+                j += 1
+            own.append(i)
+        return (merged, own)
+
+    def bounds(self, target, strict=False):
+        """
+        Return list containing bisect_left(lists[i], target) (or bisect_right()
+        when strict is True) for each list, using one binary search in total.
+        """
+        merged = self.merged
+        if strict:
+            pos = bisect_right(merged[0], target)
+        else:
+            pos = bisect_left(merged[0], target)
+
+        results = [self.own[0][pos]]
+        for i in range(1, len(merged)):
+            M = merged[i]
+            pos = self.down[i-1][pos]
+            if strict:
+                while pos > 0 and target < M[pos-1]:
+                    pos -= 1
+            else:
+                while pos > 0 and not M[pos-1] < target:
+                    pos -= 1
+            results.append(self.own[i][pos])
+        return results
+
+    def spans(self, lo, hi):
+        """Return list of (start, end) such that lists[i][start:end] holds the values in [lo, hi]."""
+        return [(s, max(s, e)) for (s, e) in zip(self.bounds(lo), self.bounds(hi, strict=True))]
+
+    def count(self, lo, hi):
+        """Return list containing the number of values in [lo, hi] for each list."""
+        return [end - start for (start, end) in self.spans(lo, hi)]
+
+    def iterate(self, lo, hi):
+        """Return list of generators, one for the values in [lo, hi] of each list."""
+        return [_values(A, start, end) for (A, (start, end)) in zip(self.lists, self.spans(lo, hi))]
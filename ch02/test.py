@@ -118,6 +118,185 @@ class TestChapter2(unittest.TestCase):
             self.assertIsNone(best_range(nums, i))
             self.assertIsNone(worst_range(nums, i))
 
+    def test_binary_array_search_batch(self):
+        from ch02.bas import binary_array_search, binary_array_search_batch
+        from algs.modeling import numpy_error
+
+        A = sorted(random.sample(range(400), 100))
+        targets = [random.randint(-5, 405) for _ in range(500)]
+        expected = [binary_array_search(A, t) for t in targets]
+        self.assertEqual(expected, binary_array_search_batch(A, targets))
+
+        targets.sort()
+        expected = [binary_array_search(A, t) for t in targets]
+        self.assertEqual(expected, binary_array_search_batch(A, targets))
+
+        self.assertEqual([-1, -1], binary_array_search_batch([], [3, 4]))
+        self.assertEqual([1, -4, 1], binary_array_search_batch([1, 3, 3, 5], [3, 4, 3]))
+
+        if not numpy_error:
+            import numpy as np
+            from ch02.bas import binary_array_search_np
+            self.assertEqual(expected, list(binary_array_search_np(np.array(A), np.array(targets))))
+            self.assertEqual(expected, list(binary_array_search_batch(np.array(A), targets)))
+            self.assertEqual([-1, -1], list(binary_array_search_np(np.array([]), [3, 4])))
+
+    def test_static_index(self):
+        from ch02.bas import binary_array_search
+        from ch02.challenge import best_range
+        from ch02.index import EytzingerIndex, BTreeIndex
+
+        for N in [0, 1, 2, 7, 16, 17, 100, 257]:
+            A = sorted(random.sample(range(4*N+1), N))
+            for idx in [EytzingerIndex(A), BTreeIndex(A), BTreeIndex(A, 3)]:
+                self.assertEqual(N, len(idx))
+                for t in range(-1, 4*N+3):
+                    self.assertEqual(binary_array_search(A, t), idx.search(t))
+
+            D = sorted(random.randint(0, N//4) for _ in range(N))
+            for idx in [EytzingerIndex(D), BTreeIndex(D), BTreeIndex(D, 3)]:
+                for t in range(-1, N//4 + 2):
+                    self.assertEqual(best_range(D, t), idx.range(t))
+
+        words = ['apple', 'banana', 'cherry', 'cherry', 'date']
+        for idx in [EytzingerIndex(words), BTreeIndex(words, 2)]:
+            self.assertEqual((2, 3), idx.range('cherry'))
+            self.assertEqual(-3, idx.search('blueberry'))
+            self.assertTrue('date' in idx)
+            self.assertEqual(5, idx.lower_bound('zebra'))
+
+        floats = [0.5, 1.5, 2.5]
+        self.assertEqual(1, BTreeIndex(floats).search(1.5))
+        self.assertEqual(-2, EytzingerIndex(floats).search(1.0))
+
+        big = [2**70, 2**70+1, 2**70+2]
+        for idx in [EytzingerIndex(big), BTreeIndex(big, 2)]:
+            self.assertEqual(1, idx.search(2**70+1))
+            self.assertEqual(-4, idx.search(2**70+3))
+
+        with self.assertRaises(ValueError):
+            BTreeIndex([1, 2, 3], B=1)
+
+    def test_run_index_analysis(self):
+        from ch02.timing import run_index_analysis
+        tbl = run_index_analysis(max_k=10, output=False)
+        self.assertTrue(tbl.entry(2**10, 'Eytzinger') > 0)
+
+    def test_range_query(self):
+        from bisect import bisect_left, bisect_right
+        from ch02.challenge import best_range
+        from ch02.ranges import RangeQuery, CascadeQuery, bisect_many
+
+        A = sorted(random.randint(0, 50) for _ in range(200))
+        rq = RangeQuery(A)
+        for t in range(-1, 53):
+            self.assertEqual(best_range(A, t), rq.range(t))
+
+        queries = [(random.randint(-2, 52), random.randint(-2, 52)) for _ in range(100)]
+        expected = [[v for v in A if lo <= v <= hi] for (lo, hi) in queries]
+        self.assertEqual([len(e) for e in expected], rq.count_many(queries))
+        self.assertEqual([len(e) for e in expected], [rq.count(lo, hi) for (lo, hi) in queries])
+        self.assertEqual(expected, [list(g) for g in rq.iterate_many(queries)])
+        self.assertEqual(expected[0], list(rq.iterate(*queries[0])))
+        self.assertEqual([], rq.count_many([]))
+        self.assertEqual(0, RangeQuery([]).count(1, 5))
+
+        keys = [random.randint(-2, 52) for _ in range(50)]
+        self.assertEqual([bisect_left(A, k) for k in keys], bisect_many(A, keys))
+        self.assertEqual([bisect_right(A, k) for k in keys], bisect_many(A, keys, strict=True))
+
+        lists = [sorted(random.randint(0, 50) for _ in range(random.randint(0, 60)))
+                 for _ in range(5)]
+        cq = CascadeQuery(lists)
+        for x in range(-1, 53):
+            self.assertEqual([bisect_left(L, x) for L in lists], cq.bounds(x))
+            self.assertEqual([bisect_right(L, x) for L in lists], cq.bounds(x, strict=True))
+        self.assertEqual([RangeQuery(L).count(10, 30) for L in lists], cq.count(10, 30))
+        self.assertEqual([[v for v in L if 10 <= v <= 30] for L in lists],
+                         [list(g) for g in cq.iterate(10, 30)])
+
+        with self.assertRaises(ValueError):
+            CascadeQuery([])
+
+    def test_run_range_query_analysis(self):
+        from ch02.timing import run_range_query_analysis
+        tbl = run_range_query_analysis(max_k=10, output=False)
+        self.assertTrue(tbl.entry(2**10, 'count_many') > 0)
+
+    def test_digits(self):
+        import ch02.digits
+        from ch02.digits import (to_digits, from_digits, carry, schoolbook, karatsuba,
+                                 toom3, multiply, multiply_parallel, mult_pair_digits)
+        from ch02.mult import create_random_pair
+
+        self.assertEqual([4, 3, 2, 1], to_digits(1234))
+        self.assertEqual([0], to_digits(0))
+        self.assertEqual(1234, from_digits([4, 3, 2, 1]))
+        self.assertEqual([0, 0, 1], carry([10, 9]))
+        self.assertEqual([0], multiply([0], [7]))
+        with self.assertRaises(ValueError):
+            to_digits(-1)
+
+        inf = float('inf')
+        strategies = [None, {'karatsuba' : 2, 'toom3' : inf}, {'karatsuba' : 2, 'toom3' : 3},
+                      {'karatsuba' : inf, 'toom3' : 3}]
+        for n in [1, 2, 3, 5, 17, 100, 301]:
+            (a, b) = create_random_pair(n)
+            for c in [b, b // 10**(n//2) or 1, 7]:      # balanced and unbalanced
+                (x, y) = (to_digits(a), to_digits(c))
+                self.assertEqual(a*c, from_digits(carry(schoolbook(x, y))))
+                self.assertEqual(a*c, from_digits(carry(karatsuba(x, y))))
+                self.assertEqual(a*c, from_digits(carry(toom3(x, y))))
+                for thresholds in strategies:
+                    self.assertEqual(a*c, from_digits(multiply(x, y, thresholds)))
+                    self.assertEqual(a*c, from_digits(multiply(y, x, thresholds)))
+            self.assertEqual(a*b, mult_pair_digits([a, b]))
+
+        saved = ch02.digits.PARALLEL_THRESHOLD
+        try:
+            ch02.digits.PARALLEL_THRESHOLD = 10
+            (a, b) = create_random_pair(200)
+            self.assertEqual(a*b, from_digits(multiply_parallel(to_digits(a), to_digits(b), workers=3)))
+        finally:
+            ch02.digits.PARALLEL_THRESHOLD = saved
+
+    def test_multiplication_crossovers(self):
+        from ch02.timing import multiplication_crossovers
+        import ch02.digits
+        saved = dict(ch02.digits.THRESHOLDS)
+        try:
+            (tbl, thresholds) = multiplication_crossovers(max_k=5, num=1, output=False, apply=True)
+            self.assertTrue(tbl.entry(32, 'Schoolbook') > 0)
+            self.assertEqual(['karatsuba', 'toom3'], sorted(thresholds))
+            self.assertTrue(thresholds['toom3'] >= thresholds['karatsuba'])
+            self.assertEqual(thresholds, ch02.digits.THRESHOLDS)
+        finally:
+            ch02.digits.THRESHOLDS.update(saved)
+
+    def test_create_pair_large(self):
+        from ch02.mult import create_pair, create_random_pair, digits_to_int, repeat_block
+
+        for n in [0, 1, 9, 10, 2000, 5001]:
+            (up, down) = create_pair(n)
+            expected_up = ''.join(str(1 + i % 9) for i in range(n))
+            expected_down = ''.join(str(9 - i % 9) for i in range(n))
+            self.assertEqual(digits_to_int(expected_up or '0'), up)
+            self.assertEqual(digits_to_int(expected_down or '0'), down)
+
+        self.assertEqual(4545454, repeat_block('45', 7))
+        digits = ''.join(random.choice('0123456789') for _ in range(3333))
+        value = digits_to_int(digits)
+        self.assertEqual(int(digits[:1000]), value // 10**2333)
+        self.assertEqual(int(digits[-1000:]), value % 10**1000)
+
+        (one, two) = create_random_pair(5000)
+        for v in [one, two]:
+            self.assertTrue(10**4999 < v < 10**5000)
+            while v:                            # no digit is zero, so every block of
+                (v, d) = divmod(v, 10**500)     # 500 digits starts and ends with 1-9
+                self.assertTrue(10**499 < d)
+                self.assertNotEqual(0, d % 10)
+
 #######################################################################
 if __name__ == '__main__':
     unittest.main()
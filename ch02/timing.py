@@ -36,7 +36,9 @@ Generate timing results for inefficient sorting algorithms.
           11    137.0447     23.8533
 """
 
+import random
 import timeit
+from algs.bench import bench, input_cache
 from algs.table import DataTable
 from algs.modeling import numpy_error, factorial_model
 
@@ -107,11 +109,15 @@ x=list(range({}))
 random.shuffle(x)'''.format(n), number=1)
         tbl.row([n, sort_time, factorial_model(n, factorial_coeffs[0])])
 
-def incremental_multiplication(output=True):
+def incremental_multiplication(output=True, tune=False):
     """
     Compute results for multiplying large numbers.
     This takes several hours to run if you increment by 1. Instead, check powers of 2.
+    When tune is True, first run multiplication_crossovers() and apply the
+    thresholds it measures to ch02.digits.multiply().
     """
+    if tune:
+        multiplication_crossovers(output=output, apply=True)
     num = 1000
     tbl = DataTable([8,8,8], ['N', 'Min Mult', 'Max Mult'], decimals=5, output=output)
     for n in [2 ** k for k in range(3, 12)]:
@@ -122,6 +128,56 @@ pairs = [create_random_pair({}) for _ in range({})]'''.format(n,num), repeat=20,
         tbl.row([n, min(all_times), max(all_times)])
     return tbl
 
+def multiplication_crossovers(max_k=11, num=5, output=True, apply=False):
+    """
+    Sweep n-digit multiplications (for n from 8 up to 2**max_k) to find the
+    crossover thresholds for ch02.digits.multiply(). First one level of
+    Karatsuba (over schoolbook) is compared with schoolbook, which sets the
+    Karatsuba threshold; then one level of Toom-3 (over the tuned Karatsuba)
+    is compared with the tuned Karatsuba. Since timings are noisy, the
+    threshold for a strategy is the first n from which it is faster for three
+    consecutive sizes. The Toom-3 threshold is never below the Karatsuba one,
+    since multiply() would otherwise never use Karatsuba. When apply is True,
+    the thresholds replace those in ch02.digits.THRESHOLDS. Returns (tbl, thresholds).
+    """
+    from ch02.mult import create_random_pair
+    from ch02.digits import to_digits, multiply, THRESHOLDS
+    inf = float('inf')
+    tbl = DataTable([8,10,10,10,10], ['N', 'Schoolbook', 'OneKaratsuba', 'Karatsuba', 'Toom3'],
+                    decimals=5, output=output)
+
+    def best_time(x, y, karatsuba, toom3):
+        """Return smallest time to multiply x and y with given thresholds."""
+        thresholds = {'karatsuba' : karatsuba, 'toom3' : toom3}
+        return min(timeit.repeat(lambda: multiply(x, y, thresholds), repeat=num, number=1))
+
+    def crossover(sizes, slow, fast, run=3):
+        """Return first size starting run consecutive sizes where fast beats slow."""
+        wins = [f < s for (s, f) in zip(slow, fast)]
+        for i, n in enumerate(sizes):
+            if all(wins[i:i+run]):
+                return n
+        return inf
+
+    sizes = sorted(set(int(2 ** (k/4)) for k in range(12, 4*max_k + 1)))
+    pairs = [[to_digits(v) for v in create_random_pair(n)] for n in sizes]
+    school = [best_time(x, y, inf, inf) for (x, y) in pairs]
+    one_kara = [best_time(x, y, n, inf) for (n, (x, y)) in zip(sizes, pairs)]
+    k_threshold = max(2, crossover(sizes, school, one_kara))
+
+    kara = [best_time(x, y, k_threshold, inf) for (x, y) in pairs]
+    toom = [best_time(x, y, min(k_threshold, n+1), n) for (n, (x, y)) in zip(sizes, pairs)]
+    thresholds = {'karatsuba' : k_threshold,
+                  'toom3' : max(k_threshold, crossover(sizes, kara, toom))}
+
+    for row in zip(sizes, school, one_kara, kara, toom):
+        tbl.row(row)
+    if output:
+        print('Crossover thresholds:', thresholds)
+    if apply:
+        THRESHOLDS.update(thresholds)
+    return (tbl, thresholds)
+
 def run_range_analysis(output=True):
     """Confirm O(log N) algorithm to find range of duplicates."""
     tbl = DataTable([8,8,8], ['N', 'O(N)', 'O(log N)'], decimals=7, output=output)
@@ -145,11 +201,106 @@ from ch02.challenge import worst_range
 
         tbl.row([n, worst_times, best_times])
 
+def index_input(n, num):
+    """Return (alist, targets, EytzingerIndex, BTreeIndex) for n even values and num targets."""
+    from ch02.index import EytzingerIndex, BTreeIndex
+    random.seed(0)
+    alist = list(range(0, 2*n, 2))
+    targets = [random.randint(0, 2*n) for _ in range(num)]
+    return (alist, targets, EytzingerIndex(alist), BTreeIndex(alist))
+
+def run_index_analysis(max_k=20, num=1000, output=True):
+    """
+    Compare throughput of binary_array_search() on a sorted list against the
+    cache-friendly layouts of ch02.index, reporting the time to search for
+    num random targets. Increase max_k (to 26 or so) for N into the tens of
+    millions, where cache misses dominate.
+    """
+    from ch02.bas import binary_array_search
+    tbl = DataTable([10,10,10,10], ['N', 'BAS', 'Eytzinger', 'BTree'],
+                    decimals=5, output=output)
+
+    def search_list(data):
+        """Search for every target in the sorted list."""
+        (alist, targets, _, _) = data
+        for t in targets:
+            binary_array_search(alist, t)
+
+    def search_index(pos):
+        """Return function that searches for every target in data[pos]."""
+        def search(data):
+            idx = data[pos]
+            for t in data[1]:
+                idx.search(t)
+        return search
+
+    for n in [2**k for k in range(10, max_k+1)]:
+        args = (n, num)
+        bas = bench(search_list, index_input, args, repeat=5).min
+        eytzinger = bench(search_index(2), index_input, args, repeat=5).min
+        btree = bench(search_index(3), index_input, args, repeat=5).min
+        input_cache.discard(index_input, n, num)
+        tbl.row([n, bas, eytzinger, btree])
+    return tbl
+
+def range_query_input(n, num, lists):
+    """
+    Return (queries, RangeQuery, list of RangeQuery, CascadeQuery) for num
+    random queries over one sorted list and over lists sorted lists of n values.
+    """
+    from ch02.ranges import RangeQuery, CascadeQuery
+    random.seed(0)
+    alist = sorted(random.randint(0, 4*n) for _ in range(n))
+    others = [sorted(random.randint(0, 4*n) for _ in range(n)) for _ in range(lists)]
+    queries = [sorted((random.randint(0, 4*n), random.randint(0, 4*n))) for _ in range(num)]
+    return (queries, RangeQuery(alist), [RangeQuery(a) for a in others], CascadeQuery(others))
+
+def run_range_query_analysis(max_k=18, num=1000, lists=8, output=True):
+    """
+    Time num range counts over a sorted list of N values, one query at a time
+    and as a batch sharing one descent. Then time the same num counts over
+    lists sorted lists, with one RangeQuery per list and with a CascadeQuery.
+    """
+    tbl = DataTable([10,10,10,10,10], ['N', 'count', 'count_many', 'separate', 'cascade'],
+                    decimals=5, output=output)
+
+    def single(data):
+        """Count each query with its own search."""
+        (queries, rq, _, _) = data
+        for (lo, hi) in queries:
+            rq.count(lo, hi)
+
+    def batch(data):
+        """Count all queries with one shared descent."""
+        (queries, rq, _, _) = data
+        rq.count_many(queries)
+
+    def separate(data):
+        """Count each query in every list with its own RangeQuery."""
+        (queries, _, rqs, _) = data
+        for (lo, hi) in queries:
+            for r in rqs:
+                r.count(lo, hi)
+
+    def cascade(data):
+        """Count each query in every list with fractional cascading."""
+        (queries, _, _, cq) = data
+        for (lo, hi) in queries:
+            cq.count(lo, hi)
+
+    for n in [2**k for k in range(10, max_k+1)]:
+        args = (n, num, lists)
+        row = [n] + [bench(func, range_query_input, args, repeat=5).min
+                     for func in (single, batch, separate, cascade)]
+        input_cache.discard(range_query_input, n, num, lists)
+        tbl.row(row)
+    return tbl
+
 #######################################################################
 if __name__ == '__main__':
 
-    print('Timing of Multiplication of n-digit numbers.')
-    incremental_multiplication()
+    print('Timing of Multiplication of n-digit numbers, after tuning crossover thresholds.')
+    incremental_multiplication(tune=True)
 
     print('Permutation Sort Trials (up to N=12): These can take Unusually Long.')
     run_permutation_sort_worst_case(12)
@@ -159,3 +310,9 @@ if __name__ == '__main__':
 
     print('Timing of finding range among duplicates.')
     run_range_analysis()
+
+    print('Timing of Binary Array Search against cache-friendly index layouts.')
+    run_index_analysis()
+
+    print('Timing of range counts, one at a time, batched, and cascaded.')
+    run_range_query_analysis()
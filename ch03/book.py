@@ -8,6 +8,8 @@
 """
 import timeit
 from algs.table import DataTable, caption, SKIP, comma, process, TableNum, FigureNum
+from algs.bench import bench, input_cache
+from algs.cache import row_cache
 from resources.english import english_words
 from ch03.base26 import search_for_base
 
@@ -232,96 +234,72 @@ def count_collisions(num_rows=0, output=True, decimals=1):
             break
     return tbl
 
+def build_hashtable(clazz, M):
+    """Return hashtable of type clazz, initially of size M, containing all English words."""
+    ht = clazz(M)
+    for w in english_words():
+        ht.put(w,w)
+    return ht
+
+def build_time(clazz, M, repeat, num):
+    """Time to build hashtable of type clazz, initially of size M, with all English words."""
+    words = english_words()
+    def build():
+        ht = clazz(M)
+        for w in words:
+            ht.put(w,w)
+    return bench(build, repeat=repeat, number=num).min
+
+def access_time(clazz, M, repeat, num):
+    """Time to get all English words from hashtable of type clazz, initially of size M."""
+    words = english_words()
+    def access(ht):
+        for w in words:
+            ht.get(w)
+    result = bench(access, build_hashtable, (clazz, M), repeat=repeat, number=num).min
+    input_cache.discard(build_hashtable, clazz, M)
+    return result
+
 def compare_dynamic_build_and_access_time(repeat=10, num=5, max_m=640000, output=True):
-    """Generate tables for build and access times for M up to (but not equal to) 640,000."""
+    """
+    Generate tables for build and access times for M up to (but not equal to) 640,000.
+    Rows are reused from the table cache, when enabled.
+    """
+    import ch03.hashtable_linked
+    import ch03.hashtable_open
+    from ch03.hashtable_linked import Hashtable as HTLL, DynamicHashtable as DHLL
+    from ch03.hashtable_open import Hashtable as HTOA, DynamicHashtable as DHOA
 
     # sufficient to allow 321,129 and to spare (divide by 0.75 to get 428,172).
     SUFF=428172
 
-    # When 'ht = HTLL(...) is inside the STMT, it measures BUILD TIME.
-    # When it is included in the setup, we are measuring ACCESS TIME.
-    ll_build = min(timeit.repeat(stmt='''
-ht = HTLL({})
-for w in words:
-    ht.put(w,w)'''.format(SUFF), setup='''
-from ch03.hashtable_linked import Hashtable as HTLL
-from resources.english import english_words
-words = english_words()''', repeat=repeat, number=num))/num
-
-    ll_access = min(timeit.repeat(stmt='''
-for w in words:
-    ht.get(w)''', setup='''
-from ch03.hashtable_linked import Hashtable as HTLL
-from resources.english import english_words
-ht = HTLL({})
-words = english_words()
-for w in words:
-    ht.put(w,w)'''.format(SUFF), repeat=repeat, number=num))/num
-
-    oa_build = min(timeit.repeat(stmt='''
-ht = HTOA({})
-for w in words:
-    ht.put(w,w)'''.format(SUFF), setup='''
-from ch03.hashtable_open import Hashtable as HTOA
-from resources.english import english_words
-words = english_words()''', repeat=repeat, number=num))/num
-
-    oa_access = min(timeit.repeat(stmt='''
-for w in words:
-    ht.get(w)''', setup='''
-from ch03.hashtable_open import Hashtable as HTOA
-from resources.english import english_words
-ht = HTOA({})
-words = english_words()
-for w in words:
-    ht.put(w,w)'''.format(SUFF), repeat=repeat, number=num))/num
-
+    cache = row_cache('ch03.compare_dynamic_build_and_access_time',
+                      [ch03.hashtable_linked, ch03.hashtable_open, build_time, access_time],
+                      (repeat, num))
     tbl = DataTable([8,10,10,10,10],['M', 'BuildLL', 'AccessLL', 'BuildOA', 'AccessOA'],
-                    output=output, decimals=3)
+                    output=output, decimals=3, cache=cache)
+
+    # Build time includes constructing the hashtable; access time uses a
+    # hashtable built (once) in advance.
+    fixed = tbl.cached_row('Fixed')
+    if fixed is None:
+        fixed = ['Fixed',
+                 build_time(HTLL, SUFF, repeat, num), access_time(HTLL, SUFF, repeat, num),
+                 build_time(HTOA, SUFF, repeat, num), access_time(HTOA, SUFF, repeat, num)]
 
     M = 625
     while M <= max_m:
-        t1_build = min(timeit.repeat(stmt='''
-ht = DHL({})
-for w in words:
-    ht.put(w,w)'''.format(M), setup='''
-from ch03.hashtable_linked import DynamicHashtable as DHL
-from resources.english import english_words
-words = english_words()''', repeat=repeat, number=num))/num
-
-        t1_access = min(timeit.repeat(stmt='''
-for w in words:
-    ht.get(w)''', setup='''
-from ch03.hashtable_linked import DynamicHashtable as DHL
-from resources.english import english_words
-ht = DHL({})
-words = english_words()
-for w in words:
-    ht.put(w,w)'''.format(M), repeat=repeat, number=num))/num
-
-        t2_build = min(timeit.repeat(stmt='''
-ht = DHL({})
-for w in words:
-    ht.put(w,w)'''.format(M), setup='''
-from ch03.hashtable_open import DynamicHashtable as DHL
-from resources.english import english_words
-words = english_words()''', repeat=repeat, number=num))/num
-
-        t2_access = min(timeit.repeat(stmt='''
-for w in words:
-    ht.get(w)''', setup='''
-from ch03.hashtable_open import DynamicHashtable as DHL
-from resources.english import english_words
-ht = DHL({})
-words = english_words()
-for w in words:
-    ht.put(w,w)'''.format(M), repeat=repeat, number=num))/num
+        row = tbl.cached_row(M)
+        if row is None:
+            row = [M,
+                   build_time(DHLL, M, repeat, num), access_time(DHLL, M, repeat, num),
+                   build_time(DHOA, M, repeat, num), access_time(DHOA, M, repeat, num)]
 
-        tbl.row([M, t1_build, t1_access, t2_build, t2_access])
+        tbl.row(row)
         M = M * 2
 
     tbl.format('M', 's')
-    tbl.row(['Fixed', ll_build, ll_access, oa_build, oa_access])
+    tbl.row(fixed)
     return tbl
 
 class CountableHash:
@@ -484,104 +462,132 @@ def perfect_trial(key):
             return idx
     return None
 
-def generate_ch03():
-    """Generate Tables and Figures for chapter 03."""
-    chapter = 3
+CHAPTER = 3
 
+def february_calendar():
+    """Generate calendar for February 2024 that starts the chapter."""
     # Starts without a formal figure number
     from ch03.months import print_month
     print_month('February', 2024)
 
+def figure_1():
+    """Generate Figure 3-1."""
     with FigureNum(1) as figure_number:
         description  = 'Array containing month lengths interspersed with unneeded -1 values'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         (_, day_array) = search_for_base()
         print('day_array =', day_array)
         print('{}. {}'.format(label, description))
         print()
 
+def table_1():
+    """Generate Table 3-1."""
     with TableNum(1) as table_number:
         process(generate_hash(),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Example hash() and hash code expressions for a table of size 15 (because of salting will be different from book)',
                 create_image=False)
 
+def figure_2():
+    """Generate Figure 3-2."""
     with FigureNum(2) as figure_number:
         description  = 'Structure of Hashtable storage after adding five (key, value) entries'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         sample_hashtable()
         print('{}. {}'.format(label, description))
         print()
 
+def table_2():
+    """Generate Table 3-2."""
     with TableNum(2) as table_number:
         process(time_results_open_addressing(),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Average performance to insert N keys into a Hashtable of size M (in milliseconds)',
                 yaxis='Time (in microseconds)')
 
+def figure_3():
+    """Generate Figure 3-3."""
     with FigureNum(3) as figure_number:
         description  = 'Structure of Hashtable linked list storage after adding five (key, value) pairs'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         sample_separate_chaining_hashtable()
         print('{}. {}'.format(label, description))
         print()
 
+def figure_4():
+    """Generate Figure 3-4."""
     with FigureNum(4) as figure_number:
         description  = 'Removing the first node in a linked list'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('hand-drawn image')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_5():
+    """Generate Figure 3-5."""
     with FigureNum(5) as figure_number:
         description  = 'Removing any other node in a linked list'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('hand-drawn image')
         print('{}. {}'.format(label, description))
         print()
 
+def table_3():
+    """Generate Table 3-3."""
     with TableNum(3) as table_number:
         process(count_collisions(),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Average performance when inserting N=321,129 keys into a Hashtable of size M as M decreases in size')
 
+def figure_6():
+    """Generate Figure 3-6."""
     with FigureNum(6) as figure_number:
         description  = 'For a fixed number of elements, N, the average and maximum chain length follow predictable paths'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('The result of plotting Table 3-3')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_7():
+    """Generate Figure 3-7."""
     with FigureNum(7) as figure_number:
         description  = 'Some entries can get "lost" if they are simply copied when M increases'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         sample_hashtable()
         sample_separate_chaining_hashtable()
         print('The above are original before resize.')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_8():
+    """Generate Figure 3-8."""
     with FigureNum(8) as figure_number:
         description  = 'Resulting Hashtable storage after successful resizing'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         sample_hashtable_resize()
         sample_separate_chaining_hashtable_resize()
         print('The above are original before resize.')
         print('{}. {}'.format(label, description))
         print()
 
+def table_4():
+    """Generate Table 3-4."""
     print('The following table takes hours to generate. Remove arguments for full table shown in book.')
     with TableNum(4) as table_number:
         process(compare_dynamic_build_and_access_time(repeat=1, num=5),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Comparing growing tables against fixed-size construction',
                 yaxis = 'Time (in ms)')
 
+def table_5():
+    """Generate Table 3-5."""
     with TableNum(5) as table_number:
         process(count_hash(),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Words whose addition causes a resize event, with total # of insertions and average number of times a word was inserted')
 
+def perfect_hashing_trials():
+    """Generate additional computations for perfect hashing."""
     print('Additional computations for perfect hashing for shakespeare example')
     perfect_shakespeare_trial('a')
     perfect_shakespeare_trial('by')
@@ -591,12 +597,27 @@ def generate_ch03():
     perfect_trial('watered')
     perfect_trial('not-a-word')
 
+def table_6():
+    """Generate Table 3-6."""
     with TableNum(6) as table_number:
         process(iteration_order(),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Order of words returned by hashtable iterators',
                 create_image = False)
 
+# Tables and Figures in book order. Each is generated independently, so
+# book.py can generate them in parallel.
+ELEMENTS = [
+    february_calendar, figure_1, table_1, figure_2, table_2, figure_3, figure_4,
+    figure_5, table_3, figure_6, figure_7, figure_8, table_4, table_5,
+    perfect_hashing_trials, table_6,
+]
+
+def generate_ch03():
+    """Generate Tables and Figures for chapter 03."""
+    for element in ELEMENTS:
+        element()
+
 #######################################################################
 if __name__ == '__main__':
     generate_ch03()
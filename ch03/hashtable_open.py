@@ -7,6 +7,7 @@
     open addressing hashtable must have M >= 2.
 """
 
+from algs.counting import increment
 from ch03.entry import Entry, MarkedEntry
 
 class Hashtable:
@@ -53,6 +54,40 @@ class Hashtable:
             if entry:
                 yield (entry.key, entry.value)
 
+class CountingHashtable(Hashtable):
+    """
+    Open Addressing Hashtable that counts each bucket inspected as a 'probe'
+    and each Entry created as an 'alloc' (see algs.counting).
+    """
+    def get(self, k):
+        """Retrieve value associated with key, k."""
+        hc = hash(k) % self.M       # First place it could be
+        increment('probe')
+        while self.table[hc]:
+            if self.table[hc].key == k:
+                return self.table[hc].value
+            hc = (hc + 1) % self.M
+            increment('probe')
+        return None                 # Couldn't find
+
+    def put(self, k, v):
+        """Associate value, v, with the key, k."""
+        hc = hash(k) % self.M       # First place it could be
+        increment('probe')
+        while self.table[hc]:
+            if self.table[hc].key == k:     # Overwrite if already here
+                self.table[hc].value = v
+                return
+            hc = (hc + 1) % self.M
+            increment('probe')
+
+        if self.N >= self.M - 1:
+            raise RuntimeError('Table is Full: cannot store {} -> {}'.format(k, v))
+
+        self.table[hc] = Entry(k, v)
+        increment('alloc')
+        self.N += 1
+
 class DynamicHashtable:
     """Open Addressing Hashtable that supports resizing."""
     def __init__(self, M=10):
@@ -686,6 +686,24 @@ class TestChapter3(unittest.TestCase):
         tbl = evaluate_DynamicHashtablePlusRemove(output=False)
         self.assertTrue(tbl.entry(512, 'Separate Chaining') <= tbl.entry(2048, 'Separate Chaining'))
 
+    def test_counting_hashtable(self):
+        from ch03.hashtable_open import CountingHashtable
+        from algs.counting import counters, clear_counters
+
+        clear_counters()
+        ht = CountingHashtable(7)
+        ht.put(1, 'one')
+        ht.put(8, 'eight')          # collides with 1
+        self.assertEqual({'alloc': 2, 'probe': 3}, counters())
+        self.assertEqual('eight', ht.get(8))
+        self.assertEqual(5, counters()['probe'])
+
+    def test_memory_comparison(self):
+        from ch03.timing import memory_comparison
+
+        tbl = memory_comparison(max_k=11, output=False)
+        self.assertTrue(tbl.entry(1024, 'DictKept') < tbl.entry(1024, 'LinkedKept'))
+
 #######################################################################
 if __name__ == '__main__':
     unittest.main()
@@ -39,6 +39,7 @@ import random
 
 from resources.english import english_words
 from algs.table import DataTable, comma, SKIP
+from algs.bench import bench_table, memory_labels
 from ch03.perfect.generated_dictionary import perfect_hash, G
 
 def time_results_linked(output=True, decimals=3):
@@ -210,6 +211,44 @@ def check_for_duplicates():
         hash_values[hc] = w
     print('Number of duplicate hashcodes found for dictionary:', clashes)
 
+def first_words(n):
+    """Return the first n English words."""
+    return english_words()[:n]
+
+def build_linked(words):
+    """Return separate chaining hashtable containing words."""
+    from ch03.hashtable_linked import DynamicHashtable
+    ht = DynamicHashtable(1023)
+    for w in words:
+        ht.put(w, w)
+    return ht
+
+def build_open(words):
+    """Return open addressing hashtable containing words."""
+    from ch03.hashtable_open import DynamicHashtable
+    ht = DynamicHashtable(1023)
+    for w in words:
+        ht.put(w, w)
+    return ht
+
+def build_dict(words):
+    """Return Python dict containing words."""
+    ht = {}
+    for w in words:
+        ht[w] = w
+    return ht
+
+def memory_comparison(max_k=19, output=True, decimals=2):
+    """
+    Compare time (in ms) to build hashtables of N words with the peak and
+    retained memory (in KB) they require.
+    """
+    tbl = DataTable([8] + [10]*9, ['N'] + memory_labels(['Linked', 'Open', 'Dict']),
+                    output=output, decimals=decimals)
+    bench_table(tbl, [2**k for k in range(10, max_k)], [build_linked, build_open, build_dict],
+                first_words, repeat=3, scale=1000, memory=True)
+    return tbl
+
 #######################################################################
 if __name__ == '__main__':
     print('Average search Times with separate chaining hashtables (time in ns)')
@@ -233,3 +272,7 @@ if __name__ == '__main__':
     print('Trying to find two words in the dictionary with the same Python hash() value')
     check_for_duplicates()
     print()
+
+    print('Compare time and memory needed to build hashtables.')
+    memory_comparison()
+    print()
@@ -6,18 +6,9 @@
    (C) 2021, George T. Heineman
 
 """
-import timeit
 
 from algs.table import DataTable, FigureNum, TableNum, process, caption
-
-# Executes 3*N/2 add operations and 3*N/2 remove_max operations for a total of 3*N
-def run_trials(clazz, N, factor):
-    """Run a single trial."""
-    stmt = '''
-from {0} import PQ 
-one_run(PQ({1}), {1}, {2})'''.format(clazz,N,factor)
-    return min(timeit.repeat(stmt=stmt, setup = 'from ch04.timing import one_run',
-                             repeat=5, number=10))/10
+from ch04.timing import run_trials
 
 def average_performance(max_n=65536, output=True, decimals=1):
     """Generate table of average performance for different PQ implementations."""
@@ -61,12 +52,13 @@ def average_performance(max_n=65536, output=True, decimals=1):
 
     if output:
         print()
-        print('Heap', tbl.best_model('Heap'))
-        print('OrderL', tbl.best_model('OrderL'))
-        print('Linked', tbl.best_model('Linked'))
-        print('OrderA', tbl.best_model('OrderA'))
-        print('Built-in', tbl.best_model('Built-in'))
-        print('Array', tbl.best_model('Array'))
+        models = tbl.best_models(['Heap', 'OrderL', 'Linked', 'OrderA', 'Built-in', 'Array'])
+        print('Heap', models['Heap'])
+        print('OrderL', models['OrderL'])
+        print('Linked', models['Linked'])
+        print('OrderA', models['OrderA'])
+        print('Built-in', models['Built-in'])
+        print('Array', models['Array'])
     return tbl
 
 def output_heap(h):
@@ -132,85 +124,105 @@ def heap_dequeue_animation():
 
         parent = child
 
-def generate_ch04():
-    """Generate tables/figures for chapter 04."""
-    chapter = 4
+CHAPTER = 4
 
+def figure_1():
+    """Generate Figure 4-1."""
     with FigureNum(1) as figure_number:
         description  = 'Waiting in a queue at a nightclub'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Redrawn by artist')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_2():
+    """Generate Figure 4-2."""
     with FigureNum(2) as figure_number:
         description  = 'modeling a nightclub queue with three nodes'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Redrawn by artist')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_3():
+    """Generate Figure 4-3."""
     with FigureNum(3) as figure_number:
         description  = 'Patrons can advance quicker with a purchased pass'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Redrawn by artist')
         print('{}. {}'.format(label, description))
         print()
 
+def table_1():
+    """Generate Table 4-1."""
     # For full book output, remove "max_n=16384". Added to reduce time to generate all.
     with TableNum(1) as table_number:
         process(average_performance(max_n=16384),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Average operation performance (time in ns) on problem instances of size N',
                 yaxis='Time (in nanoseconds)')
 
+def figure_4():
+    """Generate Figure 4-4."""
     with FigureNum(4) as figure_number:
         description  = 'O(log N) behavior of Heap outperforms O(N) behavior for other approaches'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Generated by Excel')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_5():
+    """Generate Figure 4-5."""
     with FigureNum(5) as figure_number:
         description  = 'A sample max binary heap'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         heap = initial_heap()
         output_heap(heap)
         print('Hand drawn')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_6():
+    """Generate Figure 4-6."""
     with FigureNum(6) as figure_number:
         description  = 'Determining levels needed for a binary heap with N entries'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Hand drawn')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_7():
+    """Generate Figure 4-7."""
     with FigureNum(7) as figure_number:
         description  = 'Which of these are valid binary max heaps?'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Hand drawn')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_8():
+    """Generate Figure 4-8."""
     with FigureNum(8) as figure_number:
         description  = 'The first step to inserting an entry is to place it in the next available position'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Hand drawn')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_9():
+    """Generate Figure 4-9."""
     with FigureNum(9) as figure_number:
         description  = 'The second step is to swim the entry up one level as needed'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Hand drawn')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_10():
+    """Generate Figure 4-10."""
     with FigureNum(10) as figure_number:
         description  = 'Third step swims the entry up one level as needed'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         heap2 = initial_heap()
         heap2.enqueue(12, 12)
         output_heap(heap2)
@@ -218,9 +230,11 @@ def generate_ch04():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_11():
+    """Generate Figure 4-11."""
     with FigureNum(11) as figure_number:
         description  = 'Adding an entry with priority 16 swims up to the top'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         heap3 = initial_heap()
         heap3.enqueue(12, 12)
         heap3.enqueue(16, 16)
@@ -229,37 +243,47 @@ def generate_ch04():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_12():
+    """Generate Figure 4-12."""
     with FigureNum(12) as figure_number:
         description  = 'The first step is to remove bottommost entry'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Hand drawn')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_13():
+    """Generate Figure 4-13."""
     with FigureNum(13) as figure_number:
         description  = 'Broken heap resulting from swapping last entry with level 0'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Hand drawn')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_14():
+    """Generate Figure 4-14."""
     with FigureNum(14) as figure_number:
         description  = 'Swap top entry with its left child which had a higher priority'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Hand drawn')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_15():
+    """Generate Figure 4-15."""
     with FigureNum(15) as figure_number:
         description  = 'Sink down an additional level'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Hand drawn')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_16():
+    """Generate Figure 4-16."""
     with FigureNum(16) as figure_number:
         description  = 'Resulting heap after sinking entry to its proper location'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         heap4 = initial_heap()
         heap4.enqueue(12, 12)
         heap4.enqueue(16, 16)
@@ -269,9 +293,11 @@ def generate_ch04():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_17():
+    """Generate Figure 4-17."""
     with FigureNum(17) as figure_number:
         description  = 'Storing a max binary heap in an array'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         heap4 = initial_heap()
         heap4.enqueue(12, 12)
         print(' -- |' + '|'.join([' {:>3} '.format(e.priority) for e in heap4.storage[1:heap4.N+1]]))
@@ -279,34 +305,56 @@ def generate_ch04():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_18():
+    """Generate Figure 4-18."""
     with FigureNum(18) as figure_number:
         description  = 'Changes to storage after enqueue in Figure 4-8'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         heap_enqueue_animation()
         print('{}. {}'.format(label, description))
         print()
 
+def figure_19():
+    """Generate Figure 4-19."""
     with FigureNum(19) as figure_number:
         description  = 'Changes to storage after dequeue in Figure 4-11'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         heap_dequeue_animation()
         print('{}. {}'.format(label, description))
         print()
 
+def figure_20():
+    """Generate Figure 4-20."""
     with FigureNum(20) as figure_number:
         description  = 'Using an array as a circular queue'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Hand drawn')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_21():
+    """Generate Figure 4-21."""
     with FigureNum(21) as figure_number:
         description  = 'A novel factorial heap structure'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Hand drawn')
         print('{}. {}'.format(label, description))
         print()
 
+# Tables and Figures in book order. Each is generated independently, so
+# book.py can generate them in parallel.
+ELEMENTS = [
+    figure_1, figure_2, figure_3, table_1, figure_4, figure_5, figure_6,
+    figure_7, figure_8, figure_9, figure_10, figure_11, figure_12, figure_13,
+    figure_14, figure_15, figure_16, figure_17, figure_18, figure_19, figure_20,
+    figure_21,
+]
+
+def generate_ch04():
+    """Generate tables/figures for chapter 04."""
+    for element in ELEMENTS:
+        element()
+
 #######################################################################
 if __name__ == '__main__':
     generate_ch04()
@@ -1,6 +1,7 @@
 """
 max binary Heap.
 """
+from algs.counting import instrument
 from ch04.entry import Entry
 
 class PQ:
@@ -83,3 +84,6 @@ class PQ:
         self.N -= 1
         self.sink(1)
         return max_entry.value
+
+# Instrumented PQ that counts compares, swaps and Entry allocations (see algs.counting).
+CountingPQ = instrument(PQ, less='compare', swap='swap', enqueue='alloc')
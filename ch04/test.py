@@ -379,6 +379,19 @@ class TestChapter4(unittest.TestCase):
             ordered.append(heapq.heappop(X).val)
         self.assertEqual(['A', 'B', 'C', 'D', 'E', 'F'], ordered)
 
+    def test_counting_heap_pq(self):
+        from ch04.heap import PQ, CountingPQ
+        from algs.counting import counters, clear_counters
+
+        clear_counters()
+        pq = CountingPQ(16)
+        self.assertTrue(isinstance(pq, PQ))
+        for i in range(16):
+            pq.enqueue(i, i)
+        self.assertEqual(16, counters()['alloc'])
+        self.assertEqual(list(range(15, -1, -1)), [pq.dequeue() for _ in range(16)])
+        self.assertTrue(counters()['compare'] >= counters()['swap'] > 0)
+
 #######################################################################
 if __name__ == '__main__':
     unittest.main()
@@ -18,7 +18,11 @@ Compare performance of resizable hashtables.
   32,768        6.55        6.88
 
 """
+import importlib
 import timeit
+
+from algs.bench import bench
+from algs.regression import record_run
 from algs.table import DataTable
 
 def build_up(pq, N):
@@ -38,21 +42,28 @@ def drain(pq, n=0):
         if n == 0:
             return
 
+def trial_timing(clazz, N, factor, initial=None):
+    """
+    Return Timing of runs of factor*N operations on a PQ from module clazz,
+    constructed with initial capacity (N when initial is None).
+    """
+    PQ = importlib.import_module(clazz).PQ
+    size = N if initial is None else initial
+    return bench(lambda: one_run(PQ(size), N, factor), repeat=5, number=10)
+
 def run_trials(clazz, N, factor):
     """Execute 3*N/2 add operations and 3*N/2 remove_max operations for a total of 3*N."""
-    stmt = '''
-from {0} import PQ 
-one_run(PQ({1}), {1}, {2})'''.format(clazz,N,factor)
-    return min(timeit.repeat(stmt=stmt,
-                setup='from ch04.timing import one_run', repeat=5, number=10))/10
+    return trial_timing(clazz, N, factor).min
 
 def run_dynamic_trials(clazz, N, factor):
     """Execute 3*N/2 add operations and 3*N/2 remove_max operations for a total of 3*N."""
-    stmt = '''
-from {} import PQ 
-one_run(PQ(256), {}, {})'''.format(clazz,N,factor)
-    return min(timeit.repeat(stmt=stmt, setup='from ch04.timing import one_run',
-                             repeat=5, number=10))/10
+    return trial_timing(clazz, N, factor, initial=256).min
+
+def record_samples(samples, label, N, timing, scale):
+    """Store scaled times of every repetition of timing as samples[(label, N)]; return scaled min."""
+    if samples is not None:
+        samples[(label, N)] = [scale * t for t in timing.times]
+    return scale * timing.min
 
 def one_run(pq, N, factor):
     """
@@ -68,9 +79,10 @@ def one_run(pq, N, factor):
     build_up(pq, N//2)       # back to 3/4 full
     drain(pq, 0)             # empty out...
 
-def trial_factorial_heap(max_n=32768, output=True, decimals=2):
+def trial_factorial_heap(max_n=32768, output=True, decimals=2, samples=None):
     """
-    Generate trial using factorial heap compared with regular heap up to but not including max_n
+    Generate trial using factorial heap compared with regular heap up to but not including max_n.
+    When samples is a dictionary, it receives the times of every repetition of each cell.
     """
     factor = 3
     base = 256
@@ -79,8 +91,10 @@ def trial_factorial_heap(max_n=32768, output=True, decimals=2):
     tbl = DataTable([10,8,8], ['N', 'Heap', 'FactHeap'], output=output, decimals=decimals)
     N = base
     while N < high:
-        heap  = 1000000*run_trials('ch04.heap', N, factor)/(factor*N)
-        fheap = 1000000*run_trials('ch04.factorial_heap', N, factor)/(factor*N)
+        scale = 1000000/(factor*N)
+        heap  = record_samples(samples, 'Heap', N, trial_timing('ch04.heap', N, factor), scale)
+        fheap = record_samples(samples, 'FactHeap', N,
+                               trial_timing('ch04.factorial_heap', N, factor), scale)
         tbl.row([N, heap, fheap])
 
         N *= 2
@@ -110,8 +124,11 @@ for i in range({0},0,-1):
     file.close()
     print('created file:', name)
 
-def dynamic_comparison(max_n=32768, output=True, decimals=2):
-    """Generate table for comparing resizable hashtable performance."""
+def dynamic_comparison(max_n=32768, output=True, decimals=2, samples=None):
+    """
+    Generate table for comparing resizable hashtable performance.
+    When samples is a dictionary, it receives the times of every repetition of each cell.
+    """
     T = 3
     base = 256
     high = max_n
@@ -121,8 +138,10 @@ def dynamic_comparison(max_n=32768, output=True, decimals=2):
     dheap = {}
     N = base
     while N <= high:
-        heap[N]  = 1000000*run_trials('ch04.heap', N, T)/(T*N)
-        dheap[N] = 1000000*run_dynamic_trials('ch04.dynamic_heap', N, T)/(T*N)
+        scale = 1000000/(T*N)
+        heap[N]  = record_samples(samples, 'Heap', N, trial_timing('ch04.heap', N, T), scale)
+        dheap[N] = record_samples(samples, 'DHeap', N,
+                                  trial_timing('ch04.dynamic_heap', N, T, initial=256), scale)
         tbl.row([N, heap[N], dheap[N]])
 
         N *= 2
@@ -131,10 +150,12 @@ def dynamic_comparison(max_n=32768, output=True, decimals=2):
 #######################################################################
 if __name__ == '__main__':
     print('Head-to-head comparison of binary heaps and factorial heaps.')
-    trial_factorial_heap()
+    samples = {}
+    record_run('ch04.trial_factorial_heap', trial_factorial_heap(samples=samples), samples)
 
     print('Evaluate performance of factorial heaps on enqueue.')
     factorial_heap_timing()
 
     print('Compare performance of resizable Heaps.')
-    dynamic_comparison()
+    samples = {}
+    record_run('ch04.dynamic_comparison', dynamic_comparison(samples=samples), samples)
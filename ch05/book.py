@@ -38,6 +38,7 @@ import random
 from algs.table import caption, FigureNum, TableNum
 
 from algs.table import DataTable
+from algs.cache import row_cache
 from algs.modeling import log_linear_model, linear_model, quadratic_model
 from algs.modeling import numpy_error
 
@@ -327,51 +328,69 @@ random.shuffle(A)'''.format(n), repeat=5, number=1)
                     t_min, t_is, t_max, quadratic_model(n, quadratric_is[0], quadratric_is[1])])
     return tbl
 
-def timing_nlogn_sorting(max_k=21, output=True, decimals=3):
-    """
-    Confirm N Log N performance of Merge Sort, Heap Sort, Quicksort and Python's built-in sort.
-    """
-    # Build model from Generate 5 data points
-    tbl = DataTable([12,10,10,10,10,10],
-                    ['N','MergeSort', 'Quicksort', 'HeapSort', 'TimSort', 'PythonSort'],
-                    output=output, decimals=decimals)
-
-    x = []
-    y_ms = []
-    y_qs = []
-    y_hs = []
-    y_ts = []
-    y_ps = []
-    for n in [2**k for k in range(8, 16)]:
-        t_ms = min(timeit.repeat(stmt='merge_sort(A)', setup='''
+def nlogn_sorting_trial(n):
+    """Return row of best times for Merge Sort, Quicksort, Heap Sort, TimSort and Python's sort."""
+    t_ms = min(timeit.repeat(stmt='merge_sort(A)', setup='''
 import random
 from ch05.merge import merge_sort
 A=list(range({}))
 random.shuffle(A)'''.format(n), repeat=10, number=1))
 
-        t_qs = min(timeit.repeat(stmt='quick_sort(A)', setup='''
+    t_qs = min(timeit.repeat(stmt='quick_sort(A)', setup='''
 import random
 from ch05.sorting import quick_sort
 A=list(range({}))
 random.shuffle(A)'''.format(n), repeat=10, number=1))
 
-        t_hs = min(timeit.repeat(stmt='heap_sort(A)', setup='''
+    t_hs = min(timeit.repeat(stmt='heap_sort(A)', setup='''
 import random
 from ch05.heapsort import heap_sort
 A=list(range({}))
 random.shuffle(A)'''.format(n), repeat=10, number=1))
 
-        t_ts = min(timeit.repeat(stmt='tim_sort(A)', setup='''
+    t_ts = min(timeit.repeat(stmt='tim_sort(A)', setup='''
 import random
 from ch05.timsort import tim_sort
 A=list(range({}))
 random.shuffle(A)'''.format(n), repeat=10, number=1))
 
-        t_ps = min(timeit.repeat(stmt='A.sort()', setup='''
+    t_ps = min(timeit.repeat(stmt='A.sort()', setup='''
 import random
 A=list(range({}))
 random.shuffle(A)'''.format(n), repeat=10, number=1))
 
+    return [n, t_ms, t_qs, t_hs, t_ts, t_ps]
+
+def timing_nlogn_sorting(max_k=21, output=True, decimals=3):
+    """
+    Confirm N Log N performance of Merge Sort, Heap Sort, Quicksort and Python's built-in sort.
+    Rows are reused from the table cache, when enabled.
+    """
+    import ch05.merge
+    import ch05.sorting
+    import ch05.heapsort
+    import ch05.timsort
+
+    cache = row_cache('ch05.timing_nlogn_sorting',
+                      [ch05.merge, ch05.sorting, ch05.heapsort, ch05.timsort, nlogn_sorting_trial])
+
+    # Build model from Generate 5 data points
+    tbl = DataTable([12,10,10,10,10,10],
+                    ['N','MergeSort', 'Quicksort', 'HeapSort', 'TimSort', 'PythonSort'],
+                    output=output, decimals=decimals, cache=cache)
+
+    x = []
+    y_ms = []
+    y_qs = []
+    y_hs = []
+    y_ts = []
+    y_ps = []
+    for n in [2**k for k in range(8, 16)]:
+        row = tbl.cached_row(n)
+        if row is None:
+            row = nlogn_sorting_trial(n)
+        [_, t_ms, t_qs, t_hs, t_ts, t_ps] = row
+
         x.append(n)
         y_ms.append(t_ms)
         y_qs.append(t_qs)
@@ -395,37 +414,10 @@ random.shuffle(A)'''.format(n), repeat=10, number=1))
         tbl.row([n, t_ms, t_qs, t_hs, t_ts, t_ps])
 
     for n in [2**k for k in range(16, max_k)]:
-        # selection is stable, so just run once
-        t_ms = min(timeit.repeat(stmt='merge_sort(A)', setup='''
-import random
-from ch05.merge import merge_sort
-A=list(range({}))
-random.shuffle(A)'''.format(n), repeat=10, number=1))
-
-        t_qs = min(timeit.repeat(stmt='quick_sort(A)', setup='''
-import random
-from ch05.sorting import quick_sort
-A=list(range({}))
-random.shuffle(A)'''.format(n), repeat=10, number=1))
-
-        t_hs = min(timeit.repeat(stmt='heap_sort(A)', setup='''
-import random
-from ch05.heapsort import heap_sort
-A=list(range({}))
-random.shuffle(A)'''.format(n), repeat=10, number=1))
-
-        t_ts = min(timeit.repeat(stmt='tim_sort(A)', setup='''
-import random
-from ch05.timsort import tim_sort
-A=list(range({}))
-random.shuffle(A)'''.format(n), repeat=10, number=1))
-
-        t_ps = min(timeit.repeat(stmt='A.sort()', setup='''
-import random
-A=list(range({}))
-random.shuffle(A)'''.format(n), repeat=10, number=1))
-
-        tbl.row([n, t_ms, t_qs, t_hs, t_ts, t_ps])
+        row = tbl.cached_row(n)
+        if row is None:
+            row = nlogn_sorting_trial(n)
+        tbl.row(row)
 
     if output:
         print('NLOGN MS = {}*N*N + {}*N'.format(nlogn_ms[0], nlogn_ms[1]))
@@ -507,13 +499,13 @@ def tim_sort_figure():
 
     print('size={:2d}\t'.format(size) + '|'.join([' {:>2} '.format(k) for k in A]))
 
-def generate_ch05():
-    """Generate Tables and Figures for chapter 05."""
-    chapter = 5
+CHAPTER = 5
 
+def figure_1():
+    """Generate Figure 5-1."""
     with FigureNum(1) as figure_number:
         description  = 'Sample array, A, to sort'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         A = [15, 21, 20, 2, 15, 24, 5, 19]
         print('|'.join([' {:>2} '.format(k) for k in A]))
         moves = [(0,3),(5,7),(1,6),None,(2,4),None,(4,5)]
@@ -525,9 +517,11 @@ def generate_ch05():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_2():
+    """Generate Figure 5-2."""
     with FigureNum(2) as figure_number:
         description  = 'Sorting sample array using Selection Sort'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         A = [15, 21, 20, 2, 15, 24, 5, 19]
         print('|'.join([' {:>2} '.format(k) for k in A]))
         moves = [(0,3),(1,6),(2,3),(3,4),(4,7),(5,7),(6,6)]
@@ -539,16 +533,20 @@ def generate_ch05():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_3():
+    """Generate Figure 5-3."""
     with FigureNum(3) as figure_number:
         description  = 'Visualizing the formula for triangle numbers: sum of 1 through 7 is 28'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('By hand')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_4():
+    """Generate Figure 5-4."""
     with FigureNum(4) as figure_number:
         description  = 'Sorting sample array using Insertion Sort'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         A = [15, 21, 20, 2, 15, 24, 5, 19]
         print('|'.join([' {:>2} '.format(k) for k in A]))
         moves = [None,[(2,1)], [(3,2),(2,1),(1,0)], [(4,3),(3,2)],
@@ -562,92 +560,129 @@ def generate_ch05():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_5():
+    """Generate Figure 5-5."""
     with FigureNum(5) as figure_number:
         # for actual results from book, use max_k=18 as an argument, but it will take hours.
         timing_selection_insertion()
         description  = 'Timing results of Insertion Sort and Selection Sort'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_6():
+    """Generate Figure 5-6."""
     with FigureNum(6) as figure_number:
         description  = 'Visualizing the recursive invocation of fact(3)'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Fact(3) = ', fact(3))
         print('Done by hand')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_7():
+    """Generate Figure 5-7."""
     with FigureNum(7) as figure_number:
         description  = 'Recursive invocation when calling rmax(0,3) on A=[15,21,20,2]'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Done by hand')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_8():
+    """Generate Figure 5-8."""
     with FigureNum(8) as figure_number:
         description  = 'Complete recursive invocation of rmax(0,7)'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Done by hand')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_9():
+    """Generate Figure 5-9."""
     with FigureNum(9) as figure_number:
         description  = 'Merging two stacks into one'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Done by hand')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_10():
+    """Generate Figure 5-10."""
     with FigureNum(10) as figure_number:
         description  = 'Step by step merge sort of two sorted sub-arrays of size 4'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Done by hand')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_11():
+    """Generate Figure 5-11."""
     with FigureNum(11) as figure_number:
         show_partition()
         description  = 'Results of partition(A,0,7,0) using A[0] as pivot'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_12():
+    """Generate Figure 5-12."""
     with FigureNum(12) as figure_number:
         description  = 'Full recursive invocation of Quicksort'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Done by hand')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_13():
+    """Generate Figure 5-13."""
     with FigureNum(13) as figure_number:
         heapsort_intuition()
         description  = 'Intuition behind how a max binary heap can be used for sorting'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_14():
+    """Generate Figure 5-14."""
     with FigureNum(14) as figure_number:
         show_heapify()
         description  = 'Converting array into a max binary heap'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def table_1():
+    """Generate Table 5-1."""
     with TableNum(1) as table_number:
         timing_nlogn_sorting()
         description  = 'Runtime performance (in seconds) for different sorting algorithms'
-        label = caption(chapter, table_number)
+        label = caption(CHAPTER, table_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_15():
+    """Generate Figure 5-15."""
     with FigureNum(15) as figure_number:
         tim_sort_figure()
         description  = 'Changes to array when applying Tim Sort with initial size of 4'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+# Tables and Figures in book order. Each is generated independently, so
+# book.py can generate them in parallel.
+ELEMENTS = [
+    figure_1, figure_2, figure_3, figure_4, figure_5, figure_6, figure_7,
+    figure_8, figure_9, figure_10, figure_11, figure_12, figure_13, figure_14,
+    table_1, figure_15,
+]
+
+def generate_ch05():
+    """Generate Tables and Figures for chapter 05."""
+    for element in ELEMENTS:
+        element()
+
 #######################################################################
 if __name__ == '__main__':
     generate_ch05()
@@ -1,6 +1,7 @@
 """
 Merge sort uses auxiliary storage
 """
+from algs.counting import increment
 
 def merge_sort(A):
     """Merge Sort implementation using auxiliary storage."""
@@ -83,3 +84,53 @@ def merge_sort_counting(A):
         return (nums, numc)
 
     return rsort( 0, len(A)-1)
+
+def merge_sort_instrumented(A):
+    """
+    Perform Merge Sort, accumulating 'compare', 'move' and 'alloc' counters
+    for the current thread (see algs.counting). Merge Sort never swaps: each
+    merge copies its values into auxiliary storage and then moves every one
+    of them back into A, so a 'move' counts each value written back to A.
+    """
+    aux = [None] * len(A)
+    increment('alloc')              # auxiliary storage
+    counts = [0, 0]                 # [compares, moves]
+
+    def rsort(lo, hi):
+        if hi <= lo:
+            return
+
+        mid = (lo+hi) // 2
+        rsort(lo, mid)
+        rsort(mid+1, hi)
+        merge(lo, mid, hi)
+
+    def merge(lo, mid, hi):
+        # copy results of sorted sub-problems into auxiliary storage
+        aux[lo:hi+1] = A[lo:hi+1]
+
+        left = lo        # starting index into left sorted sub-array
+        right = mid+1    # starting index into right sorted sub-array
+
+        numc = 0
+        for i in range(lo, hi+1):
+            if left > mid:
+                A[i] = aux[right]
+                right += 1
+            elif right > hi:
+                A[i] = aux[left]
+                left += 1
+            elif aux[right] < aux[left]:
+                numc += 1
+                A[i] = aux[right]
+                right += 1
+            else:
+                numc += 1
+                A[i] = aux[left]
+                left += 1
+        counts[0] += numc
+        counts[1] += hi - lo + 1
+
+    rsort(0, len(A)-1)
+    increment('compare', counts[0])
+    increment('move', counts[1])
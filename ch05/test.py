@@ -325,6 +325,19 @@ class TestChapter5(unittest.TestCase):
         tbl = modeling_insertion_worst_case(output=False)
         self.assertEqual(tbl.entry(128, 'Swaps'), tbl.entry(128, 'Comparisons'))
 
+    def test_merge_sort_instrumented(self):
+        from ch05.merge import merge_sort_instrumented, merge_sort_counting
+        from algs.counting import counters, clear_counters
+
+        clear_counters()
+        A = [5, 1, 4, 2, 3]
+        merge_sort_instrumented(A)
+        self.assertEqual([1, 2, 3, 4, 5], A)
+        self.assertEqual(1, counters()['alloc'])
+        self.assertEqual(merge_sort_counting([5, 1, 4, 2, 3])[1], counters()['compare'])
+        self.assertEqual(12, counters()['move'])    # merges of 2, 3, 2 and 5 values
+        self.assertFalse('swap' in counters())
+
 #######################################################################
 if __name__ == '__main__':
     unittest.main()
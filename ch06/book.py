@@ -329,139 +329,190 @@ def fibonacci_tree_sample():
     node = fibonacci_avl(6)
     print(tree_structure(node))
 
-def generate_ch06():
-    """Generate Tables and Figures for chapter 06."""
-    chapter = 6
+CHAPTER = 6
 
+def figure_1():
+    """Generate Figure 6-1."""
     with FigureNum(1) as figure_number:
         description  = 'Representing mathematical expressions using expression trees'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         mult7 = expression_tree()
         print(mult7,'=',mult7.eval())
         print('in postfix:', ' '.join(str(k) for k in mult7.postfix()))
         print('{}. {}'.format(label, description))
         print()
 
+def figure_2():
+    """Generate Figure 6-2."""
     with FigureNum(2) as figure_number:
         description  = 'Visualizing recursive evaluation of ((1+5)*9)'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         mult2 = debug_expression()
         print(mult2,'=',mult2.eval())
         print('{}. {}'.format(label, description))
         print()
 
+def table_1():
+    """Generate Table 6-1."""
     with TableNum(1) as table_number:
         process(generate_list_table(),
-                chapter, table_number,
+                CHAPTER, table_number,
                 'Comparing insert and remove performance of lists against binary search tree (time in ms)', yaxis="Time (in ms)")
 
+def figure_3():
+    """Generate Figure 6-3."""
     with FigureNum(3) as figure_number:
         description  = 'Binary Search Tree containing seven values'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def table_2():
+    """Generate Table 6-2."""
     with TableNum(2) as table_number:
         description  = 'Creating a binary search tree by inserting (in order) 19,14,15,53,58,3,26'
         speaking_tree()
-        label = caption(chapter, table_number)
+        label = caption(CHAPTER, table_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_4():
+    """Generate Figure 6-4."""
     with FigureNum(4) as figure_number:
         description  = 'Insert 29 into the binary search tree example'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_5():
+    """Generate Figure 6-5."""
     with FigureNum(5) as figure_number:
         description = 'Different binary search trees when same values are inserted in different order'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_6():
+    """Generate Figure 6-6."""
     with FigureNum(6) as figure_number:
         description  = 'Two possible binary search trees after removing 19 from Figure 6-4'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_7():
+    """Generate Figure 6-7."""
     with FigureNum(7) as figure_number:
         description  = 'Removing minimum value in a subtree'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def table_3():
+    """Generate Table 6-3."""
     with TableNum(3) as table_number:
         description  = 'Demonstrating how node is removed from binary search tree'
-        label = caption(chapter, table_number)
+        label = caption(CHAPTER, table_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_8():
+    """Generate Figure 6-8."""
     with FigureNum(8) as figure_number:
         description  = 'Iterating over the values in a binary search tree in ascending order'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_9():
+    """Generate Figure 6-9."""
     with FigureNum(9) as figure_number:
         description  = 'A complete binary tree stores the most values with the least height'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_10():
+    """Generate Figure 6-10."""
     with FigureNum(10) as figure_number:
         description = 'Unbalanced tree after two insertions.'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         show_unbalanced_result()
         print('{}. {}'.format(label, description))
         print()
 
+def figure_11():
+    """Generate Figure 6-11."""
     with FigureNum(11) as figure_number:
         description = 'Recursive invocation when inserting a value.'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_12():
+    """Generate Figure 6-12."""
     with FigureNum(12) as figure_number:
         description = 'Rebalancing this binary search tree by rotating the root node to the right'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_13():
+    """Generate Figure 6-13."""
     with FigureNum(13) as figure_number:
         description = 'Four different node rotations'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def table_4():
+    """Generate Table 6-4."""
     with TableNum(4) as table_number:
         description = 'Implementation of rotate left-right'
-        label = caption(chapter, table_number)
+        label = caption(CHAPTER, table_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_14():
+    """Generate Figure 6-14."""
     with FigureNum(14) as figure_number:
         description = 'Binary search tree as symbol table: keys are atomic numbers; values are element names'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         sample_binary_tree_as_symbol()
         print('{}. {}'.format(label, description))
         print()
 
+def figure_15():
+    """Generate Figure 6-15."""
     with FigureNum(15) as figure_number:
         description = 'Binary search tree as priority queue: priorities are atomic numbers; values are element names'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         sample_binary_tree_as_pq()
         print('{}. {}'.format(label, description))
         print()
 
+def figure_16():
+    """Generate Figure 6-16."""
     with FigureNum(16) as figure_number:
         description = 'A Fibonacci tree with twelve nodes'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         fibonacci_tree_sample()
         print('{}. {}'.format(label, description))
         print()
 
+# Tables and Figures in book order. Each is generated independently, so
+# book.py can generate them in parallel.
+ELEMENTS = [
+    figure_1, figure_2, table_1, figure_3, table_2, figure_4, figure_5,
+    figure_6, figure_7, table_3, figure_8, figure_9, figure_10, figure_11,
+    figure_12, figure_13, table_4, figure_14, figure_15, figure_16,
+]
+
+def generate_ch06():
+    """Generate Tables and Figures for chapter 06."""
+    for element in ELEMENTS:
+        element()
+
 #######################################################################
 if __name__ == '__main__':
     generate_ch06()
@@ -464,13 +464,13 @@ def visualize_results_floyd_warshall_two_steps(DG):
     output_dist_to_floyd_warshall(DG, dist_to)
     print()
 
-def generate_ch07():
-    """Generate Tables and Figures for chapter 07."""
-    chapter = 7
+CHAPTER = 7
 
+def figure_23():
+    """Generate Figure 7-23."""
     with FigureNum(23) as figure_number:
         description = 'Initialize dist_to[][] and node_from[][] based on G'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         DG_TABLE = nx.DiGraph()
         DG_TABLE.add_edge('a', 'b', weight=4)
         DG_TABLE.add_edge('b', 'a', weight=2)
@@ -483,9 +483,11 @@ def generate_ch07():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_24():
+    """Generate Figure 7-24."""
     with FigureNum(24) as figure_number:
         description = 'Changes to node_from[][] and dist_to[][] after k processes a and b'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         DG_TABLE = nx.DiGraph()
         DG_TABLE.add_edge('a', 'b', weight=4)
         DG_TABLE.add_edge('b', 'a', weight=2)
@@ -498,23 +500,29 @@ def generate_ch07():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_1():
+    """Generate Figure 7-1."""
     with FigureNum(1) as figure_number:
         description  = 'Modeling different problems using graphs'
         print('by hand')
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_2():
+    """Generate Figure 7-2."""
     with FigureNum(2) as figure_number:
         description  = 'An undirected graph of 12 vertices and 12 edges'
         make_sample_graph()
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_3():
+    """Generate Figure 7-3."""
     with FigureNum(3) as figure_number:
         description = 'A graph modeling a rectangular maze'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         from ch07.viewer import Viewer
 
         random.seed(15)
@@ -544,18 +552,22 @@ def generate_ch07():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_4():
+    """Generate Figure 7-4."""
     with FigureNum(4) as figure_number:
         description  = 'Hitting a dead end while exploring a maze'
         print('Hand drawn overlay to Figure 7-2.')
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_5():
+    """Generate Figure 7-5."""
     with FigureNum(5) as figure_number:
         from ch07.search import dfs_search, draw_solution
 
         description  = 'Depth First Search locates target if reachable from source'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         random.seed(15)
         m = Maze(3,5)
         graph = to_networkx(m)
@@ -563,6 +575,7 @@ def generate_ch07():
         if plt_error:
             print('unable to draw graph')
         else:
+            import matplotlib.pyplot as plt
             draw_solution(graph, dfs_search(graph, m.start()), m.start(), m.end())
             output_file = image_file('{}-graph.svg'.format(label))
             plt.savefig(output_file, format="svg")
@@ -571,16 +584,22 @@ def generate_ch07():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_6():
+    """Generate Figure 7-6."""
     with FigureNum(6) as figure_number:
         description  = 'Breadth First Search will locate shortest path to target, if reachable from source'
         print('Hand drawn overlay to Figure 7-2.')
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('{}. {}'.format(label, description))
         print()
 
+def figure_7():
+    """Generate Figure 7-7."""
     with FigureNum(7) as figure_number:
+        from ch07.search import draw_solution
+
         description  = 'Breadth First Search finds shortest path to each node'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         random.seed(15)
         m = Maze(3,5)
         graph = to_networkx(m)
@@ -588,6 +607,7 @@ def generate_ch07():
         if plt_error:
             print('unable to draw graph')
         else:
+            import matplotlib.pyplot as plt
             draw_solution(graph, bfs_search(graph, m.start()), m.start(), m.end())
             output_file = image_file('{}-graph.svg'.format(label))
             plt.savefig(output_file, format="svg")
@@ -595,9 +615,11 @@ def generate_ch07():
             print('{}. {}'.format(label, description))
             print()
 
+def figure_8():
+    """Generate Figure 7-8."""
     with FigureNum(8) as figure_number:
         description = 'Comparing Depth First Search, Breadth First Search, and Guided Search'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
 
         from ch07.solver_bfs import BreadthFirstSearchSolver
         from ch07.solver_dfs import DepthFirstSearchSolver
@@ -606,7 +628,7 @@ def generate_ch07():
         random.seed(15)
         m = Maze(13,13)
         if tkinter_error:
-            print('unable to generate {}'.format(postscript_output))
+            print('unable to generate BFS, DFS and Guided Postscript files for {}'.format(label))
         else:
             root = tkinter.Tk()
             bfs = BreadthFirstSearchSolver(root, m, 15, refresh_rate=0, stop_end=True)
@@ -627,50 +649,64 @@ def generate_ch07():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_9():
+    """Generate Figure 7-9."""
     with FigureNum(9) as figure_number:
         description = 'Adjacency Matrix vs. Adjacency List representation'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         output_adjacency_matrix()
         output_adjacency_list()
         print('{}. {}'.format(label, description))
         print()
 
+def figure_10():
+    """Generate Figure 7-10."""
     with FigureNum(10) as figure_number:
         description = 'Sample directed graph with 12 nodes and 14 edges.'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         make_sample_directed_graph()
         print('{}. {}'.format(label, description))
         print()
 
+def figure_11():
+    """Generate Figure 7-11."""
     with FigureNum(11) as figure_number:
         description = 'Sample spreadsheet with underlying directed graph.'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Screen shots from Excel, together with graph from Figure 7-9')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_12():
+    """Generate Figure 7-12."""
     with FigureNum(12) as figure_number:
         description = 'Visualizing execution of Depth First Search for Cycle Detection.'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Done by hand.')
         print('{}. {}'.format(label, description))
         print()
 
+def linear_ordering():
+    """Generate in-text linear ordering of spreadsheet cells."""
     # In-text linear ordering
     print_sample_linear_ordering()
     print('Linear ordering of spreadsheet cells after Figure 12.')
     print()
 
+def figure_13():
+    """Generate Figure 7-13."""
     with FigureNum(13) as figure_number:
         description = 'Visualizing execution of Depth First Search for Topological Sort.'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Done by hand.')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_14():
+    """Generate Figure 7-14."""
     with FigureNum(14) as figure_number:
         description = 'Modeling highway infrastructure in Massachusetts.'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         (_, mapPositions, _) = tmg_load(highway_map())
         (_,EAST,_,WEST) = bounding_ids(mapPositions)
         output_file = generate_bfs_and_dijkstra_figure(WEST, EAST)
@@ -679,9 +715,11 @@ def generate_ch07():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_15():
+    """Generate Figure 7-15."""
     with FigureNum(15) as figure_number:
         description = 'Modeling highway infrastructure in Massachusetts.'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         (_, mapPositions, _) = tmg_load(highway_map())
         (_,EAST,_,WEST) = bounding_ids(mapPositions)
         output_file = generate_dfs_figure(WEST, EAST)
@@ -690,16 +728,20 @@ def generate_ch07():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_16():
+    """Generate Figure 7-16."""
     with FigureNum(16) as figure_number:
         description = 'The shortest path from a to c has accumulated total of 8'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Done by hand.')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_17():
+    """Generate Figure 7-17."""
     with FigureNum(17) as figure_number:
         description = "Executing Dijkstra's algorithm on small graph"
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         DG_GOOD = nx.DiGraph()
         DG_GOOD.add_edge('a', 'b', weight=3)
         DG_GOOD.add_edge('a', 'c', weight=9)
@@ -710,9 +752,11 @@ def generate_ch07():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_18():
+    """Generate Figure 7-18."""
     with FigureNum(18) as figure_number:
         description = "A negative edge weight in the wrong place breaks Dijkstra's algorithm"
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         DG_GOOD = nx.DiGraph()
         DG_GOOD.add_edge('a', 'b', weight=3)
         DG_GOOD.add_edge('a', 'c', weight=1)
@@ -727,9 +771,11 @@ def generate_ch07():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_19():
+    """Generate Figure 7-19."""
     with FigureNum(19) as figure_number:
         description = 'Two graphs with negative edge weights, but only one has a negative cycle'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         DG_GOOD = nx.DiGraph()
         DG_GOOD.add_edge('a', 'b', weight=1)
         DG_GOOD.add_edge('b', 'd', weight=-3)
@@ -755,9 +801,11 @@ def generate_ch07():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_20():
+    """Generate Figure 7-20."""
     with FigureNum(20) as figure_number:
         description = 'Example for all-pairs shortest path problem'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         DG_AP = nx.DiGraph()
         DG_AP.add_edge('a', 'b', weight=4)
         DG_AP.add_edge('b', 'a', weight=2)
@@ -772,16 +820,20 @@ def generate_ch07():
         print('{}. {}'.format(label, description))
         print()
 
+def figure_21():
+    """Generate Figure 7-21."""
     with FigureNum(21) as figure_number:
         description = 'Intuition behind the all-pairs shortest path problem'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('by hand')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_22():
+    """Generate Figure 7-22."""
     with FigureNum(22) as figure_number:
         description = 'dist_to, node_from, and actual shortest paths for graph in Figure 7-20'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         DG_TABLE = nx.DiGraph()
         DG_TABLE.add_edge('a', 'b', weight=4)
         DG_TABLE.add_edge('b', 'a', weight=2)
@@ -794,50 +846,39 @@ def generate_ch07():
         print('{}. {}'.format(label, description))
         print()
 
-    with FigureNum(23) as figure_number:
-        description = 'Initialize dist_to[][] and node_from[][] based on G'
-        label = caption(chapter, figure_number)
-        DG_TABLE = nx.DiGraph()
-        DG_TABLE.add_edge('a', 'b', weight=4)
-        DG_TABLE.add_edge('b', 'a', weight=2)
-        DG_TABLE.add_edge('a', 'c', weight=3)
-        DG_TABLE.add_edge('b', 'd', weight=5)
-        DG_TABLE.add_edge('c', 'b', weight=6)
-        DG_TABLE.add_edge('d', 'b', weight=1)
-        DG_TABLE.add_edge('d', 'c', weight=7)
-        visualize_results_floyd_warshall_just_initialize(DG_TABLE)
-        print('{}. {}'.format(label, description))
-        print()
-
-    with FigureNum(24) as figure_number:
-        description = 'Changes to node_from[][] and dist_to[][] after k processes a and b'
-        label = caption(chapter, figure_number)
-        DG_TABLE = nx.DiGraph()
-        DG_TABLE.add_edge('a', 'b', weight=4)
-        DG_TABLE.add_edge('b', 'a', weight=2)
-        DG_TABLE.add_edge('a', 'c', weight=3)
-        DG_TABLE.add_edge('b', 'd', weight=5)
-        DG_TABLE.add_edge('c', 'b', weight=6)
-        DG_TABLE.add_edge('d', 'b', weight=1)
-        DG_TABLE.add_edge('d', 'c', weight=7)
-        visualize_results_floyd_warshall_two_steps(DG_TABLE)
-        print('{}. {}'.format(label, description))
-        print()
-
+def figure_25():
+    """Generate Figure 7-25."""
     with FigureNum(25) as figure_number:
         description = 'Sample Maze to defeat Guided Search'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Done by hand.')
         print('{}. {}'.format(label, description))
         print()
 
+def figure_26():
+    """Generate Figure 7-26."""
     with FigureNum(26) as figure_number:
         description = 'Sample directed, acyclic graph for single-source, shortest path optimization'
-        label = caption(chapter, figure_number)
+        label = caption(CHAPTER, figure_number)
         print('Done by hand.')
         print('{}. {}'.format(label, description))
         print()
 
+# Tables and Figures in book order. Each is generated independently, so
+# book.py can generate them in parallel.
+ELEMENTS = [
+    figure_23, figure_24, figure_1, figure_2, figure_3, figure_4, figure_5,
+    figure_6, figure_7, figure_8, figure_9, figure_10, figure_11, figure_12,
+    linear_ordering, figure_13, figure_14, figure_15, figure_16, figure_17,
+    figure_18, figure_19, figure_20, figure_21, figure_22, figure_23, figure_24,
+    figure_25, figure_26,
+]
+
+def generate_ch07():
+    """Generate Tables and Figures for chapter 07."""
+    for element in ELEMENTS:
+        element()
+
 #######################################################################
 if __name__ == '__main__':
     generate_ch07()
@@ -1,6 +1,8 @@
 """
 Indexed minimum priority queue
 """
+from algs.counting import instrument
+
 class IndexedMinPQ:
     """
     Heap storage for an indexed min priority queue.
@@ -113,3 +115,6 @@ class IndexedMinPQ:
         self.N -= 1
         self.sink(1)
         return min_value
+
+# Instrumented IndexedMinPQ that counts compares and swaps (see algs.counting).
+CountingIndexedMinPQ = instrument(IndexedMinPQ, less='compare', swap='swap')
@@ -464,6 +464,56 @@ class TestChapter7(unittest.TestCase):
         self.assertTrue(positions[NORTH][0] > positions[SOUTH][0])   # LAT Is higher for north
         self.assertTrue(positions[EAST][1] > positions[WEST][1])     # LONG is higher for east
 
+    def test_tmg_compiled(self):
+        import os
+        import tempfile
+        from ch07.replacement import WEIGHT
+        from ch07.tmg_load import tmg_load, highway_map, tmg_compile, tmg_load_compiled
+        (G, positions, labels) = tmg_load(highway_map())
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'highway.tmgb')
+            with open(path, 'wb') as file:
+                file.write(tmg_compile(highway_map()))
+            (G2, positions2, labels2) = tmg_load_compiled(path)
+
+        self.assertEqual(positions, positions2)
+        self.assertEqual(labels, labels2)
+        self.assertEqual(G.number_of_nodes(), G2.number_of_nodes())
+        self.assertEqual(G.number_of_edges(), G2.number_of_edges())
+        weights = {(e[0], e[1]) : e[2][WEIGHT] for e in G.edges(data=True)}
+        for e in G2.edges(data=True):
+            self.assertEqual(weights[(e[0], e[1])], e[2][WEIGHT])
+
+        with self.assertRaises(ValueError):
+            tmg_compile(['GRAPH 1.0 simple', '0 0'])
+
+        from ch07.timing import compare_tmg_load
+        tbl = compare_tmg_load(repeat=1, output=False)
+        self.assertTrue(tbl.entry(G.number_of_nodes(), 'Compiled') > 0)
+
+    def test_tmg_streaming(self):
+        from ch07.replacement import WEIGHT
+        from ch07.tmg_load import tmg_load, tmg_load_file, tmg_records, highway_map, NODE, EDGE
+        from resources.cache import resource_path
+        (G, positions, labels) = tmg_load(highway_map())
+        (G2, positions2, labels2) = tmg_load_file(resource_path('MA-region-simple.tmg'))
+
+        self.assertEqual(positions, positions2)
+        self.assertEqual(labels, labels2)
+        self.assertEqual(G.number_of_edges(), G2.number_of_edges())
+
+        records = list(tmg_records(['TMG 1.0 simple', '2 1', 'A 42.0 -71.0', 'B 42.1 -71.1', '0 1 AB']))
+        self.assertEqual([NODE, NODE, EDGE], [r[0] for r in records])
+        self.assertEqual((EDGE, 0, 1, 'AB'), records[2])
+
+        # truncated data is detected once the records are consumed
+        with self.assertRaises(ValueError):
+            list(tmg_records(['TMG 1.0 simple', '2 1', 'A 42.0 -71.0']))
+
+        (G3, _, _) = tmg_load(iter(['TMG 1.0 simple', '2 1', 'A 42.0 -71.0', 'B 42.1 -71.1', '0 1 AB']))
+        self.assertTrue(list(G3.edges(data=True))[0][2][WEIGHT] > 0)
+
     def test_recursive_dfs(self):
         from ch07.challenge import dfs_search_recursive, path_to_recursive
         G = nx.Graph()
@@ -499,6 +549,19 @@ class TestChapter7(unittest.TestCase):
         (dist_to_topol, _) = topological_sp(DAG, 1)
         self.assertEqual(dist_to[N*N], dist_to_topol[N*N])
 
+    def test_counting_indexed_min_pq(self):
+        from ch07.indexed_pq import CountingIndexedMinPQ
+        from algs.counting import counters, clear_counters
+
+        clear_counters()
+        pq = CountingIndexedMinPQ(4)
+        for v,p in [('a', 4), ('b', 3), ('c', 2), ('d', 1)]:
+            pq.enqueue(v, p)
+        pq.decrease_priority('a', 0)
+        self.assertEqual('a', pq.dequeue())
+        self.assertTrue(counters()['swap'] > 0)
+        self.assertTrue(counters()['compare'] >= counters()['swap'])
+
 #######################################################################
 if __name__ == '__main__':
     unittest.main()
@@ -96,8 +96,41 @@ def chained_dijkstra():
         print('start {} to end {} in longest shortest distance {} in time {:.3f} seconds'
               .format(positions[start], positions[end], longest_so_far, end_time-start_time))
 
+def compare_tmg_load(repeat=5, output=True, decimals=3):
+    """
+    Compare the time (in ms) to load the MA highway graph from TMG text,
+    which computes the distance of every edge, against loading it from its
+    compiled binary form. Both produce (G, positions, labels).
+    """
+    import os
+    import tempfile
+    from algs.bench import bench, InputCache
+    from algs.table import DataTable
+    from ch07.tmg_load import tmg_load, tmg_compile, tmg_load_compiled, highway_map
+
+    raw_data = highway_map()
+    tbl = DataTable([8,10,10,8], ['N', 'Text', 'Compiled', 'Speedup'],
+                    output=output, decimals=decimals)
+    tbl.format('N', ',d')
+    cache = InputCache()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'highway.tmgb')
+        with open(path, 'wb') as file:
+            file.write(tmg_compile(raw_data))
+
+        text = bench(tmg_load, lambda: raw_data, repeat=repeat, cache=cache)
+        compiled = bench(tmg_load_compiled, lambda: path, repeat=repeat, cache=cache)
+        num_nodes = tmg_load_compiled(path)[0].number_of_nodes()
+
+    tbl.row([num_nodes, 1000*text.min, 1000*compiled.min, text.min / compiled.min])
+    return tbl
+
 #######################################################################
 if __name__ == '__main__':
+    print('Load MA highway graph from TMG text and from its compiled form (in ms).')
+    compare_tmg_load()
+    print()
+
     print('Perform Floyd-Warshall on MA highway data.')
     floyd_warshall_highway()
     print()
@@ -1,10 +1,30 @@
 """
 Python script to load up TMG file as a Graph.
+
+Parsing the TMG text (and computing the distance of every edge) is repeated
+every time a graph is loaded. tmg_compile() instead converts TMG data into a
+compact binary form that stores the node coordinates, the adjacency structure
+in Compressed Sparse Row (CSR) form, and the precomputed weight of each edge:
+
+    header: magic, version, number of nodes N, number of entries M
+    N latitudes, then N longitudes (float64)
+    N+1 offsets into targets (uint32); neighbors of u are targets[offsets[u]:offsets[u+1]]
+    M targets (uint32), then M weights (float64) aligned with targets
+    N+1 offsets (uint32) into the UTF-8 blob of packed node labels
+
+Each undirected edge appears twice in the CSR arrays, once from each end.
+tmg_load_compiled() reads each section in bulk, and highway_graph() loads
+the MA highway graph from a compiled file in the resource cache, creating
+it on first use.
 """
 
+import struct
+import sys
+from array import array
 from math import cos, asin, sqrt, pi
 
 from resources.highway import highway_map
+from resources.registry import dataset
 from ch07.single_source_sp import dijkstra_sp
 from ch07.replacement import WEIGHT
 from ch07.dependencies import plt_error
@@ -96,51 +116,217 @@ def distance(gps1, gps2):
     a = 0.5 - cos((lat2-lat1)*p)/2 + cos(lat1*p) * cos(lat2*p) * (1-cos((long2-long1)*p))/2
     return 7917.509282 * asin(sqrt(a))    # convert into miles and use 12742 as earth diameter in KM
 
-def tmg_load(raw_data):
+# Kinds of records generated by tmg_records()
+NODE = 'node'
+EDGE = 'edge'
+
+def _next_line(lines):
+    """Return next line from iterator, raising ValueError if there is none."""
+    line = next(lines, None)
+    if line is None:
+        raise ValueError('TMG data ends prematurely.')
+    return line
+
+def tmg_records(lines):
     """
-    Load up a TMG 1.0 simple file into a directed weighted graph, using
-    long/lat coordinate calculator for distance.
+    Generate the records of TMG 1.0 simple data from lines, which can be any
+    iterable of lines, such as a list or an open file. Only one line is
+    consumed at a time, so the text is never held in memory all at once.
 
         TMG 1.0 simple
         #N #E
         {NODE: LABEL LAT LONG}
         {EDGE: id1 id2 LABEL}
 
-    For each edge, compute the distance. Also return labels for the nodes.
+    Yields (NODE, id, label, lat, long) for each node, followed by
+    (EDGE, id1, id2, label) for each edge.
     """
-    G = nx.Graph()
-    line = 0
-    if not 'TMG' in raw_data[line]:
-        raise ValueError('Contents is not a valid TMG file ({}).'.format(raw_data[line]))
-    line += 1
+    lines = iter(lines)
+    first = _next_line(lines)
+    if not 'TMG' in first:
+        raise ValueError('Contents is not a valid TMG file ({}).'.format(first))
 
-    (snum_nodes, snum_edges) = raw_data[line].split()
-    line += 1
+    (snum_nodes, snum_edges) = _next_line(lines).split()
     num_nodes = int(snum_nodes)
     num_edges = int(snum_edges)
 
+    for i in range(num_nodes):
+        (label, slat1, slong1) = _next_line(lines).split()
+        yield (NODE, i, label, float(slat1), float(slong1))
+
+    for _ in range(num_edges):
+        (su, sv, label) = _next_line(lines).split()
+        yield (EDGE, int(su), int(sv), label)
+
+def tmg_file_records(path, chunk_size=65536):
+    """
+    Generate records (see tmg_records()) from TMG file at path, which is
+    read chunk_size bytes at a time.
+    """
+    with open(path, 'r', buffering=chunk_size) as file:
+        yield from tmg_records(file)
+
+def tmg_build(records, G=None):
+    """
+    Add nodes and edges from records (see tmg_records()) into graph G (a new
+    undirected graph if None), computing the distance of each edge as its
+    weight. Return (G, positions, labels).
+    """
+    if G is None:
+        G = nx.Graph()
     positions = {}
     labels = {}
 
-    for i in range(num_nodes):
-        (label, slat1, slong1) = raw_data[line].split()
-        line += 1
+    for record in records:
+        if record[0] == NODE:
+            (_, i, label, lat, long) = record
+            positions[i] = (lat, long)
+            labels[i] = label
+            G.add_node(i)
+        else:
+            (_, u, v, _) = record
+            d = distance(positions[u], positions[v])
+            G.add_edge(u, v, weight=d)
 
-        positions[i] = (float(slat1), float(slong1))
-        labels[i] = label
-        G.add_node(i)
+    return (G, positions, labels)
 
-    for i in range(num_edges):
-        (su, sv, _) = raw_data[line].split()
-        line += 1
+def tmg_load(raw_data):
+    """
+    Load up a TMG 1.0 simple file into a directed weighted graph, using
+    long/lat coordinate calculator for distance.
 
-        u = int(su)
-        v = int(sv)
-        d = distance(positions[u], positions[v])
-        G.add_edge(u, v, weight=d)
+        TMG 1.0 simple
+        #N #E
+        {NODE: LABEL LAT LONG}
+        {EDGE: id1 id2 LABEL}
+
+    For each edge, compute the distance. Also return labels for the nodes.
+    raw_data can be a list of lines or an open file.
+    """
+    return tmg_build(tmg_records(raw_data))
+
+def tmg_load_file(path):
+    """Stream TMG file at path into a graph without reading all of its text into memory."""
+    return tmg_build(tmg_file_records(path))
+
+# Binary form created by tmg_compile(). All values are little-endian.
+_HEADER = struct.Struct('<4sIII')
+_MAGIC = b'TMGB'
+_VERSION = 1
+
+def _to_bytes(arr):
+    """Return bytes of array in little-endian order."""
+    if sys.byteorder == 'big':
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+def _from_bytes(typecode, data, offset, count):
+    """Return (array of count values read from data at offset, next offset)."""
+    arr = array(typecode)
+    end = offset + count * arr.itemsize
+    arr.frombytes(data[offset:end])
+    if sys.byteorder == 'big':
+        arr.byteswap()
+    return (arr, end)
+
+def tmg_compile(raw_data):
+    """
+    Return bytes for the compiled binary form of TMG 1.0 simple raw_data (a
+    list of lines or an open file), which can be written to a file and loaded
+    by tmg_load_compiled().
+    """
+    lats = array('d')
+    longs = array('d')
+    names = []
+    adjacent = []
+    for record in tmg_records(raw_data):
+        if record[0] == NODE:
+            (_, _, label, lat, long) = record
+            lats.append(lat)
+            longs.append(long)
+            names.append(label.encode('utf-8'))
+            adjacent.append([])
+        else:
+            (_, u, v, _) = record
+            d = distance((lats[u], longs[u]), (lats[v], longs[v]))
+            adjacent[u].append((v, d))
+            if u != v:
+                adjacent[v].append((u, d))
+
+    num_nodes = len(lats)
+
+    offsets = array('I', [0])
+    targets = array('I')
+    weights = array('d')
+    for u in range(num_nodes):
+        for (v, d) in adjacent[u]:
+            targets.append(v)
+            weights.append(d)
+        offsets.append(len(targets))
 
+    label_offsets = array('I', [0])
+    for name in names:
+        label_offsets.append(label_offsets[-1] + len(name))
+
+    return b''.join([_HEADER.pack(_MAGIC, _VERSION, num_nodes, len(targets)),
+                     _to_bytes(lats), _to_bytes(longs), _to_bytes(offsets),
+                     _to_bytes(targets), _to_bytes(weights), _to_bytes(label_offsets),
+                     b''.join(names)])
+
+def tmg_read_compiled(data):
+    """
+    Return (lats, longs, offsets, targets, weights, labels) from the bytes of a
+    compiled TMG file. All but labels (a list of str) are array.array objects.
+    """
+    (magic, version, num_nodes, num_entries) = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError('Contents is not a compiled TMG file.')
+    pos = _HEADER.size
+    (lats, pos) = _from_bytes('d', data, pos, num_nodes)
+    (longs, pos) = _from_bytes('d', data, pos, num_nodes)
+    (offsets, pos) = _from_bytes('I', data, pos, num_nodes + 1)
+    (targets, pos) = _from_bytes('I', data, pos, num_entries)
+    (weights, pos) = _from_bytes('d', data, pos, num_entries)
+    (label_offsets, pos) = _from_bytes('I', data, pos, num_nodes + 1)
+    blob = data[pos:pos + label_offsets[-1]].decode('utf-8')
+    if len(blob) == label_offsets[-1]:          # all ASCII, so slice str directly
+        labels = [blob[label_offsets[i]:label_offsets[i+1]] for i in range(num_nodes)]
+    else:
+        raw = data[pos:]
+        labels = [raw[label_offsets[i]:label_offsets[i+1]].decode('utf-8') for i in range(num_nodes)]
+    return (lats, longs, offsets, targets, weights, labels)
+
+def tmg_load_compiled(path):
+    """
+    Load compiled TMG file (created from tmg_compile()) into an undirected
+    weighted graph, returning (G, positions, labels) just like tmg_load().
+    Nodes and edges are added in bulk, and no distances are computed.
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    (lats, longs, offsets, targets, weights, names) = tmg_read_compiled(data)
+    num_nodes = len(lats)
+
+    positions = dict(enumerate(zip(lats, longs)))
+    labels = dict(enumerate(names))
+
+    G = nx.Graph()
+    G.add_nodes_from(range(num_nodes))
+    G.add_edges_from((u, targets[i], {WEIGHT: weights[i]})
+                     for u in range(num_nodes)
+                     for i in range(offsets[u], offsets[u+1]) if u <= targets[i])
     return (G, positions, labels)
 
+def highway_graph():
+    """
+    Return (G, positions, labels) for the MA highway data, loaded from its
+    compiled form in the resource cache, which is created when missing.
+    The result is shared with other callers (see resources.registry), so
+    copy G before modifying it.
+    """
+    return dataset('highway-graph')
+
 #######################################################################
 if __name__ == '__main__':
     if not plt_error:
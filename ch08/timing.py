@@ -2,21 +2,31 @@
 Timing results for Chapter 08.
 """
 import timeit
+
+from algs.bench import bench, input_cache
 from algs.table import DataTable
 
+def list_of(N):
+    """Return list of integers from 0 to N-1, used as initial queue contents."""
+    return list(range(N))
+
 def list_enqueue(N, num):
     """Run a single trial of num enqueue requests."""
-    return 1000*min(timeit.repeat(stmt='''
-for i in range({}):
-    q.append(i)'''.format(num),
-        setup = 'q = list(range({}))'.format(N), repeat=5, number=1))
+    def enqueue(q):
+        for i in range(num):
+            q.append(i)
+    timing = bench(enqueue, list_of, (N,), repeat=5, prepare=list)
+    input_cache.discard(list_of, N)
+    return 1000*timing.min
 
 def list_dequeue(N, num):
     """Run a single trial of num dequeue requests. Make sure that num < N."""
-    return 1000*min(timeit.repeat(stmt='''
-for i in range({}):
-    q.pop(0)'''.format(num),
-        setup = 'q = list(range({}))'.format(N), repeat=5, number=1))
+    def dequeue(q):
+        for _ in range(num):
+            q.pop(0)
+    timing = bench(dequeue, list_of, (N,), repeat=5, prepare=list)
+    input_cache.discard(list_of, N)
+    return 1000*timing.min
 
 def dequeue_enqueue(N, num):
     """Run a single trial of num enqueue requests."""
@@ -0,0 +1,30 @@
+"""
+Location for precompiled versions of the resources, which are generated on
+first use and reused by later runs (and shared by concurrent processes).
+
+Set the ALGS_RESOURCE_CACHE environment variable to choose the directory;
+otherwise a directory within the system's temporary directory is used.
+"""
+import os
+import tempfile
+
+CACHE_ENV = 'ALGS_RESOURCE_CACHE'
+
+def cache_path(file_name):
+    """Return path for file_name within the cache directory, creating the directory if needed."""
+    directory = os.environ.get(CACHE_ENV)
+    if not directory:
+        directory = os.path.join(tempfile.gettempdir(), 'algs-resources')
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, file_name)
+
+def resource_path(file_name):
+    """Return path to file_name stored within the resources package."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), file_name)
+
+def write_atomically(path, data):
+    """Write bytes to path so concurrent readers never see a partially written file."""
+    tmp = '{}.{}.tmp'.format(path, os.getpid())
+    with open(tmp, 'wb') as file:
+        file.write(data)
+    os.replace(tmp, path)
@@ -10,38 +10,95 @@ If this code just doesn't work for you, then simply hard-code something like thi
         all_words = word_file.read().splitlines()
         word_file.close()
         return all_words
+
+Every call to english_words() in a new process reads and splits the entire
+file into a list of 321,129 str objects. Where that cost matters (such as
+in a pool of worker processes), mapped_english_words() instead returns a
+read-only sequence over a compact, memory-mapped file: a table of offsets
+followed by the packed UTF-8 bytes of every word. Each str is created only
+when accessed, and all processes share the same pages of the mapped file.
 """
+import bisect
+import mmap
+import struct
+from collections.abc import Sequence
+
+from resources.registry import dataset
 
-_english_words = []
+# Compact format: header (magic, version, number of words, size of source
+# file), then N+1 offsets into the blob of packed UTF-8 words that follows.
+_HEADER = struct.Struct('<4sIIQ')
+_OFFSET = struct.Struct('<I')
+_MAGIC = b'WRDS'
+_VERSION = 1
 
 def english_words():
     """Return list of 321,129 English words from dictionary."""
-    if _english_words:
-        return _english_words
-
-    # Try to load up...
-    try:
-        import importlib.resources as pkg_resources
-        contents = pkg_resources.read_text('resources', 'words.english.txt')
-        _english_words.extend(contents.splitlines())
-        return _english_words
-    except ImportError:
-        pass
-
-    try:
-        import pkg_resources
-
-        contents = pkg_resources.resource_string('resources', 'words.english.txt').decode('utf-8')
-        _english_words.extend(contents.splitlines())
-        return _english_words
-    except ImportError:
-        pass
-
-    # if still cannot access, then you will have to hard-code to
-    # change the following path name to the location of the
-    # words.english.txt file
-    import os
-    with open(os.path.join('resources', 'words.english.txt')) as file:
-        for line in file.readlines():
-            _english_words.append(line[:-1])    # chomp '\n'
-    return _english_words
+    return dataset('english')
+
+def compile_words(words, source_size=0):
+    """Return bytes of compact format for the sequence of words."""
+    blob = bytearray()
+    offsets = [0]
+    for w in words:
+        blob.extend(w.encode('utf-8'))
+        offsets.append(len(blob))
+    header = _HEADER.pack(_MAGIC, _VERSION, len(offsets) - 1, source_size)
+    return header + struct.pack('<{}I'.format(len(offsets)), *offsets) + bytes(blob)
+
+class MappedWords(Sequence):
+    """
+    Read-only sequence of words stored in compact format within a file that
+    is memory-mapped. Indexing is O(1) and only materializes the word(s)
+    requested. Since the words are in sorted order, membership and index()
+    use binary search.
+    """
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            self.mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.N, self.source_size) = _HEADER.unpack_from(self.mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('{} is not a compiled word file'.format(path))
+        self.base = _HEADER.size + _OFFSET.size * (self.N + 1)
+
+    def __len__(self):
+        return self.N
+
+    def _offset(self, idx):
+        return _OFFSET.unpack_from(self.mm, _HEADER.size + _OFFSET.size * idx)[0]
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self.N))]
+        if idx < 0:
+            idx += self.N
+        if not 0 <= idx < self.N:
+            raise IndexError('word index out of range')
+        start = self.base + self._offset(idx)
+        end = self.base + self._offset(idx + 1)
+        return self.mm[start:end].decode('utf-8')
+
+    def __contains__(self, word):
+        idx = bisect.bisect_left(self, word)
+        return idx < self.N and self[idx] == word
+
+    def index(self, word, start=0, stop=None):
+        """Return index of word, raising ValueError if not present."""
+        if stop is None:
+            stop = self.N
+        idx = bisect.bisect_left(self, word, start, stop)
+        if idx < stop and self[idx] == word:
+            return idx
+        raise ValueError('{} is not in words'.format(word))
+
+    def close(self):
+        """Release the memory map."""
+        self.mm.close()
+
+def mapped_english_words():
+    """
+    Return MappedWords for the 321,129 English words. The compact file is
+    generated (once) in the resource cache directory; it is regenerated when
+    words.english.txt changes.
+    """
+    return dataset('english-mapped')
@@ -0,0 +1,182 @@
+"""
+Registry of the datasets used throughout the book.
+
+Each dataset is declared once, with register(), and loaded by name on first
+access with dataset(name). Loaded datasets are kept in an in-process cache
+that holds at most CACHE_SIZE datasets, discarding the least recently used
+one when full. Since cached values are shared, do not modify them.
+
+A dataset is produced by its loader. When the dataset has a source file
+(stored within the resources package) the loader is invoked with the path
+to that file, followed by any arguments passed to dataset():
+
+    >>> register('words', read_lines, source='words.english.txt')
+    >>> len(dataset('words'))
+    321129
+
+A dataset can also declare a compiler, which converts its source file into
+bytes, and a reader, which constructs the dataset from the resulting file.
+The compiled file is written (once) to the resource cache directory (see
+resources.cache) and reused by every later process until the source changes.
+
+To swap in a different source file for registered datasets, without editing
+any code, set the ALGS_DATASETS environment variable to a comma-separated
+list of name=path pairs:
+
+    ALGS_DATASETS=english=/data/big-words.txt,highway=/data/USA.tmg python3 ch03/book.py
+"""
+import hashlib
+import os
+from collections import OrderedDict
+
+from resources.cache import cache_path, resource_path, write_atomically
+
+OVERRIDE_ENV = 'ALGS_DATASETS'
+CACHE_SIZE = 8
+
+class Dataset:
+    """
+    Declaration of a named dataset. When source is not None, loader, compiler
+    and reader are invoked with the path of the source file.
+    """
+    def __init__(self, name, loader, source=None, compiler=None, reader=None, description=''):
+        if (compiler is None) != (reader is None):
+            raise ValueError('{} must declare both compiler and reader, or neither'.format(name))
+        self.name = name
+        self.loader = loader
+        self.source = source
+        self.compiler = compiler
+        self.reader = reader
+        self.description = description
+
+    def source_path(self):
+        """Return path to source file (possibly overridden by ALGS_DATASETS), or None."""
+        overrides = _overrides()
+        if self.name in overrides:
+            return overrides[self.name]
+        if self.source is None:
+            return None
+        return resource_path(self.source)
+
+    def compiled_path(self, path, args):
+        """Return path of compiled file in the cache, unique to the source file and args."""
+        digest = hashlib.sha256(repr((os.path.abspath(path), os.path.getsize(path),
+                                      os.path.getmtime(path), args)).encode('utf-8'))
+        return cache_path('{}-{}.bin'.format(self.name, digest.hexdigest()[:16]))
+
+    def load(self, *args):
+        """Load and return the dataset, bypassing the in-process cache."""
+        path = self.source_path()
+        if path is None:
+            return self.loader(*args)
+        if self.compiler is None:
+            return self.loader(path, *args)
+
+        compiled = self.compiled_path(path, args)
+        if not os.path.exists(compiled):
+            write_atomically(compiled, self.compiler(path, *args))
+        return self.reader(compiled)
+
+_datasets = {}
+_loaded = OrderedDict()
+
+def _overrides():
+    """Return dictionary of source paths specified by ALGS_DATASETS."""
+    spec = os.environ.get(OVERRIDE_ENV)
+    if not spec:
+        return {}
+    overrides = {}
+    for entry in spec.split(','):
+        if entry.strip():
+            (name, path) = entry.split('=', 1)
+            overrides[name.strip()] = path.strip()
+    return overrides
+
+def register(name, loader, source=None, compiler=None, reader=None, description=''):
+    """
+    Declare dataset name, replacing (and discarding any cached value of)
+    an earlier declaration with the same name. Returns the Dataset.
+    """
+    clear_cache(name)
+    _datasets[name] = Dataset(name, loader, source, compiler, reader, description)
+    return _datasets[name]
+
+def datasets():
+    """Return sorted list of the names of all registered datasets."""
+    return sorted(_datasets)
+
+def dataset(name, *args):
+    """
+    Return dataset name (loaded with args), loading it only if it is not
+    already in the in-process cache. Raises KeyError for an unknown name.
+    """
+    key = (name, args)
+    if key in _loaded:
+        _loaded.move_to_end(key)
+        return _loaded[key]
+
+    if not name in _datasets:
+        raise KeyError('unknown dataset:{}'.format(name))
+    value = _datasets[name].load(*args)
+    _loaded[key] = value
+    while len(_loaded) > CACHE_SIZE:
+        _loaded.popitem(last=False)
+    return value
+
+def clear_cache(name=None):
+    """Discard cached values of dataset name, or of all datasets if name is None."""
+    for key in list(_loaded):
+        if name is None or key[0] == name:
+            del _loaded[key]
+
+def read_lines(path):
+    """Return list of lines in the text file at path."""
+    with open(path, encoding='utf-8') as file:
+        return file.read().splitlines()
+
+def _compile_words(path):
+    """Return compact format of the sorted word list in path."""
+    from resources.english import compile_words
+    return compile_words(read_lines(path), os.path.getsize(path))
+
+def _read_words(path):
+    """Return MappedWords for the compact file at path."""
+    from resources.english import MappedWords
+    return MappedWords(path)
+
+def _compile_tmg(path):
+    """Return compiled binary form of the TMG file at path."""
+    from ch07.tmg_load import tmg_compile
+    with open(path) as file:
+        return tmg_compile(file)
+
+def _read_tmg(path):
+    """Return (G, positions, labels) from the compiled TMG file at path."""
+    from ch07.tmg_load import tmg_load_compiled
+    return tmg_load_compiled(path)
+
+def _zipf_words(n, seed=0):
+    """Return list of n Zipf-distributed words."""
+    from resources.synthetic import zipf_words, materialize
+    return materialize(zipf_words(n, seed=seed))
+
+def _road_graph(num_nodes, seed=0):
+    """Return (G, positions, labels) for a synthetic road-like graph."""
+    from resources.synthetic import road_graph
+    from ch07.tmg_load import tmg_load
+    return tmg_load(road_graph(num_nodes, seed=seed))
+
+register('english', read_lines, source='words.english.txt',
+         description='321,129 English words in alphabetical order')
+register('english-mapped', None, source='words.english.txt',
+         compiler=_compile_words, reader=_read_words,
+         description='English words as a read-only, memory-mapped sequence')
+register('highway', read_lines, source='MA-region-simple.tmg',
+         description='lines of TMG file for Massachusetts highways')
+register('highway-graph', None, source='MA-region-simple.tmg',
+         compiler=_compile_tmg, reader=_read_tmg,
+         description='(G, positions, labels) for Massachusetts highways')
+register('zipf-words', _zipf_words,
+         description='list of n Zipf-distributed words, given arguments (n, seed)')
+register('road-graph', _road_graph,
+         description='(G, positions, labels) of synthetic roads, given arguments (n, seed)')
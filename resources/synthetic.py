@@ -0,0 +1,161 @@
+"""
+Deterministic synthetic inputs for scaling experiments beyond the bundled
+English words and Massachusetts highway data.
+
+Every generator takes a seed, so the same arguments always produce the same
+data, and streams its output so that arbitrarily large inputs (such as 10^8
+elements) never have to be held in memory all at once:
+
+  * zipf_words() - batches of string keys whose frequencies follow Zipf's law
+  * near_sorted() - batches of integers in ascending order with a few displaced
+  * adversarial() - batches of integers arranged to stress sorting algorithms
+  * road_graph() - lines of a TMG file for a random planar, road-like graph
+
+Each batch is a list of at most batch_size values; use chain.from_iterable()
+to consume the values one at a time, or materialize() to build a list.
+The lines from road_graph() can be parsed by ch07.tmg_load.tmg_load(), or
+written to a file and compiled with ch07.tmg_load.tmg_compile().
+
+    >>> from resources.synthetic import zipf_words, materialize
+    >>> words = materialize(zipf_words(1000000, seed=7))
+"""
+import math
+import random
+import string
+from itertools import chain
+
+BATCH_SIZE = 65536
+
+# Kinds of integer arrays generated by adversarial()
+ADVERSARIAL_KINDS = ['descending', 'organ_pipe', 'sawtooth', 'few_unique', 'all_equal']
+
+def materialize(batches):
+    """Return list containing all values from batches."""
+    return list(chain.from_iterable(batches))
+
+def vocabulary(size, seed=0, min_length=3, max_length=12):
+    """Return list of size distinct random lowercase words, deterministic for seed."""
+    rng = random.Random(seed)
+    words = []
+    seen = set()
+    letters = string.ascii_lowercase
+    while len(words) < size:
+        w = ''.join(rng.choices(letters, k=rng.randint(min_length, max_length)))
+        if not w in seen:
+            seen.add(w)
+            words.append(w)
+    return words
+
+def zipf_words(n, vocabulary_size=100000, s=1.0, seed=0, batch_size=BATCH_SIZE):
+    """
+    Generate n words in batches, drawn from a vocabulary of vocabulary_size
+    distinct words where the word of rank r occurs with probability
+    proportional to 1/r^s. This skew resembles the keys found in real text,
+    where a few words are very common and most are rare.
+    """
+    words = vocabulary(vocabulary_size, seed)
+    cumulative = []
+    total = 0
+    for rank in range(1, vocabulary_size + 1):
+        total += 1 / rank ** s
+        cumulative.append(total)
+
+    rng = random.Random(seed + 1)
+    remaining = n
+    while remaining > 0:
+        k = min(batch_size, remaining)
+        yield rng.choices(words, cum_weights=cumulative, k=k)
+        remaining -= k
+
+def near_sorted(n, fraction=0.01, distance=16, seed=0, batch_size=BATCH_SIZE):
+    """
+    Generate the integers 0 .. n-1 in batches, in ascending order except that
+    roughly fraction*n values are swapped with another value at most distance
+    positions away (within the same batch).
+    """
+    rng = random.Random(seed)
+    for start in range(0, n, batch_size):
+        batch = list(range(start, min(n, start + batch_size)))
+        last = len(batch) - 1
+        for _ in range(int(fraction * len(batch))):
+            i = rng.randint(0, last)
+            j = min(last, max(0, i + rng.randint(-distance, distance)))
+            batch[i], batch[j] = batch[j], batch[i]
+        yield batch
+
+def adversarial(n, kind='organ_pipe', seed=0, batch_size=BATCH_SIZE):
+    """
+    Generate n integers in batches arranged to stress sorting algorithms:
+
+      * descending - n-1 down to 0, worst case for insertion sort
+      * organ_pipe - ascending up to n//2 and then descending again
+      * sawtooth - ascending runs of length sqrt(n), many partially sorted runs
+      * few_unique - values drawn from only sqrt(n) distinct values
+      * all_equal - n copies of the same value, degenerate for Lomuto partition
+
+    Only few_unique is random, and it is deterministic for seed.
+    """
+    if not kind in ADVERSARIAL_KINDS:
+        raise ValueError('unknown kind:{}'.format(kind))
+    rng = random.Random(seed)
+    run = max(1, int(math.sqrt(n)))
+    half = n // 2
+    for start in range(0, n, batch_size):
+        indices = range(start, min(n, start + batch_size))
+        if kind == 'descending':
+            yield [n - 1 - i for i in indices]
+        elif kind == 'organ_pipe':
+            yield [i if i < half else n - 1 - i for i in indices]
+        elif kind == 'sawtooth':
+            yield [i % run for i in indices]
+        elif kind == 'few_unique':
+            yield [rng.randrange(run) for _ in indices]
+        else:
+            yield [0] * len(indices)
+
+def _road_edges(num_nodes, cols, extra, seed):
+    """
+    Generate (u, v) edges of road graph. Every node other than 0 connects to
+    its left or upper neighbor (ensuring the graph is connected), and the
+    other of these two is added with probability extra.
+    """
+    rng = random.Random(seed)
+    for v in range(1, num_nodes):
+        (row, col) = divmod(v, cols)
+        candidates = []
+        if col > 0:
+            candidates.append(v - 1)
+        if row > 0:
+            candidates.append(v - cols)
+        rng.shuffle(candidates)
+        yield (candidates[0], v)
+        if len(candidates) > 1 and rng.random() < extra:
+            yield (candidates[1], v)
+
+def road_graph(num_nodes, extra=0.4, seed=0, origin=(42.0, -73.0), spacing=0.01):
+    """
+    Generate lines of a TMG 1.0 simple file for a random planar road-like
+    graph with num_nodes waypoints. Waypoints lie on a square grid (starting
+    at origin, spacing degrees apart) and are jittered by less than a quarter
+    of the spacing, so roads between grid neighbors never cross. The graph is
+    connected, with about num_nodes*(1+extra) roads.
+
+    The edges are generated twice, once to count them for the header and once
+    to emit them, so memory stays constant no matter how large the graph.
+    """
+    cols = max(1, int(math.ceil(math.sqrt(num_nodes))))
+    num_edges = sum(1 for _ in _road_edges(num_nodes, cols, extra, seed))
+
+    yield 'TMG 1.0 simple'
+    yield '{} {}'.format(num_nodes, num_edges)
+
+    rng = random.Random(seed + 1)
+    jitter = spacing / 4
+    for i in range(num_nodes):
+        (row, col) = divmod(i, cols)
+        lat = origin[0] + row * spacing + rng.uniform(-jitter, jitter)
+        long = origin[1] + col * spacing + rng.uniform(-jitter, jitter)
+        yield 'N{} {:.6f} {:.6f}'.format(i, lat, long)
+
+    for (u, v) in _road_edges(num_nodes, cols, extra, seed):
+        yield '{} {} R{}-{}'.format(u, v, u, v)
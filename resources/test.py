@@ -17,5 +17,104 @@ class TestHashing(unittest.TestCase):
         # Dictionary used
         self.assertEqual(2305 + 2826 + 2,len(highway_map()))
 
+    def test_mapped_dictionary(self):
+        import os
+        import tempfile
+        from resources.english import english_words, mapped_english_words
+        from resources.english import compile_words, MappedWords
+
+        words = mapped_english_words()
+        self.assertEqual(321129, len(words))
+        self.assertEqual(english_words()[:10], words[:10])
+        self.assertEqual(english_words()[-1], words[-1])
+        self.assertTrue('zebra' in words)
+        self.assertFalse('zebraa' in words)
+        self.assertEqual(english_words().index('zebra'), words.index('zebra'))
+        with self.assertRaises(IndexError):
+            words[321129]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'sample.bin')
+            with open(path, 'wb') as file:
+                file.write(compile_words(['apple', 'caf\u00e9', 'zoo']))
+            sample = MappedWords(path)
+            self.assertEqual(['apple', 'caf\u00e9', 'zoo'], list(sample))
+            with self.assertRaises(ValueError):
+                sample.index('banana')
+            sample.close()
+
+    def test_registry(self):
+        import os
+        import tempfile
+        from resources import registry
+        from resources.registry import register, dataset, datasets, clear_cache, read_lines
+
+        self.assertTrue('english' in datasets())
+        self.assertTrue(dataset('highway') is dataset('highway'))
+        with self.assertRaises(KeyError):
+            dataset('no-such-dataset')
+
+        calls = []
+        def loader(n):
+            calls.append(n)
+            return list(range(n))
+        register('test-range', loader)
+        try:
+            for n in range(registry.CACHE_SIZE + 1):
+                self.assertEqual(n, len(dataset('test-range', n)))
+            dataset('test-range', registry.CACHE_SIZE)
+            self.assertEqual(registry.CACHE_SIZE + 1, len(calls))   # still cached
+            dataset('test-range', 0)                                # least recently used evicted
+            self.assertEqual(registry.CACHE_SIZE + 2, len(calls))
+        finally:
+            clear_cache('test-range')
+            del registry._datasets['test-range']
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'small.txt')
+            with open(path, 'w') as file:
+                file.write('ant\nbee\ncat\n')
+
+            old = os.environ.get(registry.OVERRIDE_ENV)
+            os.environ[registry.OVERRIDE_ENV] = 'test-lines={}'.format(path)
+            try:
+                register('test-lines', read_lines, source='words.english.txt')
+                self.assertEqual(['ant', 'bee', 'cat'], dataset('test-lines'))
+            finally:
+                clear_cache('test-lines')
+                del registry._datasets['test-lines']
+                if old is None:
+                    del os.environ[registry.OVERRIDE_ENV]
+                else:
+                    os.environ[registry.OVERRIDE_ENV] = old
+
+    def test_synthetic(self):
+        from collections import Counter
+        from resources.synthetic import zipf_words, near_sorted, adversarial, road_graph
+        from resources.synthetic import materialize, ADVERSARIAL_KINDS
+
+        batches = list(zipf_words(1000, vocabulary_size=50, seed=3, batch_size=300))
+        self.assertEqual([300, 300, 300, 100], [len(b) for b in batches])
+        self.assertEqual(materialize(batches), materialize(zipf_words(1000, 50, seed=3)))
+        counts = Counter(materialize(batches)).most_common()
+        self.assertTrue(counts[0][1] > 5 * counts[-1][1])       # skewed
+
+        values = materialize(near_sorted(10000, seed=2, batch_size=1000))
+        self.assertEqual(list(range(10000)), sorted(values))
+        self.assertTrue(sum(1 for i in range(10000) if values[i] != i) < 500)
+
+        for kind in ADVERSARIAL_KINDS:
+            self.assertEqual(1000, len(materialize(adversarial(1000, kind, batch_size=64))))
+        self.assertEqual(list(range(9, -1, -1)), materialize(adversarial(10, 'descending')))
+        with self.assertRaises(ValueError):
+            list(adversarial(10, 'unknown'))
+
+        lines = list(road_graph(100, seed=5))
+        self.assertEqual(lines, list(road_graph(100, seed=5)))
+        (num_nodes, num_edges) = [int(v) for v in lines[1].split()]
+        self.assertEqual(100, num_nodes)
+        self.assertEqual(2 + num_nodes + num_edges, len(lines))
+        self.assertTrue(99 <= num_edges <= 198)
+
 if __name__ == '__main__':
     unittest.main()